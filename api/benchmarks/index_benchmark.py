@@ -0,0 +1,366 @@
+r"""Benchmark of the indexes serving the expense and friend access patterns.
+
+Seeds a throwaway database with synthetic expenses, then runs the service queries
+with and without the declared secondary indexes on the expense and friend tables,
+reporting the execution time and the scans each query plan uses:
+
+    DB_URL=... FRONTEND_URL= JWT_AUDIENCE= AUTH0_DOMAIN= \\
+        python benchmarks/index_benchmark.py --db-url postgresql+asyncpg://... \\
+        --splits 1000000
+
+The indexes are dropped and recreated, so never point this at a real database.
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import random
+import statistics
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import Table, event, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, create_async_engine
+
+from expenseflow.database.migrations import upgrade
+from expenseflow.enums import (
+    EntityKind,
+    ExpenseCategory,
+    ExpenseStatus,
+    FriendStatus,
+)
+from expenseflow.expense.models import (
+    ExpenseItemModel,
+    ExpenseItemSplitModel,
+    ExpenseModel,
+)
+from expenseflow.expense.money import to_proportion
+from expenseflow.expense.service import (
+    get_all_expenses,
+    get_expense,
+    get_expenses_overview,
+    get_lowest_status,
+)
+from expenseflow.friend.models import FriendModel
+from expenseflow.friend.service import (
+    get_friend_expenses,
+    get_friends,
+    get_received_friend_requests,
+)
+from expenseflow.user.models import UserModel
+
+BENCHMARKED_TABLES: list[Table] = [
+    ExpenseModel.__table__,  # type: ignore[list-item]
+    ExpenseItemModel.__table__,  # type: ignore[list-item]
+    ExpenseItemSplitModel.__table__,  # type: ignore[list-item]
+    FriendModel.__table__,  # type: ignore[list-item]
+]
+BATCH_SIZE = 10000
+
+Query = Callable[[AsyncSession, UserModel], Awaitable[Any]]
+
+
+def batched(rows: Iterator[dict], size: int) -> Iterator[list[dict]]:
+    """Group rows into batches."""
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def seed(  # noqa: C901, PLR0913
+    engine: AsyncEngine,
+    *,
+    splits: int,
+    users: int,
+    items_per_expense: int,
+    splits_per_item: int,
+    friends_per_user: int,
+) -> None:
+    """Seed synthetic users, friendships and expenses."""
+    rng = random.Random(0)  # noqa: S311
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    expenses = splits // (items_per_expense * splits_per_item)
+
+    def user_rows() -> Iterator[dict]:
+        for i, user_id in enumerate(user_ids):
+            yield {
+                "entity_id": user_id,
+                "user_id": user_id,
+                "kind": EntityKind.user,
+                "token_id": f"benchmark|user-{i:06d}",
+                "nickname": f"benchmark-{i:06d}",
+                "first_name": "Bench",
+                "last_name": f"Mark {i}",
+                "budget": 1000,
+            }
+
+    def friend_rows() -> Iterator[dict]:
+        seen: set[frozenset[uuid.UUID]] = set()
+        for sender_id in user_ids:
+            for receiver_id in rng.sample(user_ids, friends_per_user):
+                pair = frozenset((sender_id, receiver_id))
+                if sender_id == receiver_id or pair in seen:
+                    continue
+                seen.add(pair)
+                yield {
+                    "sender_id": sender_id,
+                    "receiver_id": receiver_id,
+                    "status": rng.choice(list(FriendStatus)),
+                }
+
+    expense_ids = [uuid.uuid4() for _ in range(expenses)]
+    uploaders = [rng.choice(user_ids) for _ in range(expenses)]
+    item_ids = [[uuid.uuid4() for _ in range(items_per_expense)] for _ in range(expenses)]
+    prices = [[rng.randint(100, 10000) for _ in ids] for ids in item_ids]
+    split_users = [list({uploader_id, *rng.sample(user_ids, splits_per_item - 1)}) for uploader_id in uploaders]
+    statuses = [
+        [[rng.choice(list(ExpenseStatus)) for _ in members] for _ in ids]
+        for members, ids in zip(split_users, item_ids, strict=True)
+    ]
+
+    now = dt.datetime.now(dt.UTC)
+
+    def expense_rows() -> Iterator[dict]:
+        for i, (expense_id, uploader_id) in enumerate(zip(expense_ids, uploaders, strict=True)):
+            yield {
+                "expense_id": expense_id,
+                "uploader_id": uploader_id,
+                "parent_id": uploader_id,
+                "name": "Benchmark",
+                "description": "",
+                "category": rng.choice(list(ExpenseCategory)),
+                "expense_date": now,
+                "total_cents": sum(prices[i]),
+                "status": get_lowest_status(chain.from_iterable(statuses[i])),
+            }
+
+    def item_rows() -> Iterator[dict]:
+        for i, (expense_id, ids) in enumerate(zip(expense_ids, item_ids, strict=True)):
+            for item_id, price_cents in zip(ids, prices[i], strict=True):
+                yield {
+                    "expense_item_id": item_id,
+                    "expense_id": expense_id,
+                    "name": "Item",
+                    "quantity": 1,
+                    "price_cents": price_cents,
+                }
+
+    def split_rows() -> Iterator[dict]:
+        for i, members in enumerate(split_users):
+            for item_id, item_statuses in zip(item_ids[i], statuses[i], strict=True):
+                for user_id, status in zip(members, item_statuses, strict=True):
+                    yield {
+                        "expense_item_id": item_id,
+                        "user_id": user_id,
+                        "proportion": to_proportion(1 / len(members)),
+                        "status": status,
+                    }
+
+    async with AsyncSession(engine) as session:
+        for model, rows in (
+            (UserModel, user_rows()),
+            (FriendModel, friend_rows()),
+            (ExpenseModel, expense_rows()),
+            (ExpenseItemModel, item_rows()),
+            (ExpenseItemSplitModel, split_rows()),
+        ):
+            started = time.perf_counter()
+            count = 0
+            for batch in batched(rows, BATCH_SIZE):
+                await session.execute(insert(model), batch)
+                count += len(batch)
+            await session.commit()
+            print(f"Seeded {count} rows into '{model.__tablename__}' in {time.perf_counter() - started:.1f}s")
+
+
+async def get_one_expense(session: AsyncSession, user: UserModel) -> Any:  # noqa: ANN401
+    """Get one of the user's uploaded expenses."""
+    expense_id = (
+        await session.execute(select(ExpenseModel.expense_id).where(ExpenseModel.uploader_id == user.user_id).limit(1))
+    ).scalar_one_or_none()
+    if expense_id is None:
+        return None
+    return await get_expense(session, user, expense_id)
+
+
+async def get_one_friends_expenses(session: AsyncSession, user: UserModel) -> Any:  # noqa: ANN401
+    """Get the user's expenses with one of their friends."""
+    friends = await get_friends(session, user)
+    if not friends:
+        return []
+    return await get_friend_expenses(session, user, friends[0])
+
+
+QUERIES: dict[str, Query] = {
+    "get_all_expenses": get_all_expenses,
+    "get_expense": get_one_expense,
+    "get_expenses_overview": get_expenses_overview,
+    "get_friend_expenses": get_one_friends_expenses,
+    "get_received_friend_requests": get_received_friend_requests,
+}
+
+
+@contextmanager
+def capture_statements(engine: AsyncEngine) -> Iterator[list[tuple[str, Any]]]:
+    """Capture the statements executed on an engine."""
+    statements: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(  # noqa: PLR0913
+        conn: Any,  # noqa: ANN401, ARG001
+        cursor: Any,  # noqa: ANN401, ARG001
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: Any,  # noqa: ANN401, ARG001
+        executemany: bool,  # noqa: ARG001, FBT001
+    ) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def scans(plan: dict) -> list[str]:
+    """Get the scans in a query plan."""
+    found = []
+    if "Relation Name" in plan:
+        index = f" using {plan['Index Name']}" if "Index Name" in plan else ""
+        found.append(f"{plan['Node Type']} on {plan['Relation Name']}{index}")
+    for child in plan.get("Plans", []):
+        found.extend(scans(child))
+    return found
+
+
+async def explain(
+    conn: AsyncConnection,
+    statement: str,
+    parameters: Any,  # noqa: ANN401
+) -> tuple[float, list[str]]:
+    """Run a statement, returning its execution time in ms and its scans."""
+    result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters)
+    output = result.scalar_one()[0]
+    return output["Execution Time"], scans(output["Plan"])
+
+
+async def measure(engine: AsyncEngine, users: list[uuid.UUID]) -> dict[str, tuple[float, list[str]]]:
+    """Measure every query's statements for a sample of users."""
+    timings: dict[str, list[float]] = defaultdict(list)
+    plans: dict[str, list[str]] = {}
+
+    for user_id in users:
+        for name, query in QUERIES.items():
+            async with AsyncSession(engine) as session:
+                user = await session.get(UserModel, user_id)
+                assert user is not None  # noqa: S101
+                with capture_statements(engine) as statements:
+                    await query(session, user)
+
+            async with engine.connect() as conn:
+                for i, (statement, parameters) in enumerate(statements):
+                    label = f"{name}[{i}]"
+                    elapsed, plan = await explain(conn, statement, parameters)
+                    timings[label].append(elapsed)
+                    plans.setdefault(label, plan)
+
+    return {label: (statistics.median(times), plans[label]) for label, times in timings.items()}
+
+
+async def drop_indexes(engine: AsyncEngine) -> None:
+    """Drop the benchmarked indexes."""
+    async with engine.begin() as conn:
+        for table in BENCHMARKED_TABLES:
+            for index in table.indexes:
+                await conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+            await conn.execute(text(f"ANALYZE {table.name}"))
+
+
+async def create_indexes(engine: AsyncEngine) -> None:
+    """Create the benchmarked indexes."""
+    async with engine.begin() as conn:
+        for table in BENCHMARKED_TABLES:
+            for index in table.indexes:
+                started = time.perf_counter()
+                await conn.run_sync(index.create)
+                print(f"Created '{index.name}' in {time.perf_counter() - started:.1f}s")
+            await conn.execute(text(f"ANALYZE {table.name}"))
+
+
+def report(
+    before: dict[str, tuple[float, list[str]]],
+    after: dict[str, tuple[float, list[str]]],
+) -> None:
+    """Print a comparison of both runs."""
+    print("| statement | without (ms) | with (ms) | scans with indexes |")
+    print("|---|---|---|---|")
+    for label, (without_ms, without_plan) in before.items():
+        with_ms, with_plan = after[label]
+        print(f"| {label} | {without_ms:.2f} | {with_ms:.2f} | {', '.join(with_plan)} |")
+        if without_plan != with_plan:
+            print(f"|  | | | was: {', '.join(without_plan)} |")
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    engine = create_async_engine(args.db_url)
+    await upgrade(engine)
+
+    async with engine.connect() as conn:
+        existing = (await conn.execute(select(func.count()).select_from(ExpenseItemSplitModel))).scalar_one()
+    if existing == 0:
+        await seed(
+            engine,
+            splits=args.splits,
+            users=args.users,
+            items_per_expense=args.items_per_expense,
+            splits_per_item=args.splits_per_item,
+            friends_per_user=args.friends_per_user,
+        )
+
+    async with engine.connect() as conn:
+        sample = list(
+            (
+                await conn.execute(
+                    select(UserModel.user_id)
+                    .where(UserModel.token_id.startswith("benchmark|"))
+                    .order_by(func.random())
+                    .limit(args.samples)
+                )
+            ).scalars()
+        )
+
+    await drop_indexes(engine)
+    before = await measure(engine, sample)
+    await create_indexes(engine)
+    after = await measure(engine, sample)
+
+    report(before, after)
+    await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Benchmark the access pattern indexes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-url", required=True)
+    parser.add_argument("--splits", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--items-per-expense", type=int, default=2)
+    parser.add_argument("--splits-per-item", type=int, default=4)
+    parser.add_argument("--friends-per-user", type=int, default=20)
+    parser.add_argument("--samples", type=int, default=20)
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
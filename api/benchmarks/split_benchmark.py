@@ -0,0 +1,213 @@
+r"""Benchmark of building the items and splits of a large receipt.
+
+Seeds a throwaway database with the users a receipt is split between, then
+compares resolving the split users per split of every item, as before, with
+resolving them once per expense:
+
+    DB_URL=... FRONTEND_URL= JWT_AUDIENCE= AUTH0_DOMAIN= \\
+        python benchmarks/split_benchmark.py --db-url postgresql+asyncpg://... \\
+        --items 50 --split-users 8
+
+Only the models are built, nothing is inserted.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from expenseflow.database.migrations import upgrade
+from expenseflow.enums import EntityKind, ExpenseStatus
+from expenseflow.errors import ExpenseFlowError, NotFoundError
+from expenseflow.expense.models import ExpenseItemModel, ExpenseItemSplitModel
+from expenseflow.expense.money import PROPORTION_QUANTUM, to_cents, to_proportion
+from expenseflow.expense.schemas import ExpenseItemCreate, ExpenseItemSplitCreate
+from expenseflow.expense.service import create_expense_items
+from expenseflow.user.models import UserModel
+
+SEEDED_USER = "benchmark|split"
+
+CreateItems = Callable[
+    [AsyncSession, UserModel, list[ExpenseItemCreate], list[ExpenseItemSplitCreate]],
+    Awaitable[list[ExpenseItemModel]],
+]
+
+
+async def previous_create_splits(
+    session: AsyncSession,
+    splits_in: list[ExpenseItemSplitCreate],
+    creator: UserModel,
+) -> list[ExpenseItemSplitModel]:
+    """create_splits before split users were resolved once per expense."""
+    user_ids = [split.user_id for split in splits_in]
+    if len(user_ids) != len(set(user_ids)):
+        msg = "A user_id is duplicated in splits"
+        raise ExpenseFlowError(msg)
+
+    proportions = [to_proportion(split.proportion) for split in splits_in]
+    proportion_sum = sum(proportions, Decimal(0))
+    if abs(proportion_sum - 1) > PROPORTION_QUANTUM * len(proportions) / 2:
+        msg = f"Splits do not add up to 1, instead '{proportion_sum}'."
+        raise ExpenseFlowError(msg)
+    proportions[-1] += 1 - proportion_sum
+
+    splits = []
+    for split_create, proportion in zip(splits_in, proportions, strict=True):
+        split_user = await session.get(UserModel, split_create.user_id)
+        if split_user is None:
+            raise NotFoundError(split_create.user_id, "user")
+        splits.append(
+            ExpenseItemSplitModel(
+                user=split_user,
+                proportion=proportion,
+                status=(ExpenseStatus.paid if split_user.user_id == creator.user_id else ExpenseStatus.requested),
+            )
+        )
+    return splits
+
+
+async def previous_create_expense_items(
+    session: AsyncSession,
+    creator: UserModel,
+    expense_items_in: list[ExpenseItemCreate],
+    splits_in: list[ExpenseItemSplitCreate],
+) -> list[ExpenseItemModel]:
+    """create_expense_items before split users were resolved once per expense."""
+    return [
+        ExpenseItemModel(
+            name=item_in.name,
+            quantity=item_in.quantity,
+            price_cents=to_cents(item_in.price),
+            splits=(await previous_create_splits(session, splits_in, creator)),
+        )
+        for item_in in expense_items_in
+    ]
+
+
+async def seed(engine: AsyncEngine, *, users: int) -> None:
+    """Seed the users a receipt is split between, if they aren't already."""
+    async with AsyncSession(engine) as session:
+        existing = set(
+            (
+                await session.execute(select(UserModel.token_id).where(UserModel.token_id.startswith(SEEDED_USER)))
+            ).scalars()
+        )
+        rows = []
+        for i in range(users):
+            token_id = f"{SEEDED_USER}-{i:04d}"
+            if token_id in existing:
+                continue
+            user_id = uuid.uuid4()
+            rows.append(
+                {
+                    "entity_id": user_id,
+                    "user_id": user_id,
+                    "kind": EntityKind.user,
+                    "token_id": token_id,
+                    "nickname": token_id.replace("|", "-"),
+                    "first_name": "Bench",
+                    "last_name": f"Mark {i}",
+                    "budget": 1000,
+                }
+            )
+        if rows:
+            await session.execute(insert(UserModel), rows)
+            await session.commit()
+
+
+async def measure(
+    engine: AsyncEngine,
+    create_items: CreateItems,
+    items_in: list[ExpenseItemCreate],
+    *,
+    split_users: int,
+    repeats: int,
+) -> tuple[float, int]:
+    """Get the median latency in ms and the statements of building the items."""
+    timings = []
+    statements = 0
+
+    def count_statement(*_: object) -> None:
+        nonlocal statements
+        statements += 1
+
+    for _ in range(repeats):
+        # A new session per run, so no split user is already loaded
+        async with AsyncSession(engine) as session:
+            users = list(
+                (
+                    await session.execute(
+                        select(UserModel)
+                        .where(UserModel.token_id.startswith(SEEDED_USER))
+                        .order_by(UserModel.token_id)
+                        .limit(split_users)
+                    )
+                ).scalars()
+            )
+            creator = users[0]
+            splits_in = [ExpenseItemSplitCreate(user_id=user.user_id, proportion=1 / len(users)) for user in users]
+            # Only the creator is loaded, as in a request
+            session.expunge_all()
+            session.add(creator)
+
+            statements = 0
+            event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+            started = time.perf_counter()
+            await create_items(session, creator, items_in, splits_in)
+            timings.append((time.perf_counter() - started) * 1000)
+            event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    return statistics.median(timings), statements
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    engine = create_async_engine(args.db_url)
+    await upgrade(engine)
+
+    await seed(engine, users=args.split_users)
+
+    items_in = [ExpenseItemCreate(name=f"Item {i}", quantity=1, price=9.99) for i in range(args.items)]
+    results = {
+        name: await measure(
+            engine,
+            create_items,
+            items_in,
+            split_users=args.split_users,
+            repeats=args.repeats,
+        )
+        for name, create_items in (
+            ("per split of every item", previous_create_expense_items),
+            ("once per expense", create_expense_items),
+        )
+    }
+
+    print(
+        f"Building {args.items} items split between {args.split_users} users\n"
+        "| split users resolved | median latency (ms) | statements |\n"
+        "|---|---|---|"
+    )
+    for name, (latency, statements) in results.items():
+        print(f"| {name} | {latency:.1f} | {statements} |")
+
+    await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Benchmark building the items and splits of a large receipt."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-url", required=True)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--split-users", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=5)
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
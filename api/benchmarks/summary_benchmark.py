@@ -0,0 +1,195 @@
+r"""Benchmark of the expense summary listing against the full listing.
+
+Seeds a throwaway database with a user involved in many expenses, then compares
+the latency and JSON payload size of listing them with and without their items:
+
+    DB_URL=... FRONTEND_URL= JWT_AUDIENCE= AUTH0_DOMAIN= \\
+        python benchmarks/summary_benchmark.py --db-url postgresql+asyncpg://... \\
+        --expenses 10000
+
+Each listing is timed as the routes run it, querying and serialising to JSON.
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from expenseflow.database.migrations import upgrade
+from expenseflow.enums import EntityKind, ExpenseCategory, ExpenseStatus
+from expenseflow.expense.models import (
+    ExpenseItemModel,
+    ExpenseItemSplitModel,
+    ExpenseModel,
+)
+from expenseflow.expense.schemas import ExpenseRead, ExpenseSummaryRead
+from expenseflow.expense.service import (
+    get_all_expenses,
+    get_expense_summaries,
+    get_lowest_status,
+    involves,
+)
+from expenseflow.user.models import UserModel
+
+BATCH_SIZE = 10000
+SEEDED_USER = "benchmark|summary"
+
+Listing = Callable[[AsyncSession, UserModel], Awaitable[bytes]]
+
+
+async def seed(engine: AsyncEngine, *, expenses: int, items_per_expense: int) -> None:
+    """Seed a user sharing every expense with a friend."""
+    rng = random.Random(0)  # noqa: S311
+    user_id, friend_id = uuid.uuid4(), uuid.uuid4()
+    now = dt.datetime.now(dt.UTC)
+
+    users = [
+        {
+            "entity_id": entity_id,
+            "user_id": entity_id,
+            "kind": EntityKind.user,
+            "token_id": token_id,
+            "nickname": token_id.replace("|", "-"),
+            "first_name": "Bench",
+            "last_name": "Mark",
+            "budget": 1000,
+        }
+        for entity_id, token_id in (
+            (user_id, SEEDED_USER),
+            (friend_id, f"{SEEDED_USER}-friend"),
+        )
+    ]
+
+    expense_rows: list[dict] = []
+    item_rows: list[dict] = []
+    split_rows: list[dict] = []
+    for _ in range(expenses):
+        expense_id = uuid.uuid4()
+        prices = [rng.randint(100, 10000) for _ in range(items_per_expense)]
+        statuses = []
+        for price_cents in prices:
+            item_id = uuid.uuid4()
+            item_rows.append(
+                {
+                    "expense_item_id": item_id,
+                    "expense_id": expense_id,
+                    "name": "Item",
+                    "quantity": 1,
+                    "price_cents": price_cents,
+                }
+            )
+            for split_user_id, status in (
+                (user_id, ExpenseStatus.paid),
+                (friend_id, rng.choice(list(ExpenseStatus))),
+            ):
+                statuses.append(status)
+                split_rows.append(
+                    {
+                        "expense_item_id": item_id,
+                        "user_id": split_user_id,
+                        "proportion": Decimal("0.5"),
+                        "status": status,
+                    }
+                )
+        expense_rows.append(
+            {
+                "expense_id": expense_id,
+                "uploader_id": user_id,
+                "parent_id": user_id,
+                "name": f"Benchmark expense {len(expense_rows)}",
+                "description": "Seeded by the summary benchmark",
+                "category": rng.choice(list(ExpenseCategory)),
+                "expense_date": now,
+                "total_cents": sum(prices),
+                "status": get_lowest_status(statuses),
+            }
+        )
+
+    async with AsyncSession(engine) as session:
+        for model, rows in (
+            (UserModel, users),
+            (ExpenseModel, expense_rows),
+            (ExpenseItemModel, item_rows),
+            (ExpenseItemSplitModel, split_rows),
+        ):
+            for start in range(0, len(rows), BATCH_SIZE):
+                await session.execute(insert(model), rows[start : start + BATCH_SIZE])
+        await session.commit()
+    print(f"Seeded {len(expense_rows)} expenses, {len(item_rows)} items and {len(split_rows)} splits")
+
+
+async def full_listing(session: AsyncSession, user: UserModel) -> bytes:
+    """GET /expenses/all."""
+    adapter = TypeAdapter(list[ExpenseRead])
+    return adapter.dump_json(adapter.validate_python(await get_all_expenses(session, user)))
+
+
+async def summary_listing(session: AsyncSession, user: UserModel) -> bytes:
+    """GET /expenses/all/summary."""
+    adapter = TypeAdapter(list[ExpenseSummaryRead])
+    return adapter.dump_json(await get_expense_summaries(session, involves(user)))
+
+
+async def measure(engine: AsyncEngine, listing: Listing, repeats: int) -> tuple[float, int]:
+    """Get the median latency in ms and the payload size in bytes of a listing."""
+    timings = []
+    payload = b""
+    for _ in range(repeats):
+        # A new session per run, so nothing is already loaded
+        async with AsyncSession(engine) as session:
+            user = (await session.execute(select(UserModel).where(UserModel.token_id == SEEDED_USER))).scalar_one()
+            started = time.perf_counter()
+            payload = await listing(session, user)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(timings), len(payload)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    engine = create_async_engine(args.db_url)
+    await upgrade(engine)
+
+    async with engine.connect() as conn:
+        existing = await conn.scalar(select(UserModel.user_id).where(UserModel.token_id == SEEDED_USER))
+    if existing is None:
+        await seed(engine, expenses=args.expenses, items_per_expense=args.items_per_expense)
+
+    results = {
+        name: await measure(engine, listing, args.repeats)
+        for name, listing in (
+            ("/expenses/all", full_listing),
+            ("/expenses/all/summary", summary_listing),
+        )
+    }
+
+    full_size = results["/expenses/all"][1]
+    print("| listing | median latency (ms) | payload |")
+    print("|---|---|---|")
+    for name, (latency, size) in results.items():
+        print(f"| {name} | {latency:.1f} | {size / 1024:.0f} KiB ({size / full_size:.0%}) |")
+
+    await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Benchmark the expense summary listing."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-url", required=True)
+    parser.add_argument("--expenses", type=int, default=10_000)
+    parser.add_argument("--items-per-expense", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=5)
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+r"""Benchmark of creating expenses with many items.
+
+Seeds a throwaway database with the users a receipt is split between, then
+compares creating expenses through the unit of work, as before, with the bulk
+insert of their items and splits, at several receipt sizes:
+
+    DB_URL=... FRONTEND_URL= JWT_AUDIENCE= AUTH0_DOMAIN= \\
+        python benchmarks/write_benchmark.py --db-url postgresql+asyncpg://... \\
+        --items 10 100 1000
+
+Every expense is created in a transaction that is rolled back.
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from expenseflow.database.migrations import upgrade
+from expenseflow.entity.models import EntityModel
+from expenseflow.enums import EntityKind, ExpenseCategory
+from expenseflow.expense.models import ExpenseModel
+from expenseflow.expense.schemas import (
+    ExpenseCreate,
+    ExpenseItemCreate,
+    ExpenseItemSplitCreate,
+)
+from expenseflow.expense.service import (
+    create_expense,
+    create_expense_items,
+    get_items_total_cents,
+    get_lowest_status,
+)
+from expenseflow.user.models import UserModel
+
+SEEDED_USER = "benchmark|write"
+
+CreateExpense = Callable[[AsyncSession, UserModel, ExpenseCreate, EntityModel], Awaitable[ExpenseModel]]
+
+
+async def previous_create_expense(
+    session: AsyncSession,
+    creator: UserModel,
+    expense_in: ExpenseCreate,
+    parent: EntityModel,
+) -> ExpenseModel:
+    """create_expense before items and splits were inserted in bulk."""
+    items = await create_expense_items(session, creator, expense_in.items, expense_in.splits)
+    new_expense = ExpenseModel(
+        name=expense_in.name,
+        description=expense_in.description,
+        category=expense_in.category,
+        uploader=creator,
+        expense_date=expense_in.expense_date,
+        total_cents=get_items_total_cents(items),
+        status=get_lowest_status(split.status for item in items for split in item.splits),
+        parent=parent,
+        items=items,
+    )
+
+    session.add(new_expense)
+    await session.flush()
+    return new_expense
+
+
+async def seed(engine: AsyncEngine, *, users: int) -> None:
+    """Seed the users a receipt is split between, if they aren't already."""
+    async with AsyncSession(engine) as session:
+        existing = set(
+            (
+                await session.execute(select(UserModel.token_id).where(UserModel.token_id.startswith(SEEDED_USER)))
+            ).scalars()
+        )
+        rows = []
+        for i in range(users):
+            token_id = f"{SEEDED_USER}-{i:04d}"
+            if token_id in existing:
+                continue
+            user_id = uuid.uuid4()
+            rows.append(
+                {
+                    "entity_id": user_id,
+                    "user_id": user_id,
+                    "kind": EntityKind.user,
+                    "token_id": token_id,
+                    "nickname": token_id.replace("|", "-"),
+                    "first_name": "Bench",
+                    "last_name": f"Mark {i}",
+                    "budget": 1000,
+                }
+            )
+        if rows:
+            await session.execute(insert(UserModel), rows)
+            await session.commit()
+
+
+async def measure(
+    engine: AsyncEngine,
+    create: CreateExpense,
+    *,
+    items: int,
+    split_users: int,
+    repeats: int,
+) -> float:
+    """Get the median latency in ms of creating an expense."""
+    timings = []
+    for _ in range(repeats):
+        async with AsyncSession(engine) as session:
+            users = list(
+                (
+                    await session.execute(
+                        select(UserModel)
+                        .where(UserModel.token_id.startswith(SEEDED_USER))
+                        .order_by(UserModel.token_id)
+                        .limit(split_users)
+                    )
+                ).scalars()
+            )
+            creator = users[0]
+            expense_in = ExpenseCreate(
+                name="Benchmark receipt",
+                description="Created by the write benchmark",
+                category=ExpenseCategory.groceries,
+                expense_date=dt.datetime.now(dt.UTC),
+                items=[ExpenseItemCreate(name=f"Item {i}", quantity=1, price=9.99) for i in range(items)],
+                splits=[ExpenseItemSplitCreate(user_id=user.user_id, proportion=1 / len(users)) for user in users],
+            )
+
+            started = time.perf_counter()
+            await create(session, creator, expense_in, creator)
+            timings.append((time.perf_counter() - started) * 1000)
+            await session.rollback()
+
+    return statistics.median(timings)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    engine = create_async_engine(args.db_url)
+    await upgrade(engine)
+    await seed(engine, users=args.split_users)
+
+    print(
+        f"Creating an expense split between {args.split_users} users\n"
+        "| items | splits | unit of work (ms) | bulk insert (ms) | speedup |\n"
+        "|---|---|---|---|---|"
+    )
+    for items in args.items:
+        before, after = [
+            await measure(
+                engine,
+                create,
+                items=items,
+                split_users=args.split_users,
+                repeats=args.repeats,
+            )
+            for create in (previous_create_expense, create_expense)
+        ]
+        print(f"| {items} | {items * args.split_users} | {before:.1f} | {after:.1f} | {before / after:.1f}x |")
+
+    await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Benchmark creating expenses with many items."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-url", required=True)
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--split-users", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=5)
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 """Audit models."""
 
+import datetime as dt
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, ForeignKey
+from sqlalchemy import JSON, ForeignKey, Index
+from sqlalchemy import DateTime as SQLDatetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
 
 from expenseflow.database.base import BaseDBModel
 from expenseflow.database.mixins import TimestampMixin
@@ -11,11 +14,27 @@ from expenseflow.user.models import UserModel
 
 
 class AuditModel(BaseDBModel, TimestampMixin):
-    """Audit DB Model."""
+    """Audit DB Model.
+
+    The table is partitioned by month on 'created_at', see
+    expenseflow.audit.partitions.
+    """
 
     __tablename__ = "audit"
+    __table_args__ = (
+        # Pages of a user's audit log are range scans over this index
+        Index("ix_audit_user_id_created_at", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     audit_id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    # The partition key has to be part of the primary key
+    created_at: Mapped[dt.datetime] = mapped_column(
+        SQLDatetime(timezone=True),
+        primary_key=True,
+        default=lambda: dt.datetime.now(dt.UTC),
+        server_default=func.now(),
+    )
 
     user_id: Mapped[UUID] = mapped_column(
         ForeignKey("user.user_id", ondelete="CASCADE")
@@ -25,4 +44,4 @@ class AuditModel(BaseDBModel, TimestampMixin):
     endpoint: Mapped[str]
     request_body: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
-    user: Mapped[UserModel] = relationship(lazy="joined")
+    user: Mapped[UserModel] = relationship(lazy="select")
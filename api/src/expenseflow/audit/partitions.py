@@ -0,0 +1,137 @@
+"""Audit table partitions.
+
+The audit table is range partitioned by month on 'created_at'. Each month has
+its own partition named 'audit_yYYYYmMM', and rows outside of every month
+partition land in 'audit_default' so inserts never fail.
+"""
+
+import datetime as dt
+import re
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+AUDIT_TABLE = "audit"
+DEFAULT_PARTITION = "audit_default"
+
+_partition_name_pattern = re.compile(r"^audit_y(\d{4})m(\d{2})$")
+
+
+def month_start(value: dt.date) -> dt.date:
+    """Get the first day of the month a date falls in."""
+    return dt.date(value.year, value.month, 1)
+
+
+def add_months(month: dt.date, months: int) -> dt.date:
+    """Move the first day of a month by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return dt.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: dt.date) -> str:
+    """Get the name of the partition for a month."""
+    return f"{AUDIT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> dt.date | None:
+    """Get the month a partition holds, None if it isn't a month partition."""
+    match = _partition_name_pattern.match(name)
+    if match is None:
+        return None
+    return dt.date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def _bound(month: dt.date) -> str:
+    return dt.datetime.combine(month, dt.time(), tzinfo=dt.UTC).isoformat()
+
+
+async def is_partitioned(conn: AsyncConnection) -> bool:
+    """Whether the audit table is a partitioned table."""
+    relkind = await conn.scalar(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": AUDIT_TABLE},
+    )
+    return relkind == "p"
+
+
+async def get_partitions(conn: AsyncConnection) -> list[str]:
+    """Get the names of the partitions attached to the audit table."""
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table) "
+            "ORDER BY child.relname"
+        ),
+        {"table": AUDIT_TABLE},
+    )
+    return list(result.scalars().all())
+
+
+async def _create_partition(conn: AsyncConnection, month: dt.date, *, has_default: bool) -> None:
+    """Create the partition for a month.
+
+    Postgres refuses to create a partition for rows the default partition holds,
+    which it does for a month once partitions stop being created ahead of time.
+    Those rows are moved into the new partition before it's attached.
+    """
+    preparer = conn.dialect.identifier_preparer
+    name = preparer.quote(partition_name(month))
+    table = preparer.quote(AUDIT_TABLE)
+    default = preparer.quote(DEFAULT_PARTITION)
+    start, end = _bound(month), _bound(add_months(month, 1))
+    in_month = f"created_at >= '{start}' AND created_at < '{end}'"
+
+    if has_default:
+        # Creating a partition locks the default one anyway, it's taken first so
+        # no rows for the month arrive while they're being moved
+        await conn.execute(text(f"LOCK TABLE {default} IN ACCESS EXCLUSIVE MODE"))
+    if not has_default or not await conn.scalar(
+        text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_month})")  # noqa: S608
+    ):
+        await conn.execute(
+            text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} FOR VALUES FROM ('{start}') TO ('{end}')")
+        )
+        return
+
+    await conn.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+    moved = await conn.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {default} WHERE {in_month} RETURNING *) "  # noqa: S608
+            f"INSERT INTO {name} SELECT * FROM moved"
+        )
+    )
+    await conn.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"))
+    logger.warning(f"Moved {moved.rowcount} audit records from the default partition into {name}.")
+
+
+async def ensure_partitions(conn: AsyncConnection, months_ahead: int, now: dt.datetime | None = None) -> list[str]:
+    """Create the default partition and month partitions up to months ahead."""
+    now = now or dt.datetime.now(dt.UTC)
+    existing = set(await get_partitions(conn))
+    created = []
+
+    current = month_start(now.astimezone(dt.UTC).date())
+    for offset in range(max(months_ahead, 0) + 1):
+        month = add_months(current, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+
+        await _create_partition(conn, month, has_default=DEFAULT_PARTITION in existing)
+        created.append(name)
+
+    if DEFAULT_PARTITION not in existing:
+        preparer = conn.dialect.identifier_preparer
+        await conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {preparer.quote(DEFAULT_PARTITION)} "
+                f"PARTITION OF {preparer.quote(AUDIT_TABLE)} DEFAULT"
+            )
+        )
+        created.append(DEFAULT_PARTITION)
+
+    if created:
+        logger.info(f"Created audit partitions: {', '.join(created)}")
+    return created
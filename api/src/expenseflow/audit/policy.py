@@ -0,0 +1,153 @@
+"""Audit policy."""
+
+import json
+import random
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Self
+
+import yaml
+from loguru import logger
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from starlette.requests import Request
+
+from expenseflow.config import CONFIG
+
+REDACTED = "[REDACTED]"
+
+
+class AuditPolicyError(Exception):
+    """Error loading an audit policy."""
+
+
+class AuditRule(BaseModel):
+    """Rule deciding how matching requests are audited."""
+
+    # Empty means any method
+    methods: list[str] = Field(default_factory=list)
+    # Glob matched against the whole path, '*' also matches '/'
+    path: str = "*"
+    audit: bool = True
+    # Falls back to the policy's rate when unset
+    sample_rate: float | None = Field(default=None, ge=0, le=1)
+
+    @field_validator("methods")
+    @classmethod
+    def _upper_methods(cls, methods: list[str]) -> list[str]:
+        return [m.upper() for m in methods]
+
+    def matches(self, method: str, path: str) -> bool:
+        """Whether the rule applies to a request."""
+        if self.methods and method.upper() not in self.methods:
+            return False
+        return fnmatchcase(path, self.path)
+
+
+class AuditPolicy(BaseModel):
+    """Declarative policy for which requests are audited and what is stored.
+
+    Only requests to routes that opt in to auditing, which are the writes, are
+    checked. Rules are evaluated in order and the first one matching a request
+    decides whether, and at what rate, it is audited. Requests matching no rule
+    are sampled at the write rate.
+    """
+
+    rules: list[AuditRule] = Field(default_factory=list)
+    write_sample_rate: float = Field(default=1.0, ge=0, le=1)
+    # Largest request body in bytes that is stored in full, None for any size
+    max_body_size: int | None = Field(default=16384, ge=0)
+    # Keys are matched case-insensitively at any depth of the body
+    redact_fields: list[str] = Field(default_factory=list)
+
+    def should_audit(self, method: str, path: str) -> bool:
+        """Decide whether a request is audited."""
+        sample_rate = self.write_sample_rate
+
+        for rule in self.rules:
+            if rule.matches(method, path):
+                if not rule.audit:
+                    return False
+                if rule.sample_rate is not None:
+                    sample_rate = rule.sample_rate
+                break
+
+        if sample_rate >= 1:
+            return True
+        return random.random() < sample_rate  # noqa: S311
+
+    async def capture_body(self, request: Request) -> dict | None:
+        """Get the body of a request to audit.
+
+        JSON bodies are taken from the bytes the framework has already buffered
+        for the handler, other content types like multipart uploads are only
+        described and never read.
+        """
+        content_type = request.headers.get("content-type")
+        if content_type is None:
+            return None
+
+        media_type = content_type.partition(";")[0].strip().lower()
+        if media_type != "application/json" and not media_type.endswith("+json"):
+            return {
+                "_content_type": media_type,
+                "_content_length": request.headers.get("content-length"),
+            }
+
+        return self.prepare_body(await request.body())
+
+    def prepare_body(self, raw: bytes) -> dict | None:
+        """Truncate and redact a raw JSON request body for storage.
+
+        Bodies over the maximum size are never parsed. Their preview is only kept
+        when no fields need redacting, as the raw text can't be redacted.
+        """
+        if not raw:
+            return None
+
+        if self.max_body_size is not None and len(raw) > self.max_body_size:
+            truncated: dict[str, Any] = {"_truncated": True, "_original_size": len(raw)}
+            if not self.redact_fields:
+                preview = raw[: self.max_body_size].decode(errors="ignore")
+                truncated["_preview"] = preview
+            return truncated
+
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            return {"_invalid_json": True, "_original_size": len(raw)}
+
+        if not isinstance(body, dict):
+            body = {"body": body}
+
+        if self.redact_fields:
+            body = _redact(body, {f.lower() for f in self.redact_fields})
+        return body
+
+    @classmethod
+    def load(cls, policy_path: str) -> Self:
+        """Load policy from a yaml file, using the defaults if it doesn't exist."""
+        file_path = Path(policy_path)
+        if not file_path.exists():
+            logger.warning(f"Audit policy '{policy_path}' not found, auditing every request.")
+            return cls()
+
+        try:
+            with file_path.open("r") as f:
+                config = yaml.safe_load(f)
+            return cls.model_validate(config or {})
+        except (OSError, yaml.YAMLError, ValidationError) as e:
+            logger.error(f"Failed to load audit policy: {e}")
+            msg = f"Failed to load audit policy from '{policy_path}'"
+            raise AuditPolicyError(msg) from e
+
+
+def _redact(value: Any, fields: set[str]) -> Any:  # noqa: ANN401
+    """Replace values under the given keys."""
+    if isinstance(value, dict):
+        return {k: REDACTED if str(k).lower() in fields else _redact(v, fields) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_redact(v, fields) for v in value]
+    return value
+
+
+audit_policy = AuditPolicy.load(CONFIG.audit_policy_path)
@@ -0,0 +1,152 @@
+"""Audit retention job.
+
+Month partitions that have fallen out of the retention window are exported to
+gzipped newline-delimited JSON and then detached from the audit table and
+dropped. Run it periodically, e.g. from cron:
+
+    python -m expenseflow.audit.retention --retention-months 12
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import gzip
+from pathlib import Path
+from typing import TextIO
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from expenseflow.audit.partitions import (
+    AUDIT_TABLE,
+    add_months,
+    ensure_partitions,
+    get_partitions,
+    is_partitioned,
+    month_start,
+    partition_month,
+)
+from expenseflow.config import CONFIG
+
+ARCHIVE_BATCH_SIZE = 1000
+
+
+async def get_expired_partitions(
+    conn: AsyncConnection, retention_months: int, now: dt.datetime | None = None
+) -> list[str]:
+    """Get month partitions holding only rows older than the retention window."""
+    now = now or dt.datetime.now(dt.UTC)
+    cutoff = add_months(month_start(now.astimezone(dt.UTC).date()), -retention_months)
+
+    expired = []
+    for name in await get_partitions(conn):
+        month = partition_month(name)
+        if month is not None and add_months(month, 1) <= cutoff:
+            expired.append(name)
+    return expired
+
+
+def _open_archive(path: Path) -> TextIO:
+    return gzip.open(path, "wt", encoding="utf-8")
+
+
+async def archive_partition(conn: AsyncConnection, name: str, archive_dir: Path) -> Path:
+    """Export a partition to '<archive_dir>/<name>.ndjson.gz'.
+
+    Rows are read a batch at a time, and the file is written from a thread so
+    compressing a large partition doesn't block the event loop.
+    """
+    await asyncio.to_thread(archive_dir.mkdir, parents=True, exist_ok=True)
+    path = archive_dir / f"{name}.ndjson.gz"
+    partial_path = archive_dir / f"{name}.ndjson.gz.partial"
+
+    table = conn.dialect.identifier_preparer.quote(name)
+    result = await conn.stream(
+        text(
+            f"SELECT row_to_json({table})::text FROM {table} "  # noqa: S608
+            "ORDER BY created_at, audit_id"
+        ).execution_options(yield_per=ARCHIVE_BATCH_SIZE)
+    )
+
+    rows = 0
+    f = await asyncio.to_thread(_open_archive, partial_path)
+    try:
+        async for lines in result.scalars().partitions():
+            await asyncio.to_thread(f.writelines, [f"{line}\n" for line in lines])
+            rows += len(lines)
+    finally:
+        await asyncio.to_thread(f.close)
+
+    # Only complete exports get the final name
+    await asyncio.to_thread(partial_path.replace, path)
+    logger.info(f"Archived {rows} audit records from '{name}' to '{path}'.")
+    return path
+
+
+async def apply_retention(
+    engine: AsyncEngine,
+    retention_months: int,
+    archive_dir: Path | None,
+    *,
+    drop: bool = True,
+    now: dt.datetime | None = None,
+) -> list[str]:
+    """Archive, detach and drop expired audit partitions.
+
+    Each partition is handled in its own transaction, so a failed export leaves
+    that partition attached and it's retried on the next run.
+    """
+    async with engine.connect() as conn:
+        if not await is_partitioned(conn):
+            logger.warning("The audit table isn't partitioned, skipping retention.")
+            return []
+        expired = await get_expired_partitions(conn, retention_months, now)
+
+    preparer = engine.dialect.identifier_preparer
+    for name in expired:
+        async with engine.begin() as conn:
+            if archive_dir is not None:
+                await archive_partition(conn, name, archive_dir)
+
+            await conn.execute(
+                text(f"ALTER TABLE {preparer.quote(AUDIT_TABLE)} DETACH PARTITION {preparer.quote(name)}")
+            )
+            if drop:
+                await conn.execute(text(f"DROP TABLE {preparer.quote(name)}"))
+
+        logger.info(f"{'Dropped' if drop else 'Detached'} audit partition '{name}'.")
+
+    return expired
+
+
+async def main(argv: list[str] | None = None) -> None:
+    """Run the retention job."""
+    from expenseflow.database.core import db_engine
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--retention-months", type=int, default=CONFIG.audit_retention_months)
+    parser.add_argument("--archive-dir", type=Path, default=CONFIG.audit_archive_dir)
+    parser.add_argument("--no-archive", action="store_true", help="Don't export partitions first.")
+    parser.add_argument(
+        "--detach-only",
+        action="store_true",
+        help="Detach expired partitions but keep their tables.",
+    )
+    args = parser.parse_args(argv)
+
+    async with db_engine.begin() as conn:
+        if await is_partitioned(conn):
+            await ensure_partitions(conn, CONFIG.audit_partition_months_ahead)
+
+    await apply_retention(
+        db_engine,
+        args.retention_months,
+        None if args.no_archive else args.archive_dir,
+        drop=not args.detach_only,
+    )
+    await db_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
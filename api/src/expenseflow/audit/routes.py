@@ -1,17 +1,46 @@
 """Audit routes."""
 
-from fastapi import APIRouter
+import datetime as dt
+
+from fastapi import APIRouter, Response
 
 from expenseflow.audit.models import AuditModel
 from expenseflow.audit.schemas import AuditRead
 from expenseflow.audit.service import get_audits
 from expenseflow.auth.deps import CurrentUser
-from expenseflow.database.deps import DbSession
+from expenseflow.database.deps import DbReadSession
+from expenseflow.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Cursor,
+    PageLimit,
+    fetch_limit,
+    paginate,
+)
 
 r = router = APIRouter()
 
 
 @r.get("", response_model=list[AuditRead])
-async def get(db: DbSession, user: CurrentUser) -> list[AuditModel]:
-    """Get audit logs for a user."""
-    return await get_audits(db, user)
+async def get(  # noqa: PLR0913
+    db: DbReadSession,
+    user: CurrentUser,
+    response: Response,
+    cursor: Cursor,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    method: str | None = None,
+    endpoint_prefix: str | None = None,
+    since: dt.datetime | None = None,
+    until: dt.datetime | None = None,
+) -> list[AuditModel]:
+    """Get a page of audit logs for a user, newest first."""
+    audits = await get_audits(
+        db,
+        user,
+        limit=fetch_limit(limit),
+        cursor=cursor,
+        method=method,
+        endpoint_prefix=endpoint_prefix,
+        since=since,
+        until=until,
+    )
+    return paginate(response, audits, limit, key=lambda a: (a.created_at, a.audit_id))
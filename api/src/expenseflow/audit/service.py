@@ -1,10 +1,13 @@
 """Audit service."""
 
-from sqlalchemy import select
+import datetime as dt
+
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from expenseflow.audit.models import AuditModel
 from expenseflow.audit.schemas import AuditCreate
+from expenseflow.pagination import CursorKey
 from expenseflow.user.models import UserModel
 
 
@@ -20,17 +23,42 @@ async def create_audit(
     )
 
     session.add(audit_model)
-    await session.commit()
+    await session.flush()
     return audit_model
 
 
-async def get_audits(
+async def get_audits(  # noqa: PLR0913
     session: AsyncSession,
     user: UserModel,
+    *,
+    limit: int | None = None,
+    cursor: CursorKey | None = None,
+    method: str | None = None,
+    endpoint_prefix: str | None = None,
+    since: dt.datetime | None = None,
+    until: dt.datetime | None = None,
 ) -> list[AuditModel]:
-    """Get audit logs for a user."""
-    result = await session.execute(
-        select(AuditModel).where(AuditModel.user_id == user.user_id)
+    """Get audit logs for a user, newest first."""
+    stmt = (
+        select(AuditModel)
+        .where(AuditModel.user_id == user.user_id)
+        .order_by(AuditModel.created_at.desc(), AuditModel.audit_id.desc())
     )
 
-    return list(result.scalars().unique().all())
+    if cursor is not None:
+        stmt = stmt.where(tuple_(AuditModel.created_at, AuditModel.audit_id) < cursor)
+    if method is not None:
+        stmt = stmt.where(AuditModel.method == method.upper())
+    if endpoint_prefix is not None:
+        stmt = stmt.where(
+            AuditModel.endpoint.startswith(endpoint_prefix, autoescape=True)
+        )
+    if since is not None:
+        stmt = stmt.where(AuditModel.created_at >= since)
+    if until is not None:
+        stmt = stmt.where(AuditModel.created_at < until)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
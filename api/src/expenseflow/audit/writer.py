@@ -0,0 +1,172 @@
+"""Batched audit writer."""
+
+import asyncio
+import contextlib
+import datetime as dt
+from typing import Any
+from uuid import uuid4
+
+from loguru import logger
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from expenseflow.audit.models import AuditModel
+from expenseflow.audit.schemas import AuditCreate
+from expenseflow.config import CONFIG
+from expenseflow.database.core import session_factory
+from expenseflow.user.models import UserModel
+
+
+class AuditWriter:
+    """Writes audit records in the background.
+
+    Records are put on a bounded queue and flushed with multi-row inserts once a
+    batch fills up or the flush interval passes. When the queue is full callers
+    wait for space, so a slow database pushes back instead of growing memory.
+    """
+
+    _session_factory: async_sessionmaker[AsyncSession]
+    _batch_size: int
+    _flush_interval: float
+
+    _queue: asyncio.Queue[dict[str, Any] | None]
+    _task: asyncio.Task | None
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Create audit writer."""
+        self._session_factory = session_factory
+        self._batch_size = max(batch_size, 1)
+        self._flush_interval = flush_interval
+
+        self._queue = asyncio.Queue(maxsize=max_queue_size)
+        self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether records are being written in the background."""
+        return self._task is not None and not self._task.done()
+
+    async def write(self, audited_user: UserModel, audit_in: AuditCreate) -> None:
+        """Queue an audit record to be written."""
+        now = dt.datetime.now(dt.UTC)
+        record = {
+            "audit_id": uuid4(),
+            "user_id": audited_user.user_id,
+            "method": audit_in.method,
+            "endpoint": audit_in.endpoint,
+            "request_body": audit_in.request_body,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+        if not self.is_running:
+            # Nothing to hand the record to, e.g. outside of the app lifespan
+            await self._flush([record])
+            return
+
+        await self._queue.put(record)
+
+    async def _flush(self, records: list[dict[str, Any]]) -> None:
+        """Insert records with a single statement.
+
+        A batch that fails is logged and dropped, so one bad batch or a lost
+        connection doesn't stop the background writer.
+        """
+        try:
+            async with self._session_factory() as session:
+                await session.execute(insert(AuditModel).values(records))
+                await session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to write {len(records)} audit records: {e}")
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Failed to write {len(records)} audit records")
+
+    async def _drain(self) -> None:
+        """Write the queued records, including those of writers waiting on a full queue."""
+        while True:
+            records = []
+            while not self._queue.empty():
+                record = self._queue.get_nowait()
+                if record is not None:
+                    records.append(record)
+            if not records:
+                return
+            await self._flush(records)
+            # Let writers that were waiting for space put their records
+            await asyncio.sleep(0)
+
+    async def _run(self) -> None:
+        """Flush batches until told to stop.
+
+        If the writer stops unexpectedly the queue is drained, so writers waiting
+        for space aren't left waiting on it, and later records are written
+        directly.
+        """
+        try:
+            await self._flush_batches()
+        except Exception:  # noqa: BLE001
+            logger.exception("The audit writer stopped unexpectedly")
+            await self._drain()
+
+    async def _flush_batches(self) -> None:
+        """Flush batches until told to stop."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            record = await self._queue.get()
+            if record is None:
+                break
+
+            # Wait for a full batch or until the flush interval has passed
+            batch = [record]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+
+            await self._flush(batch)
+
+    def start(self) -> None:
+        """Start writing records in the background."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write any queued records and stop the background writer."""
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None
+        if not task.done():
+            await self._queue.put(None)
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        # Records from writers that were still waiting on a full queue
+        await self._drain()
+
+
+audit_writer = AuditWriter(
+    session_factory,
+    max_queue_size=CONFIG.audit_queue_size,
+    batch_size=CONFIG.audit_batch_size,
+    flush_interval=CONFIG.audit_flush_interval,
+)
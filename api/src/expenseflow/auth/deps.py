@@ -6,21 +6,30 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from loguru import logger
 
+from expenseflow.audit.policy import audit_policy
 from expenseflow.audit.schemas import AuditCreate
-from expenseflow.audit.service import create_audit
+from expenseflow.audit.writer import audit_writer
 from expenseflow.auth.service import JWTError, JWTManager
 from expenseflow.config import CONFIG
 from expenseflow.database.deps import DbSession
 from expenseflow.user.models import UserModel
-from expenseflow.user.service import get_user_by_token_id
+from expenseflow.user.service import get_cached_user_by_token_id
 
 security_schema = HTTPBearer()
 
-jwt_manager = JWTManager(jwt_audience=CONFIG.jwt_audience, domain=CONFIG.auth0_domain)
+jwt_manager = JWTManager(
+    jwt_audience=CONFIG.jwt_audience,
+    domain=CONFIG.auth0_domain,
+    cache_max_size=CONFIG.jwt_cache_max_size,
+    jwks_cache_ttl=CONFIG.jwks_cache_ttl,
+    jwks_refresh_margin=CONFIG.jwks_refresh_margin,
+    jwks_fetch_timeout=CONFIG.jwks_fetch_timeout,
+    jwks_source=CONFIG.jwks_source,
+)
 
 
 async def get_user_token_identifier(
-    token: Annotated[HTTPAuthorizationCredentials, Depends(security_schema)]
+    token: Annotated[HTTPAuthorizationCredentials, Depends(security_schema)],
 ) -> str:
     """Get user identifier from token."""
     try:
@@ -39,30 +48,34 @@ CurrentUserTokenID = Annotated[str, Depends(get_user_token_identifier)]
 
 
 async def get_current_user(
-    session: DbSession, user_token_id: CurrentUserTokenID, request: Request
+    session: DbSession, user_token_id: CurrentUserTokenID
 ) -> UserModel:
     """Dependency to get current user."""
-    user = await get_user_by_token_id(session, user_token_id)
+    user = await get_cached_user_by_token_id(session, user_token_id)
     if user is None:
         raise HTTPException(
             status.HTTP_401_UNAUTHORIZED,
             detail="Unable to match the provided token with a user in the system.",
         )
 
-    request_body: dict | None = None
-    try:
-        request_body = await request.json()
-    except Exception as e:  # noqa: BLE001
-        logger.warning(
-            f"Request body could not be parsed as JSON, proceeding with None. - {e}"
-        )
+    return user
+
+
+CurrentUser = Annotated[UserModel, Depends(get_current_user)]
+
+
+async def audit_request(user: CurrentUser, request: Request) -> None:
+    """Dependency to audit a request made by the current user."""
+    if not audit_policy.should_audit(request.method, request.url.path):
+        return
 
     audit_create = AuditCreate(
-        method=request.method, endpoint=request.url.path, request_body=request_body
+        method=request.method,
+        endpoint=request.url.path,
+        request_body=await audit_policy.capture_body(request),
     )
-    await create_audit(session, user, audit_create)
+    await audit_writer.write(user, audit_create)
 
-    return user
 
-
-CurrentUser = Annotated[UserModel, Depends(get_current_user)]
+# Add to a route's or router's dependencies to audit its requests
+Audited = Depends(audit_request)
@@ -0,0 +1,208 @@
+"""JWKS retrieval."""
+
+import asyncio
+import contextlib
+import json
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Self
+
+import httpx
+import jwt
+from loguru import logger
+
+
+class JWKSError(Exception):
+    """Error retrieving or using a JWKS."""
+
+
+class BaseJWKSClient(ABC):
+    """Source of the keys tokens are signed with."""
+
+    @abstractmethod
+    async def get_signing_key(self, kid: str) -> jwt.PyJWK:
+        """Get signing key under the given key id."""
+
+    def start(self) -> None:  # noqa: B027
+        """Start any background work."""
+
+    async def stop(self) -> None:  # noqa: B027
+        """Stop any background work."""
+
+
+class StaticJWKSClient(BaseJWKSClient):
+    """JWKS client with a fixed set of keys, e.g. for testing offline."""
+
+    _keys: dict[str, jwt.PyJWK]
+
+    def __init__(self, jwks: dict) -> None:
+        """Create static JWKS client."""
+        try:
+            jwk_set = jwt.PyJWKSet.from_dict(jwks)
+        except jwt.exceptions.PyJWTError as e:
+            msg = "Invalid JWKS"
+            raise JWKSError(msg) from e
+        self._keys = {k.key_id: k for k in jwk_set.keys if k.key_id is not None}
+
+    @classmethod
+    def from_source(cls, source: str) -> Self:
+        """Create from an inline JWKS document or the path of a JWKS file."""
+        try:
+            if source.lstrip().startswith("{"):
+                return cls(json.loads(source))
+            with Path(source).open("r") as f:
+                return cls(json.load(f))
+        except (OSError, ValueError) as e:
+            msg = f"Failed to load JWKS from '{source}'"
+            raise JWKSError(msg) from e
+
+    async def get_signing_key(self, kid: str) -> jwt.PyJWK:
+        """Get signing key under the given key id."""
+        key = self._keys.get(kid)
+        if key is None:
+            msg = f"Unable to find a signing key that matches '{kid}'"
+            raise JWKSError(msg)
+        return key
+
+
+class JWKSClient(BaseJWKSClient):
+    """Async JWKS client.
+
+    Keys are fetched without blocking the event loop, concurrent misses share a
+    single in-flight fetch and a background task refreshes the keys before they
+    expire. Once keys have been fetched they are served stale while a refresh is
+    in progress or failing, so a slow identity provider doesn't stall requests.
+    """
+
+    _jwks_url: str
+    _cache_ttl: float
+    _refresh_margin: float
+    _fetch_timeout: float
+    _min_refresh_interval: float
+
+    _keys: dict[str, jwt.PyJWK]
+    _fetched_at: float | None
+    _last_attempt_at: float | None
+    _inflight: asyncio.Task | None
+    _refresh_task: asyncio.Task | None
+
+    def __init__(
+        self,
+        jwks_url: str,
+        cache_ttl: float = 600,
+        refresh_margin: float = 60,
+        fetch_timeout: float = 5.0,
+        min_refresh_interval: float = 10,
+    ) -> None:
+        """Create JWKS client."""
+        self._jwks_url = jwks_url
+        self._cache_ttl = cache_ttl
+        self._refresh_margin = refresh_margin
+        self._fetch_timeout = fetch_timeout
+        self._min_refresh_interval = min_refresh_interval
+
+        self._keys = {}
+        self._fetched_at = None
+        self._last_attempt_at = None
+        self._inflight = None
+        self._refresh_task = None
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the cached keys have expired."""
+        return self._fetched_at is None or time.monotonic() - self._fetched_at >= self._cache_ttl
+
+    async def get_signing_key(self, kid: str) -> jwt.PyJWK:
+        """Get signing key under the given key id."""
+        key = self._keys.get(kid)
+
+        if key is not None:
+            if self.is_stale:
+                # Serve the stale key and revalidate in the background
+                self._start_fetch()
+            return key
+
+        # Unknown key id - either a cold cache or the keys have been rotated.
+        # Forged key ids shouldn't be able to make us hammer the provider.
+        if (
+            self._last_attempt_at is None
+            or time.monotonic() - self._last_attempt_at >= self._min_refresh_interval
+            or self.is_stale
+        ):
+            await self.refresh()
+
+        key = self._keys.get(kid)
+        if key is None:
+            msg = f"Unable to find a signing key that matches '{kid}'"
+            raise JWKSError(msg)
+        return key
+
+    async def refresh(self) -> None:
+        """Refresh keys, joining any fetch that is already in flight."""
+        task = self._start_fetch()
+        try:
+            await asyncio.shield(task)
+        except JWKSError:
+            if not self._keys:
+                raise
+            logger.warning("Unable to refresh JWKS, continuing with stale keys.")
+
+    def _start_fetch(self) -> asyncio.Task:
+        """Start a fetch unless there is one in flight already."""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._fetch())
+            self._inflight.add_done_callback(_consume_exception)
+        return self._inflight
+
+    async def _fetch(self) -> None:
+        """Fetch keys from the JWKS endpoint."""
+        self._last_attempt_at = time.monotonic()
+        try:
+            async with httpx.AsyncClient(timeout=self._fetch_timeout) as client:
+                response = await client.get(self._jwks_url)
+                response.raise_for_status()
+            jwk_set = jwt.PyJWKSet.from_dict(response.json())
+        except (httpx.HTTPError, ValueError, jwt.exceptions.PyJWTError) as e:
+            logger.error(f"Failed to fetch JWKS from '{self._jwks_url}': {e}")
+            msg = f"Failed to fetch JWKS from '{self._jwks_url}'"
+            raise JWKSError(msg) from e
+
+        self._keys = {k.key_id: k for k in jwk_set.keys if k.key_id is not None}
+        self._fetched_at = time.monotonic()
+        logger.debug(f"Fetched {len(self._keys)} signing keys from JWKS.")
+
+    async def _refresh_periodically(self) -> None:
+        """Refresh keys shortly before they expire."""
+        while True:
+            delay = 0.0
+            if self._fetched_at is not None:
+                age = time.monotonic() - self._fetched_at
+                delay = max(self._cache_ttl - self._refresh_margin - age, 0.0)
+            if self._last_attempt_at is not None:
+                # Don't spin when the provider is unavailable
+                delay = max(delay, self._min_refresh_interval)
+
+            await asyncio.sleep(delay)
+            with contextlib.suppress(JWKSError):
+                await self.refresh()
+
+    def start(self) -> None:
+        """Start refreshing keys in the background."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        """Stop refreshing keys in the background."""
+        if self._refresh_task is None:
+            return
+        self._refresh_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._refresh_task
+        self._refresh_task = None
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """Mark a background fetch's exception as retrieved - it has already been logged."""
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,145 @@
+"""Token minting for offline load testing.
+
+Generates a signing key, the JWKS the API verifies against and signed tokens for
+a number of synthetic users:
+
+    python -m expenseflow.auth.mint --users 1000 --out-dir loadtest
+
+Then run the API with JWKS_SOURCE=loadtest/jwks.json and the same AUTH0_DOMAIN
+and JWT_AUDIENCE the tokens were minted for. Pass --seed-db to also create the
+synthetic users, otherwise they can sign up through POST /users.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from expenseflow.config import CONFIG
+
+DEFAULT_KID = "expenseflow-loadtest"
+
+
+def generate_key() -> rsa.RSAPrivateKey:
+    """Generate a signing key."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def load_key(path: Path) -> rsa.RSAPrivateKey:
+    """Load a PEM encoded signing key."""
+    key = serialization.load_pem_private_key(path.read_bytes(), password=None)
+    if not isinstance(key, rsa.RSAPrivateKey):
+        msg = f"'{path}' is not an RSA private key"
+        raise TypeError(msg)
+    return key
+
+
+def build_jwks(key: rsa.RSAPrivateKey, kid: str = DEFAULT_KID) -> dict:
+    """Build the JWKS for a signing key."""
+    jwk = RSAAlgorithm.to_jwk(key.public_key(), as_dict=True)
+    return {"keys": [{**jwk, "kid": kid, "use": "sig", "alg": "RS256"}]}
+
+
+def mint_token(  # noqa: PLR0913
+    key: rsa.RSAPrivateKey,
+    sub: str,
+    *,
+    audience: str,
+    domain: str,
+    expires_in: int = 86400,
+    kid: str = DEFAULT_KID,
+) -> str:
+    """Mint a token the API accepts for a subject."""
+    now = int(time.time())
+    payload = {
+        "sub": sub,
+        "aud": audience,
+        "iss": f"https://{domain}/",
+        "iat": now,
+        "exp": now + expires_in,
+    }
+    return jwt.encode(payload, key, algorithm="RS256", headers={"kid": kid})
+
+
+def synthetic_subject(index: int) -> str:
+    """Get the token subject of a synthetic user."""
+    return f"loadtest|user-{index:06d}"
+
+
+async def seed_users(subjects: list[str]) -> None:
+    """Create the synthetic users if they don't exist yet."""
+    from expenseflow.database.core import commit, db_engine, session_factory
+    from expenseflow.user.schemas import UserCreateInternal
+    from expenseflow.user.service import create_user
+
+    async with session_factory() as session:
+        for sub in subjects:
+            suffix = sub.rsplit("-", 1)[-1]
+            await create_user(
+                session,
+                UserCreateInternal(
+                    token_id=sub,
+                    nickname=f"loadtest-{suffix}",
+                    first_name="Load",
+                    last_name=f"Test {suffix}",
+                    budget=1000,
+                ),
+            )
+        await commit(session)
+    await db_engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Mint tokens for synthetic users."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--out-dir", type=Path, default=Path("loadtest"))
+    parser.add_argument("--key", type=Path, help="Existing PEM key to sign with instead of a new one.")
+    parser.add_argument("--kid", default=DEFAULT_KID)
+    parser.add_argument("--audience", default=CONFIG.jwt_audience)
+    parser.add_argument("--domain", default=CONFIG.auth0_domain)
+    parser.add_argument("--expires-in", type=int, default=86400)
+    parser.add_argument("--seed-db", action="store_true", help="Create the synthetic users.")
+    args = parser.parse_args(argv)
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    if args.key is not None:
+        key = load_key(args.key)
+    else:
+        key = generate_key()
+        (args.out_dir / "private_key.pem").write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+
+    (args.out_dir / "jwks.json").write_text(json.dumps(build_jwks(key, args.kid)))
+
+    subjects = [synthetic_subject(i) for i in range(args.users)]
+    tokens = {
+        sub: mint_token(
+            key,
+            sub,
+            audience=args.audience,
+            domain=args.domain,
+            expires_in=args.expires_in,
+            kid=args.kid,
+        )
+        for sub in subjects
+    }
+    (args.out_dir / "tokens.json").write_text(json.dumps(tokens, indent=2))
+
+    if args.seed_db:
+        asyncio.run(seed_users(subjects))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,18 @@
 """Auth Utils."""
 
+import hashlib
+import time
+from collections import OrderedDict
+
 import jwt
 from loguru import logger
 
+from expenseflow.auth.jwks import (
+    BaseJWKSClient,
+    JWKSClient,
+    JWKSError,
+    StaticJWKSClient,
+)
 from expenseflow.utils import SingletonMeta
 
 """expenseflow.au.auth0.com"""
@@ -12,35 +22,146 @@ class JWTError(Exception):
     """Error with jwt."""
 
 
+class VerifiedTokenCache:
+    """LRU cache of verified token subjects, keyed by a digest of the token.
+
+    Entries are evicted once the token's 'exp' claim has passed, so a cached
+    token is never accepted for longer than it would be by a full verification.
+    """
+
+    _max_size: int
+    _entries: OrderedDict[str, tuple[str, float]]
+
+    hits: int
+    misses: int
+
+    def __init__(self, max_size: int) -> None:
+        """Create verified token cache."""
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(token: str) -> str:
+        """Get the cache key for a token."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get the subject of a verified token if it is cached and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        sub, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return sub
+
+    def set(self, key: str, sub: str, expires_at: float) -> None:
+        """Cache the subject of a verified token until it expires."""
+        if self._max_size <= 0:
+            return
+
+        self._entries[key] = (sub, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached tokens."""
+        return len(self._entries)
+
+
 class JWTManager(metaclass=SingletonMeta):
     """JWT Manager."""
 
     _domain: str
     _jwt_audience: str
-    _jwks_client: jwt.PyJWKClient
+    jwks_client: BaseJWKSClient
+    _token_cache: VerifiedTokenCache
+
+    def __init__(  # noqa: PLR0913
+        self,
+        jwt_audience: str,
+        domain: str,
+        *,
+        cache_max_size: int = 1024,
+        jwks_cache_ttl: float = 600,
+        jwks_refresh_margin: float = 60,
+        jwks_fetch_timeout: float = 5.0,
+        jwks_source: str | None = None,
+    ) -> None:
+        """Constructor for JWT manager.
 
-    def __init__(self, jwt_audience: str, domain: str) -> None:
-        """Constructor for JWT manager."""
+        Keys are fetched from the domain's JWKS endpoint, unless a JWKS source is
+        given as an inline JWKS document or the path of a JWKS file.
+        """
         logger.info("CREATING JWT MANAGER")
-        jwks_url = f"https://{domain}/.well-known/jwks.json"
         self._jwt_audience = jwt_audience
         self._domain = domain
-        self.jwks_client = jwt.PyJWKClient(jwks_url)
+        if jwks_source is not None:
+            logger.warning("Verifying tokens against a local JWKS.")
+            self.jwks_client = StaticJWKSClient.from_source(jwks_source)
+        else:
+            self.jwks_client = JWKSClient(
+                f"https://{domain}/.well-known/jwks.json",
+                cache_ttl=jwks_cache_ttl,
+                refresh_margin=jwks_refresh_margin,
+                fetch_timeout=jwks_fetch_timeout,
+            )
+        self._token_cache = VerifiedTokenCache(cache_max_size)
+
+    @property
+    def token_cache(self) -> VerifiedTokenCache:
+        """Cache of already verified tokens."""
+        return self._token_cache
+
+    def start(self) -> None:
+        """Start refreshing signing keys in the background."""
+        self.jwks_client.start()
+
+    async def stop(self) -> None:
+        """Stop refreshing signing keys in the background."""
+        await self.jwks_client.stop()
 
     async def verify(self, token: str) -> str:
         """Verify jwt token."""
+        cache_key = VerifiedTokenCache.key_for(token)
+        cached_sub = self._token_cache.get(cache_key)
+        if cached_sub is not None:
+            return cached_sub
+
         # This gets the 'kid' from the passed token
         try:
-            signing_key: jwt.PyJWK = self.jwks_client.get_signing_key_from_jwt(
-                token
-            ).key
-        except jwt.exceptions.PyJWKClientError as e:
-            logger.error(f"Error with python JWK client: {e}")
-            raise JWTError from e
+            kid = jwt.get_unverified_header(token).get("kid")
         except jwt.exceptions.DecodeError as e:
             logger.error(f"Decode error when grabbing signing key token: {e}")
             raise JWTError from e
 
+        if kid is None:
+            logger.error("Token header has no 'kid'")
+            raise JWTError
+
+        try:
+            signing_key = (await self.jwks_client.get_signing_key(kid)).key
+        except JWKSError as e:
+            logger.error(f"Error with JWKS client: {e}")
+            raise JWTError from e
+
         try:
             payload: dict = jwt.decode(
                 token,
@@ -58,4 +179,10 @@ class JWTManager(metaclass=SingletonMeta):
         if sub is None:
             logger.error(f"SUB is none - payload is: {payload}")
             raise JWTError
+
+        # Tokens without an expiry are never cached, as they can't be evicted safely
+        exp = payload.get("exp", None)  # noqa: SIM910
+        if isinstance(exp, int | float):
+            self._token_cache.set(cache_key, sub, float(exp))
+
         return sub
@@ -8,9 +8,35 @@ class GeneralSettings(BaseSettings):
     """General app settings."""
 
     db_url: str = Field()
+    db_read_url: str | None = Field(default=None)
+    db_read_your_writes_window: float = Field(default=5.0)
+    db_pool_size: int = Field(default=5)
+    db_max_overflow: int = Field(default=10)
+    db_pool_timeout: float = Field(default=30)
+    db_pool_recycle: int = Field(default=1800)
+    db_pool_pre_ping: bool = Field(default=True)
+    db_statement_cache_size: int = Field(default=100)
+    db_prepared_statement_cache_size: int = Field(default=256)
+    db_query_cache_size: int = Field(default=1000)
     frontend_url: str = Field()
     jwt_audience: str = Field()
     auth0_domain: str = Field()
+    jwt_cache_max_size: int = Field(default=1024)
+    jwks_cache_ttl: float = Field(default=600)
+    jwks_refresh_margin: float = Field(default=60)
+    jwks_fetch_timeout: float = Field(default=5.0)
+    # Inline JWKS or path to a JWKS file to use instead of the Auth0 endpoint
+    jwks_source: str | None = Field(default=None)
+    identity_cache_url: str = Field(default="memory://")
+    identity_cache_ttl: float = Field(default=60)
+    identity_cache_max_size: int = Field(default=10000)
+    audit_queue_size: int = Field(default=10000)
+    audit_batch_size: int = Field(default=100)
+    audit_flush_interval: float = Field(default=1.0)
+    audit_policy_path: str = Field(default="audit_policy.yml")
+    audit_partition_months_ahead: int = Field(default=3)
+    audit_retention_months: int = Field(default=12)
+    audit_archive_dir: str = Field(default="audit_archive")
     plugin_config_path: str = Field(default="plugin_config.yml")
 
 
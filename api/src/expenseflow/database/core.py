@@ -1,7 +1,10 @@
 """Base database module."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import cast
 
+from fastapi import Request
 from loguru import logger
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
@@ -12,21 +15,87 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from expenseflow.config import CONFIG
-
-db_engine: AsyncEngine = create_async_engine(
-    CONFIG.db_url,
-    pool_pre_ping=True,
+from expenseflow.database.pool import InstrumentedAsyncPool
+from expenseflow.database.routing import (
+    RecentWriters,
+    client_key,
+    is_write_request,
 )
+from expenseflow.database.schemas import PoolStatusRead
+
+# Session info key of the callbacks waiting for the transaction to commit
+_AFTER_COMMIT = "after_commit"
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Create an engine with the configured connection pool."""
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=CONFIG.db_pool_size,
+        max_overflow=CONFIG.db_max_overflow,
+        pool_timeout=CONFIG.db_pool_timeout,
+        pool_recycle=CONFIG.db_pool_recycle,
+        pool_pre_ping=CONFIG.db_pool_pre_ping,
+        # Compiled SQL is cached per statement shape and reused across calls
+        query_cache_size=CONFIG.db_query_cache_size,
+        connect_args={
+            # Both caches have to be disabled behind pgbouncer in transaction mode
+            "statement_cache_size": CONFIG.db_statement_cache_size,
+            "prepared_statement_cache_size": CONFIG.db_prepared_statement_cache_size,
+        },
+    )
+
+
+db_engine: AsyncEngine = _create_engine(CONFIG.db_url)
 session_factory = async_sessionmaker(
     db_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+# Read-only queries go to the replica when there is one
+read_engine: AsyncEngine = _create_engine(CONFIG.db_read_url) if CONFIG.db_read_url else db_engine
+read_session_factory = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+recent_writers = RecentWriters(CONFIG.db_read_your_writes_window)
+
+
+def has_read_replica() -> bool:
+    """Whether reads are routed to a separate replica."""
+    return read_engine is not db_engine
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+
+def get_pool_status() -> PoolStatusRead:
+    """Get the current state and metrics of the connection pool."""
+    return cast("InstrumentedAsyncPool", db_engine.pool).status_read()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run a callback once the session's transaction is committed.
+
+    For side effects outside the database, like invalidating a cache, that must
+    not happen before the changes they follow are visible to other sessions.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+async def commit(session: AsyncSession) -> None:
+    """Commit a session, then run the callbacks waiting for the commit."""
+    await session.commit()
+    for callback in session.info.pop(_AFTER_COMMIT, []):
+        await callback()
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Get generator to get database session.
 
+    The request is a single unit of work - services only flush their changes
+    and they are committed once here, or rolled back if the request fails.
+
     :return: generator for async db session.
     :rtype: AsyncGenerator[AsyncSession, None]
     :yield: db session generator.
@@ -35,9 +104,55 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with session_factory() as session:
         try:
             yield session
-            await session.commit()
+            await commit(session)
         except SQLAlchemyError as e:
             logger.error(e)
             await session.rollback()
             await session.close()
             raise
+
+    if has_read_replica() and is_write_request(request):
+        key = client_key(request)
+        if key is not None:
+            recent_writers.mark(key)
+
+
+@asynccontextmanager
+async def savepoint(session: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+    """Run a block in a savepoint.
+
+    If the block fails only its changes are rolled back, leaving the rest of the
+    transaction usable. Its changes are otherwise committed with the transaction.
+    """
+    async with session.begin_nested():
+        yield session
+
+
+def get_read_session_factory(request: Request) -> async_sessionmaker[AsyncSession]:
+    """Get the session factory a read-only request should use.
+
+    Clients that have written recently read from the primary, so they aren't
+    served stale data by a lagging replica.
+    """
+    if not has_read_replica():
+        return session_factory
+
+    key = client_key(request)
+    if key is not None and recent_writers.is_recent(key):
+        return session_factory
+
+    return read_session_factory
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Get generator to get a read-only database session.
+
+    Sessions are never committed, so nothing written through them is persisted.
+    """
+    async with get_read_session_factory(request)() as session:
+        try:
+            yield session
+        except SQLAlchemyError as e:
+            logger.error(e)
+            await session.rollback()
+            raise
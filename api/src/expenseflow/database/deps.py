@@ -3,7 +3,19 @@
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from expenseflow.database.core import AsyncSession, get_db
+from expenseflow.database.core import (
+    AsyncSession,
+    get_db,
+    get_read_db,
+    get_read_session_factory,
+)
 
+# FastAPI (before 0.118) exits dependencies before the response is sent, so the
+# commit in get_db happens first and a failed commit isn't reported as success
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+DbReadSession = Annotated[AsyncSession, Depends(get_read_db)]
+# For a session that has to outlive the request's dependencies, like one a
+# streamed response reads from
+ReadSessionFactory = Annotated[async_sessionmaker[AsyncSession], Depends(get_read_session_factory)]
@@ -0,0 +1,300 @@
+"""Versioned schema migrations.
+
+Migrations are run once per deployment, before the app starts:
+
+    python -m expenseflow.database.migrations upgrade
+
+An empty database gets the current schema and is stamped with the latest
+version. A database created before versioning existed is stamped with the
+baseline and upgraded from there. The app itself only checks the version on
+startup, see 'check_schema_version'.
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from loguru import logger
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncTransaction
+
+from expenseflow.audit.partitions import ensure_partitions, is_partitioned
+from expenseflow.config import CONFIG
+from expenseflow.database.service import create_schema
+from expenseflow.expense.money import PROPORTION_PRECISION, PROPORTION_SCALE
+
+# Arbitrary key of the advisory lock that serialises concurrent migration runs
+MIGRATION_LOCK_ID = 7_340_212
+
+schema_version_table = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
+
+class SchemaVersionError(Exception):
+    """The database schema doesn't match the version the app expects."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A schema migration."""
+
+    version: int
+    description: str
+    upgrade: Callable[[AsyncConnection], Awaitable[None]]
+
+
+async def _baseline(conn: AsyncConnection) -> None:
+    """The schema as created by 'create_all' before migrations existed."""
+
+
+async def _partition_audit(conn: AsyncConnection) -> None:
+    """Move the audit log into a table partitioned by month."""
+    if await is_partitioned(conn):
+        return
+
+    await conn.execute(text("ALTER TABLE audit RENAME TO audit_unpartitioned"))
+    await conn.execute(text("ALTER TABLE audit_unpartitioned RENAME CONSTRAINT audit_pkey TO audit_unpartitioned_pkey"))
+    await conn.execute(text("DROP INDEX IF EXISTS ix_audit_user_id_created_at"))
+    await conn.execute(
+        text("CREATE TABLE audit (LIKE audit_unpartitioned INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+    )
+    await conn.execute(
+        text(
+            "ALTER TABLE audit "
+            "ADD CONSTRAINT audit_pkey PRIMARY KEY (audit_id, created_at), "
+            "ADD CONSTRAINT audit_user_id_fkey FOREIGN KEY (user_id) "
+            'REFERENCES "user" (user_id) ON DELETE CASCADE'
+        )
+    )
+
+    # Existing records get month partitions too, so retention can expire them
+    oldest = await conn.scalar(text("SELECT min(created_at) FROM audit_unpartitioned"))
+    now = dt.datetime.now(dt.UTC)
+    start = oldest.astimezone(dt.UTC) if oldest is not None and oldest < now else now
+    months_back = (now.year - start.year) * 12 + now.month - start.month
+    await ensure_partitions(conn, months_back + CONFIG.audit_partition_months_ahead, now=start)
+
+    await conn.execute(text("INSERT INTO audit SELECT * FROM audit_unpartitioned"))
+    await conn.execute(text("DROP TABLE audit_unpartitioned"))
+
+
+async def _add_access_pattern_indexes(conn: AsyncConnection) -> None:
+    """Index the predicates of the audit, expense and friend queries."""
+    for statement in (
+        ("CREATE INDEX IF NOT EXISTS ix_audit_user_id_created_at ON audit (user_id, created_at)"),
+        "CREATE INDEX IF NOT EXISTS ix_expense_uploader_id ON expense (uploader_id)",
+        "CREATE INDEX IF NOT EXISTS ix_expense_parent_id ON expense (parent_id)",
+        ("CREATE INDEX IF NOT EXISTS ix_expense_item_expense_id ON expense_item (expense_id, expense_item_id)"),
+        (
+            "CREATE INDEX IF NOT EXISTS ix_expense_item_split_user_id_expense_item_id "
+            "ON expense_item_split (user_id, expense_item_id) "
+            "INCLUDE (proportion, status)"
+        ),
+        ("CREATE INDEX IF NOT EXISTS ix_friend_sender_id_status ON friend (sender_id, status)"),
+        ("CREATE INDEX IF NOT EXISTS ix_friend_receiver_id_status ON friend (receiver_id, status)"),
+    ):
+        await conn.execute(text(statement))
+
+
+async def _store_money_as_fixed_point(conn: AsyncConnection) -> None:
+    """Store prices as integer cents and proportions as numerics."""
+    await conn.execute(text("ALTER TABLE expense_item ADD COLUMN price_cents BIGINT"))
+    await conn.execute(text("UPDATE expense_item SET price_cents = round(price::numeric * 100)"))
+    await conn.execute(text("ALTER TABLE expense_item ALTER COLUMN price_cents SET NOT NULL, DROP COLUMN price"))
+    await conn.execute(
+        text(
+            "ALTER TABLE expense_item_split ALTER COLUMN proportion "
+            f"TYPE NUMERIC({PROPORTION_PRECISION}, {PROPORTION_SCALE}) "
+            f"USING round(proportion::numeric, {PROPORTION_SCALE})"
+        )
+    )
+
+
+async def _store_expense_totals(conn: AsyncConnection) -> None:
+    """Store each expense's total and lowest split status on the expense."""
+    await conn.execute(
+        text(
+            "ALTER TABLE expense "
+            "ADD COLUMN total_cents BIGINT NOT NULL DEFAULT 0, "
+            "ADD COLUMN status expensestatus NOT NULL DEFAULT 'paid'"
+        )
+    )
+    await conn.execute(
+        text(
+            "UPDATE expense SET "
+            "total_cents = coalesce(("
+            "SELECT sum(price_cents * quantity) FROM expense_item "
+            "WHERE expense_item.expense_id = expense.expense_id), 0), "
+            "status = coalesce(("
+            "SELECT min(expense_item_split.status) FROM expense_item_split "
+            "JOIN expense_item USING (expense_item_id) "
+            "WHERE expense_item.expense_id = expense.expense_id), 'paid')"
+        )
+    )
+    # The services set both, so a missing value is a bug rather than a default
+    await conn.execute(
+        text("ALTER TABLE expense ALTER COLUMN total_cents DROP DEFAULT, ALTER COLUMN status DROP DEFAULT")
+    )
+
+
+async def _index_expense_listing_order(conn: AsyncConnection) -> None:
+    """Extend the expense uploader and parent indexes with the listing order."""
+    for statement in (
+        "DROP INDEX IF EXISTS ix_expense_uploader_id",
+        "DROP INDEX IF EXISTS ix_expense_parent_id",
+        (
+            "CREATE INDEX IF NOT EXISTS ix_expense_uploader_id_expense_date "
+            "ON expense (uploader_id, expense_date, expense_id)"
+        ),
+        (
+            "CREATE INDEX IF NOT EXISTS ix_expense_parent_id_expense_date "
+            "ON expense (parent_id, expense_date, expense_id)"
+        ),
+    ):
+        await conn.execute(text(statement))
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "Baseline schema", _baseline),
+    Migration(2, "Partition the audit table by month", _partition_audit),
+    Migration(3, "Add access pattern indexes", _add_access_pattern_indexes),
+    Migration(4, "Store money as fixed-point", _store_money_as_fixed_point),
+    Migration(5, "Store expense totals and statuses", _store_expense_totals),
+    Migration(6, "Index the expense listing order", _index_expense_listing_order),
+]
+HEAD = MIGRATIONS[-1].version
+
+
+def _transaction(conn: AsyncConnection) -> AsyncTransaction:
+    """Begin a transaction, or a savepoint if one is already in progress."""
+    return conn.begin_nested() if conn.in_transaction() else conn.begin()
+
+
+async def get_schema_version(conn: AsyncConnection) -> int | None:
+    """Get the version of the schema, None if it isn't versioned."""
+    exists = await conn.scalar(text("SELECT to_regclass('schema_version')"))
+    if exists is None:
+        return None
+    return await conn.scalar(select(func.max(schema_version_table.c.version)))
+
+
+async def _stamp(conn: AsyncConnection, migration: Migration) -> None:
+    await conn.execute(
+        insert(schema_version_table).values(version=migration.version, description=migration.description)
+    )
+
+
+async def run_migrations(conn: AsyncConnection, target: int = HEAD) -> list[int]:
+    """Upgrade the schema to the target version, returning the versions applied."""
+    async with _transaction(conn):
+        version = await get_schema_version(conn)
+
+    if version is None:
+        async with _transaction(conn):
+            await conn.run_sync(schema_version_table.create)
+            has_tables = await conn.scalar(text("SELECT to_regclass('\"user\"')"))
+            if has_tables is None:
+                logger.info("Creating the schema on an empty database.")
+                await create_schema(conn)
+                for migration in MIGRATIONS:
+                    await _stamp(conn, migration)
+                return [m.version for m in MIGRATIONS]
+
+            logger.info("Versioning an existing schema from the baseline.")
+            await _stamp(conn, MIGRATIONS[0])
+        version = MIGRATIONS[0].version
+
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version <= version or migration.version > target:
+            continue
+
+        logger.info(f"Applying migration {migration.version}: {migration.description}")
+        async with _transaction(conn):
+            await migration.upgrade(conn)
+            await _stamp(conn, migration)
+        applied.append(migration.version)
+
+    return applied
+
+
+async def upgrade(engine: AsyncEngine, target: int = HEAD) -> list[int]:
+    """Upgrade the database, waiting for any other run to finish first."""
+    async with engine.connect() as conn:
+        await conn.execute(select(func.pg_advisory_lock(MIGRATION_LOCK_ID)))
+        await conn.commit()
+        try:
+            applied = await run_migrations(conn, target)
+        finally:
+            await conn.execute(select(func.pg_advisory_unlock(MIGRATION_LOCK_ID)))
+            await conn.commit()
+
+    if applied:
+        logger.success(f"Applied migrations: {', '.join(map(str, applied))}")
+    else:
+        logger.info("The schema is up to date.")
+    return applied
+
+
+async def check_schema_version(engine: AsyncEngine) -> int:
+    """Check the database has been migrated to the version the app expects."""
+    async with engine.connect() as conn:
+        version = await get_schema_version(conn)
+
+    if version is None or version < HEAD:
+        msg = (
+            f"Database schema is at version {version}, expected {HEAD}. "
+            "Run 'python -m expenseflow.database.migrations upgrade' first."
+        )
+        raise SchemaVersionError(msg)
+
+    if version > HEAD:
+        # Migrations are additive, so an older app can run against a newer schema
+        logger.warning(f"Database schema is at version {version}, ahead of {HEAD}.")
+    return version
+
+
+async def main(argv: list[str] | None = None) -> None:
+    """Run migrations."""
+    from expenseflow.database.core import db_engine
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    upgrade_parser = commands.add_parser("upgrade", help="Apply pending migrations.")
+    upgrade_parser.add_argument("--to", type=int, default=HEAD, dest="target")
+    commands.add_parser("current", help="Show the schema version.")
+    commands.add_parser("history", help="List all migrations.")
+    args = parser.parse_args(argv)
+
+    if args.command == "upgrade":
+        await upgrade(db_engine, args.target)
+    elif args.command == "current":
+        async with db_engine.connect() as conn:
+            logger.info(f"Schema version: {await get_schema_version(conn)}")
+    else:
+        for migration in MIGRATIONS:
+            logger.info(f"{migration.version}: {migration.description}")
+
+    await db_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""Instrumented connection pool."""
+
+import bisect
+import time
+from typing import Any, cast
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from expenseflow.database.schemas import PoolStatusRead
+
+# Upper bounds in seconds of the checkout wait time histogram buckets
+WAIT_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class PoolMetrics:
+    """Checkout metrics of a connection pool."""
+
+    checkouts: int
+    failures: int
+    wait_time_total: float
+    _bucket_counts: list[int]
+
+    def __init__(self) -> None:
+        """Create pool metrics."""
+        self.checkouts = 0
+        self.failures = 0
+        self.wait_time_total = 0.0
+        self._bucket_counts = [0] * (len(WAIT_TIME_BUCKETS) + 1)
+
+    def observe_checkout(self, wait_time: float) -> None:
+        """Record a successful checkout."""
+        self.checkouts += 1
+        self.wait_time_total += wait_time
+        self._bucket_counts[bisect.bisect_left(WAIT_TIME_BUCKETS, wait_time)] += 1
+
+    def observe_failure(self) -> None:
+        """Record a checkout that failed, e.g. timed out waiting for a connection."""
+        self.failures += 1
+
+    def wait_time_histogram(self) -> dict[str, int]:
+        """Cumulative checkout counts by the upper bound of their wait time."""
+        histogram = {}
+        total = 0
+        for bound, count in zip([*map(str, WAIT_TIME_BUCKETS), "+Inf"], self._bucket_counts, strict=True):
+            total += count
+            histogram[bound] = total
+        return histogram
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait."""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Create instrumented pool."""
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, recording the wait."""
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except Exception:
+            self.metrics.observe_failure()
+            raise
+        self.metrics.observe_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncPool":
+        """Recreate the pool, keeping its metrics."""
+        pool = cast("InstrumentedAsyncPool", super().recreate())
+        pool.metrics = self.metrics
+        return pool
+
+    def status_read(self) -> PoolStatusRead:
+        """Get the current state and metrics of the pool."""
+        return PoolStatusRead(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+            checkouts=self.metrics.checkouts,
+            checkout_failures=self.metrics.failures,
+            wait_time_total=self.metrics.wait_time_total,
+            wait_time_histogram=self.metrics.wait_time_histogram(),
+        )
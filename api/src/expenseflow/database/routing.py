@@ -0,0 +1,71 @@
+"""Routing of reads between the primary database and a read replica."""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from fastapi import Request
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RecentWriters:
+    """Clients that have recently written to the primary database.
+
+    Reads from these clients are served by the primary until the window has
+    passed, so they see their own writes regardless of replication lag.
+    """
+
+    _window: float
+    _max_size: int
+    _entries: OrderedDict[str, float]
+
+    def __init__(self, window: float, max_size: int = 10000) -> None:
+        """Create recent writers tracker."""
+        self._window = window
+        self._max_size = max_size
+        self._entries = OrderedDict()
+
+    def mark(self, key: str) -> None:
+        """Record that a client has just written."""
+        if self._window <= 0:
+            return
+
+        self._entries[key] = time.monotonic() + self._window
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def is_recent(self, key: str) -> bool:
+        """Whether a client has written within the window."""
+        expires_at = self._entries.get(key)
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False
+
+        return True
+
+    def clear(self) -> None:
+        """Forget all writers."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of tracked writers."""
+        return len(self._entries)
+
+
+def client_key(request: Request) -> str | None:
+    """Get the key a client's writes are tracked under, a digest of its credentials."""
+    authorization = request.headers.get("Authorization")
+    if authorization is None:
+        return None
+    return hashlib.sha256(authorization.encode()).hexdigest()
+
+
+def is_write_request(request: Request) -> bool:
+    """Whether a request may modify data."""
+    return request.method not in SAFE_METHODS
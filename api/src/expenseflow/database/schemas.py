@@ -0,0 +1,18 @@
+"""Database schemas."""
+
+from expenseflow.schemas import ExpenseFlowBase
+
+
+class PoolStatusRead(ExpenseFlowBase):
+    """Connection pool status read schema."""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    # Negative while the pool hasn't created all of its base connections yet
+    overflow: int
+
+    checkouts: int
+    checkout_failures: int
+    wait_time_total: float
+    wait_time_histogram: dict[str, int]
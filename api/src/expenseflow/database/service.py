@@ -1,13 +1,10 @@
 """Database services."""
 
-from loguru import logger
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-)
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 
-async def initialise_database(engine: AsyncEngine) -> None:
-    """Initialise database."""
+async def create_schema(conn: AsyncConnection) -> None:
+    """Create the current schema on an empty database."""
     # Importing as now sqlalchemy will know about them when creating the schema
     from expenseflow.database.base import BaseDBModel  # noqa: I001
     from expenseflow.group.models import GroupUserModel  # noqa: F401
@@ -19,9 +16,11 @@ async def initialise_database(engine: AsyncEngine) -> None:
         ExpenseItemModel,
         ExpenseItemSplitModel,
     )
+    from expenseflow.friend.models import FriendModel  # noqa: F401
     from expenseflow.audit.models import AuditModel  # noqa: F401
 
-    async with engine.begin() as conn:
-        await conn.run_sync(BaseDBModel.metadata.create_all)
+    from expenseflow.audit.partitions import ensure_partitions
+    from expenseflow.config import CONFIG
 
-    logger.success("Initialising database was successful.")
+    await conn.run_sync(BaseDBModel.metadata.create_all)
+    await ensure_partitions(conn, CONFIG.audit_partition_months_ahead)
@@ -49,6 +49,13 @@ class FriendStatus(ExpenseFlowEnum):
     accepted = "accepted"
 
 
+class ExportFormat(ExpenseFlowEnum):
+    """Enum for expense export formats."""
+
+    csv = "csv"
+    ndjson = "ndjson"
+
+
 class ExpenseStatus(ExpenseFlowEnum):
     """Enum for expense status."""
 
@@ -26,5 +26,13 @@ class RoleError(ExpenseFlowError):
     """Error raised when a user doesn't have the required roles for something."""
 
 
+class InvalidCursorError(ExpenseFlowError):
+    """Error raised when a pagination cursor can't be decoded."""
+
+
+class InvalidImportError(ExpenseFlowError):
+    """Error raised when an import body can't be parsed."""
+
+
 class InvalidStateError(Exception):
     """Error when the system gets into an invalid state."""
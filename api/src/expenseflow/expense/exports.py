@@ -0,0 +1,114 @@
+"""Streamed expense exports.
+
+Expenses are flattened to a row per split of each of their items, and read from
+a server-side cursor a batch at a time as the response is sent, so an export of
+any size is never held in memory.
+"""
+
+import csv
+import datetime as dt
+import io
+import json
+from collections.abc import AsyncIterator, Iterable, Sequence
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from expenseflow.enums import ExportFormat
+from expenseflow.expense.models import (
+    ExpenseItemModel,
+    ExpenseItemSplitModel,
+    ExpenseModel,
+)
+from expenseflow.expense.schemas import ExpenseFilters
+from expenseflow.expense.service import involves, list_expenses, to_amount
+from expenseflow.user.models import UserModel
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv",
+    ExportFormat.ndjson: "application/x-ndjson",
+}
+
+
+def get_export_stmt(user: UserModel, filters: ExpenseFilters | None = None) -> Select:
+    """Get the flattened split rows of the expenses a user is involved in."""
+    stmt = (
+        select(
+            ExpenseModel.expense_id,
+            ExpenseModel.name,
+            ExpenseModel.description,
+            ExpenseModel.category,
+            ExpenseModel.expense_date,
+            to_amount(ExpenseModel.total_cents).label("expense_total"),
+            ExpenseModel.status,
+            ExpenseItemModel.expense_item_id,
+            ExpenseItemModel.name.label("item_name"),
+            ExpenseItemModel.quantity,
+            to_amount(ExpenseItemModel.price_cents).label("price"),
+            ExpenseItemSplitModel.user_id.label("split_user_id"),
+            ExpenseItemSplitModel.proportion,
+            ExpenseItemSplitModel.status.label("split_status"),
+        )
+        .select_from(ExpenseModel)
+        .outerjoin(ExpenseModel.items)
+        .outerjoin(ExpenseItemModel.splits)
+        .where(involves(user))
+    )
+    # Each expense's rows stay together, in a stable order
+    return list_expenses(stmt, filters).order_by(ExpenseItemModel.expense_item_id, ExpenseItemSplitModel.user_id)
+
+
+def _to_text(value: Any) -> Any:  # noqa: ANN401
+    """Convert a column value to how it's written in an export."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID | Decimal):
+        return str(value)
+    if isinstance(value, dt.datetime):
+        return value.isoformat()
+    return value
+
+
+def format_csv(rows: Iterable[Sequence[Any]]) -> str:
+    """Format rows as CSV."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_to_text(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+
+def format_ndjson(rows: Iterable[Sequence[Any]], columns: Sequence[str]) -> str:
+    """Format rows as NDJSON, with an object per row."""
+    return "".join(
+        json.dumps({c: _to_text(value) for c, value in zip(columns, row, strict=True)}) + "\n" for row in rows
+    )
+
+
+async def stream_export(
+    session_factory: async_sessionmaker[AsyncSession],
+    user: UserModel,
+    export_format: ExportFormat,
+    filters: ExpenseFilters | None = None,
+) -> AsyncIterator[bytes]:
+    """Stream an export of the expenses a user is involved in.
+
+    The session is opened here rather than taken from the request, as the export
+    is sent after the request's dependencies, and their sessions, are closed.
+    """
+    stmt = get_export_stmt(user, filters)
+    columns = [column.name for column in stmt.selected_columns]
+    if export_format == ExportFormat.csv:
+        # The header is sent before the query runs
+        yield format_csv([columns]).encode()
+
+    async with session_factory() as session:
+        result = await session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            if export_format == ExportFormat.csv:
+                yield format_csv(rows).encode()
+            else:
+                yield format_ndjson(rows, columns).encode()
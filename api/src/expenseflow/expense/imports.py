@@ -0,0 +1,180 @@
+"""Parsing of streamed expense imports.
+
+Bodies are parsed a line at a time as they arrive, so an import of any size is
+never held in memory. Each row becomes an 'ExpenseCreate', or the reason it
+isn't one, so a bad row is reported rather than failing the whole import.
+"""
+
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from pydantic import ValidationError
+
+from expenseflow.errors import InvalidImportError
+from expenseflow.expense.schemas import ExpenseCreate
+
+CSV_MEDIA_TYPE = "text/csv"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+IMPORT_MEDIA_TYPES = (CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE)
+IMPORT_CHUNK_SIZE = 500
+IMPORT_CHUNK_FAILED = "The database rejected the chunk of rows this row was in"
+# Longest line or CSV record, in characters, so a body without line breaks
+# can't be buffered whole
+MAX_LINE_LENGTH = 1024 * 1024
+
+# Spreadsheet rows are an expense with a single item, split with no one
+CSV_REQUIRED_COLUMNS = frozenset(("name", "category", "expense_date", "price"))
+
+# A row number, and the expense on it or why it's invalid
+ImportRow = tuple[int, ExpenseCreate | str]
+
+
+def _check_length(length: int) -> None:
+    """Check a line or record isn't too long to buffer."""
+    if length > MAX_LINE_LENGTH:
+        msg = f"A line or record is longer than {MAX_LINE_LENGTH} characters."
+        raise InvalidImportError(msg)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a stream of UTF-8 bytes into lines.
+
+    A leading byte order mark, as spreadsheet apps write, is dropped.
+
+    Raises:
+        InvalidImportError: Raised if a line is longer than 'MAX_LINE_LENGTH'
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            _check_length(len(line))
+            yield line.removesuffix("\r")
+        _check_length(len(pending))
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[list[str]]:
+    """Group lines into CSV records, which can span lines inside quotes.
+
+    Raises:
+        InvalidImportError: Raised if a record is longer than 'MAX_LINE_LENGTH'
+    """
+    record: list[str] = []
+    length = quotes = 0
+    async for line in lines:
+        record.append(line)
+        length += len(line) + 1
+        _check_length(length)
+        # Quotes are escaped by doubling them, so an odd count is an open quote
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            text = "\n".join(record)
+            record = []
+            length = quotes = 0
+            if text:
+                yield next(csv.reader([text]))
+    if record:
+        yield next(csv.reader(["\n".join(record)]))
+
+
+def validate_row(data: Any) -> ExpenseCreate | str:  # noqa: ANN401
+    """Validate a row as an expense, or get why it isn't one."""
+    try:
+        return ExpenseCreate.model_validate(data)
+    except ValidationError as e:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+def csv_row_to_expense(row: dict[str, str]) -> dict[str, Any]:
+    """Get the expense of a spreadsheet row."""
+    return {
+        "name": row["name"],
+        "description": row.get("description") or "",
+        "category": row["category"],
+        "expense_date": row["expense_date"],
+        "items": [
+            {
+                "name": row.get("item_name") or row["name"],
+                "quantity": row.get("quantity") or 1,
+                "price": row["price"],
+            }
+        ],
+        "splits": None,
+    }
+
+
+async def parse_csv(lines: AsyncIterator[str]) -> AsyncIterator[ImportRow]:
+    """Parse a CSV import with a header row.
+
+    Raises:
+        InvalidImportError: Raised if the header is missing a required column
+    """
+    records = iter_csv_records(lines)
+    header = await anext(records, None)
+    if header is None:
+        return
+    missing = CSV_REQUIRED_COLUMNS.difference(header)
+    if missing:
+        msg = f"The CSV header is missing the columns {sorted(missing)}."
+        raise InvalidImportError(msg)
+
+    row_number = 1
+    async for record in records:
+        row_number += 1
+        if len(record) != len(header):
+            yield row_number, f"Expected {len(header)} columns, got {len(record)}"
+            continue
+        yield row_number, validate_row(csv_row_to_expense(dict(zip(header, record, strict=True))))
+
+
+async def parse_ndjson(lines: AsyncIterator[str]) -> AsyncIterator[ImportRow]:
+    """Parse an NDJSON import, with an 'ExpenseCreate' on each line."""
+    row_number = 0
+    async for line in lines:
+        row_number += 1
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield row_number, "Invalid JSON"
+            continue
+        yield row_number, validate_row(data)
+
+
+def parse_import(chunks: AsyncIterator[bytes], media_type: str) -> AsyncIterator[ImportRow]:
+    """Parse the rows of a streamed import body.
+
+    Raises:
+        InvalidImportError: Raised if the media type isn't importable
+    """
+    if media_type == CSV_MEDIA_TYPE:
+        return parse_csv(iter_lines(chunks))
+    if media_type == NDJSON_MEDIA_TYPE:
+        return parse_ndjson(iter_lines(chunks))
+
+    msg = f"Unable to import '{media_type}', expected one of {IMPORT_MEDIA_TYPES}."
+    raise InvalidImportError(msg)
+
+
+async def iter_chunks(rows: AsyncIterator[ImportRow], size: int = IMPORT_CHUNK_SIZE) -> AsyncIterator[list[ImportRow]]:
+    """Group rows into chunks imported in a transaction each."""
+    chunk: list[ImportRow] = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -1,16 +1,22 @@
 """Expense db module."""
 
 import datetime as dt
+from decimal import Decimal
 from uuid import UUID, uuid4
 
+from sqlalchemy import BigInteger, ForeignKey, Index, Numeric
 from sqlalchemy import DateTime as SQLDatetime
-from sqlalchemy import ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from expenseflow.database.base import BaseDBModel
 from expenseflow.database.mixins import TimestampMixin
 from expenseflow.entity.models import EntityModel
 from expenseflow.enums import ExpenseCategory, ExpenseStatus
+from expenseflow.expense.money import (
+    PROPORTION_PRECISION,
+    PROPORTION_SCALE,
+    from_cents,
+)
 from expenseflow.user.models import UserModel
 
 
@@ -18,6 +24,22 @@ class ExpenseModel(BaseDBModel, TimestampMixin):
     """DB Model for expenses."""
 
     __tablename__ = "expense"
+    __table_args__ = (
+        # Listings are keyset paginated newest first, so the index returns a
+        # page already in order
+        Index(
+            "ix_expense_uploader_id_expense_date",
+            "uploader_id",
+            "expense_date",
+            "expense_id",
+        ),
+        Index(
+            "ix_expense_parent_id_expense_date",
+            "parent_id",
+            "expense_date",
+            "expense_id",
+        ),
+    )
 
     expense_id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     uploader_id: Mapped[UUID] = mapped_column(ForeignKey("user.user_id"))
@@ -28,20 +50,35 @@ class ExpenseModel(BaseDBModel, TimestampMixin):
     category: Mapped[ExpenseCategory]
     expense_date: Mapped[dt.datetime] = mapped_column(SQLDatetime(timezone=True))
 
-    # Relationships
+    # Denormalised from the items and splits by the services that write them
+    total_cents: Mapped[int] = mapped_column(BigInteger)
+    status: Mapped[ExpenseStatus]
+
+    # Relationships, loaded by each query as it needs, see 'expense_read_options'
     uploader: Mapped[UserModel] = relationship(
-        foreign_keys=[uploader_id], lazy="joined"
+        foreign_keys=[uploader_id], lazy="raise_on_sql"
+    )
+    parent: Mapped[EntityModel] = relationship(
+        foreign_keys=[parent_id], lazy="raise_on_sql"
     )
-    parent: Mapped[EntityModel] = relationship(foreign_keys=[parent_id], lazy="joined")
     items: Mapped[list["ExpenseItemModel"]] = relationship(
-        lazy="subquery", cascade="all, delete-orphan"
+        lazy="raise_on_sql", cascade="all, delete-orphan"
     )
 
+    @property
+    def expense_total(self) -> Decimal:
+        """Total cost of the expense."""
+        return from_cents(self.total_cents)
+
 
 class ExpenseItemModel(BaseDBModel, TimestampMixin):
     """Db model for items in an expense."""
 
     __tablename__ = "expense_item"
+    __table_args__ = (
+        # Joins from an expense to its splits don't need to visit the items
+        Index("ix_expense_item_expense_id", "expense_id", "expense_item_id"),
+    )
 
     expense_item_id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     expense_id: Mapped[UUID] = mapped_column(
@@ -49,29 +86,47 @@ class ExpenseItemModel(BaseDBModel, TimestampMixin):
     )
     name: Mapped[str]
     quantity: Mapped[int]
-    price: Mapped[float]
+    price_cents: Mapped[int] = mapped_column(BigInteger)
 
     # relationships
     splits: Mapped[list["ExpenseItemSplitModel"]] = relationship(
-        back_populates="item", lazy="joined", cascade="all, delete-orphan"
+        back_populates="item", lazy="raise_on_sql", cascade="all, delete-orphan"
     )
 
+    @property
+    def price(self) -> Decimal:
+        """Price of a single item."""
+        return from_cents(self.price_cents)
+
 
 class ExpenseItemSplitModel(BaseDBModel, TimestampMixin):
     """Db model for expense item split."""
 
     __tablename__ = "expense_item_split"
+    __table_args__ = (
+        # The primary key only serves lookups by item. Including the proportion
+        # and status lets totals and statuses of a user's splits be read from
+        # the index alone.
+        Index(
+            "ix_expense_item_split_user_id_expense_item_id",
+            "user_id",
+            "expense_item_id",
+            postgresql_include=["proportion", "status"],
+        ),
+    )
 
     expense_item_id: Mapped[UUID] = mapped_column(
         ForeignKey("expense_item.expense_item_id", ondelete="CASCADE"),
         primary_key=True,
     )
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user.user_id"), primary_key=True)
-    proportion: Mapped[float]
+    proportion: Mapped[Decimal] = mapped_column(
+        Numeric(PROPORTION_PRECISION, PROPORTION_SCALE)
+    )
 
     # Relationships
     item: Mapped[ExpenseItemModel] = relationship(back_populates="splits")
-    user: Mapped[UserModel] = relationship(lazy="joined")
+    user: Mapped[UserModel] = relationship(lazy="raise_on_sql")
     status: Mapped[ExpenseStatus]
 
     @property
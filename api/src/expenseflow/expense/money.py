@@ -0,0 +1,56 @@
+"""Fixed-point money and proportion handling.
+
+Prices are stored as integer cents and split proportions as numerics with
+'PROPORTION_SCALE' decimal places. The API still exchanges plain JSON numbers.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Annotated
+
+from pydantic import PlainSerializer
+
+CENT = Decimal("0.01")
+PROPORTION_PRECISION = 7
+PROPORTION_SCALE = 6
+PROPORTION_QUANTUM = Decimal(1).scaleb(-PROPORTION_SCALE)
+
+# Amounts are stored as cents in BIGINT columns
+MAX_CENTS = 2**63 - 1
+# Items stay well inside it, so only totals of many huge items can overflow
+MAX_PRICE = 10**9
+MAX_QUANTITY = 10**6
+
+# An exact amount that is still sent to clients as a JSON number
+Money = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
+
+def to_cents(amount: float | Decimal) -> int:
+    """Convert an amount to whole cents, rounding half cents up.
+
+    Raises:
+        ValueError: Raised if the amount isn't finite or its cents don't fit
+    """
+    # Going through 'str' keeps the decimal the client sent, e.g. 0.1 not 0.1000...
+    value = Decimal(str(amount))
+    if not value.is_finite() or abs(value) > from_cents(MAX_CENTS):
+        msg = f"Amount '{amount}' can't be stored in cents."
+        raise ValueError(msg)
+    return int(value.quantize(CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert whole cents to an amount."""
+    return Decimal(cents).scaleb(-2)
+
+
+def to_proportion(value: float | Decimal) -> Decimal:
+    """Round a proportion to the stored scale.
+
+    Raises:
+        ValueError: Raised if the value isn't a proportion between 0 and 1
+    """
+    proportion = Decimal(str(value))
+    if not proportion.is_finite() or not 0 <= proportion <= 1:
+        msg = f"Proportion '{value}' isn't between 0 and 1."
+        raise ValueError(msg)
+    return proportion.quantize(PROPORTION_QUANTUM, rounding=ROUND_HALF_UP)
@@ -3,36 +3,54 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from expenseflow.auth.deps import CurrentUser
-from expenseflow.database.deps import DbSession
+from expenseflow.auth.deps import Audited, CurrentUser
+from expenseflow.database.core import commit
+from expenseflow.database.deps import DbReadSession, DbSession, ReadSessionFactory
 from expenseflow.entity.service import get_entity
-from expenseflow.enums import ExpenseStatus
-from expenseflow.errors import ExpenseFlowError, NotFoundError, RoleError
+from expenseflow.enums import ExpenseStatus, ExportFormat
+from expenseflow.errors import (
+    ExpenseFlowError,
+    InvalidImportError,
+    NotFoundError,
+    RoleError,
+)
+from expenseflow.expense.exports import EXPORT_MEDIA_TYPES, stream_export
+from expenseflow.expense.imports import iter_chunks, parse_import
 from expenseflow.expense.models import ExpenseModel
 from expenseflow.expense.schemas import (
     ExpenseCreate,
+    ExpenseFilters,
+    ExpenseImportReport,
     ExpenseOverview,
     ExpenseRead,
+    ExpenseSummaryRead,
     SplitStatusInfo,
 )
 from expenseflow.expense.service import (
     create_expense,
+    expense_cursor_key,
     get_all_expenses,
     get_expense,
     get_expense_status_map,
+    get_expense_summaries,
     get_expenses_overview,
     get_uploaded_expenses,
     get_user_split_status,
+    import_expenses,
+    involves,
     update_expense,
     update_split_status,
+    uploaded_by,
 )
+from expenseflow.pagination import Cursor, OptionalPageLimit, fetch_limit, paginate
 
 r = router = APIRouter()
 
 
-@r.post("", response_model=ExpenseRead)
+@r.post("", response_model=ExpenseRead, dependencies=[Audited])
 async def create(
     db: DbSession,
     user: CurrentUser,
@@ -68,7 +86,49 @@ async def create(
         ) from e
 
 
-@r.put("/{expense_id}", response_model=ExpenseRead)
+@r.post("/import", dependencies=[Audited])
+async def bulk_import(
+    db: DbSession, user: CurrentUser, request: Request, parent_id: UUID | None = None
+) -> ExpenseImportReport:
+    """Import expenses from a streamed CSV or NDJSON body.
+
+    Rows are imported in chunks, each committed in its own transaction, and a
+    result is reported for every row. An import isn't idempotent - retrying one
+    that stopped part way through creates its committed rows again.
+    """
+    parent = user if parent_id is None else await get_entity(db, parent_id)
+    if parent is None:
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND,
+            detail=f"Parent under the id '{parent_id}' could not be found",
+        )
+
+    content_type = request.headers.get("content-type", "")
+    try:
+        rows = parse_import(request.stream(), content_type.partition(";")[0].strip())
+    except InvalidImportError as e:
+        raise HTTPException(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e)
+        ) from e
+
+    report = ExpenseImportReport(created=0, failed=0, results=[])
+    try:
+        async for chunk in iter_chunks(rows):
+            results = await import_expenses(db, user, chunk, parent)
+            await commit(db)
+            report.results.extend(results)
+    except InvalidImportError as e:
+        if not report.results:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        # Earlier chunks are committed, so they're reported rather than lost
+        report.error = e.message
+
+    report.failed = sum(result.error is not None for result in report.results)
+    report.created = len(report.results) - report.failed
+    return report
+
+
+@r.put("/{expense_id}", response_model=ExpenseRead, dependencies=[Audited])
 async def update(
     db: DbSession, user: CurrentUser, expense_id: UUID, expense_in: ExpenseCreate
 ) -> ExpenseModel:
@@ -95,25 +155,100 @@ async def update(
 
 
 @r.get("", response_model=list[ExpenseRead])
-async def get_uploaded_by_me(db: DbSession, user: CurrentUser) -> list[ExpenseModel]:
-    """Get expenses uploaded by me."""
-    return await get_uploaded_expenses(db, user)
+async def get_uploaded_by_me(  # noqa: PLR0913
+    db: DbReadSession,
+    user: CurrentUser,
+    response: Response,
+    filters: Annotated[ExpenseFilters, Depends()],
+    cursor: Cursor,
+    limit: OptionalPageLimit = None,
+) -> list[ExpenseModel]:
+    """Get expenses uploaded by me, newest first."""
+    expenses = await get_uploaded_expenses(
+        db, user, filters, limit=fetch_limit(limit), cursor=cursor
+    )
+    return paginate(response, expenses, limit, key=expense_cursor_key)
 
 
 @r.get("/all", response_model=list[ExpenseRead])
-async def get_all(db: DbSession, user: CurrentUser) -> list[ExpenseModel]:
-    """Get expenses uploaded by me."""
-    return await get_all_expenses(db, user)
+async def get_all(  # noqa: PLR0913
+    db: DbReadSession,
+    user: CurrentUser,
+    response: Response,
+    filters: Annotated[ExpenseFilters, Depends()],
+    cursor: Cursor,
+    limit: OptionalPageLimit = None,
+) -> list[ExpenseModel]:
+    """Get expenses I'm involved in, newest first."""
+    expenses = await get_all_expenses(
+        db, user, filters, limit=fetch_limit(limit), cursor=cursor
+    )
+    return paginate(response, expenses, limit, key=expense_cursor_key)
+
+
+@r.get("/summary")
+async def get_uploaded_by_me_summary(  # noqa: PLR0913
+    db: DbReadSession,
+    user: CurrentUser,
+    response: Response,
+    filters: Annotated[ExpenseFilters, Depends()],
+    cursor: Cursor,
+    limit: OptionalPageLimit = None,
+) -> list[ExpenseSummaryRead]:
+    """Get summaries of expenses uploaded by me, newest first."""
+    expenses = await get_expense_summaries(
+        db, uploaded_by(user), filters, limit=fetch_limit(limit), cursor=cursor
+    )
+    return paginate(response, expenses, limit, key=expense_cursor_key)
+
+
+@r.get("/all/summary")
+async def get_all_summary(  # noqa: PLR0913
+    db: DbReadSession,
+    user: CurrentUser,
+    response: Response,
+    filters: Annotated[ExpenseFilters, Depends()],
+    cursor: Cursor,
+    limit: OptionalPageLimit = None,
+) -> list[ExpenseSummaryRead]:
+    """Get summaries of expenses I'm involved in, newest first."""
+    expenses = await get_expense_summaries(
+        db, involves(user), filters, limit=fetch_limit(limit), cursor=cursor
+    )
+    return paginate(response, expenses, limit, key=expense_cursor_key)
+
+
+@r.get("/export", response_class=StreamingResponse)
+async def export(
+    session_factory: ReadSessionFactory,
+    user: CurrentUser,
+    filters: Annotated[ExpenseFilters, Depends()],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.csv,
+) -> StreamingResponse:
+    """Export expenses I'm involved in, with a row per split of each item.
+
+    The export opens its own read session as the response is sent, and streams
+    the rows from it as they're fetched.
+    """
+    return StreamingResponse(
+        stream_export(session_factory, user, export_format, filters),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="expenses.{export_format.value}"'
+            )
+        },
+    )
 
 
 @r.get("/overview", response_model=ExpenseOverview)
-async def get_overview(db: DbSession, user: CurrentUser) -> ExpenseOverview:
+async def get_overview(db: DbReadSession, user: CurrentUser) -> ExpenseOverview:
     """Get an overview of a user's expenses."""
     return await get_expenses_overview(db, user)
 
 
 @r.get("/{expense_id}", response_model=ExpenseRead)
-async def get(db: DbSession, user: CurrentUser, expense_id: UUID) -> ExpenseModel:
+async def get(db: DbReadSession, user: CurrentUser, expense_id: UUID) -> ExpenseModel:
     """Get expense."""
     expense = await get_expense(db, user, expense_id)
     if expense is None:
@@ -126,7 +261,7 @@ async def get(db: DbSession, user: CurrentUser, expense_id: UUID) -> ExpenseMode
 
 @r.get("/{expense_id}/my-status", response_model=ExpenseStatus)
 async def get_my_status(
-    db: DbSession, user: CurrentUser, expense_id: UUID
+    db: DbReadSession, user: CurrentUser, expense_id: UUID
 ) -> ExpenseStatus:
     """Get status of an expense."""
     expense = await get_expense(db, user, expense_id)
@@ -140,7 +275,7 @@ async def get_my_status(
 
 @r.get("/{expense_id}/all-status", response_model=list[SplitStatusInfo])
 async def get_expense_user_status(
-    db: DbSession, user: CurrentUser, expense_id: UUID
+    db: DbReadSession, user: CurrentUser, expense_id: UUID
 ) -> list[SplitStatusInfo]:
     """Get a map of all the users in an expense in their order status."""
     expense = await get_expense(db, user, expense_id)
@@ -158,7 +293,7 @@ async def get_expense_user_status(
     ]
 
 
-@r.put("/{expense_id}/status", response_model=ExpenseRead)
+@r.put("/{expense_id}/status", response_model=ExpenseRead, dependencies=[Audited])
 async def update_status(
     db: DbSession,
     user: CurrentUser,
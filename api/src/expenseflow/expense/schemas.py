@@ -3,10 +3,11 @@
 import datetime as dt
 from uuid import UUID
 
-from pydantic import computed_field
+from pydantic import Field, computed_field
 
 from expenseflow.entity.schemas import EntityRead
 from expenseflow.enums import EntityKind, ExpenseCategory, ExpenseStatus
+from expenseflow.expense.money import MAX_PRICE, MAX_QUANTITY, Money
 from expenseflow.schemas import ExpenseFlowBase
 from expenseflow.user.schemas import UserRead
 
@@ -27,6 +28,8 @@ class ExpenseRead(ExpenseFlowBase):
     description: str
     category: ExpenseCategory
     expense_date: dt.datetime
+    expense_total: Money
+    status: ExpenseStatus
 
     parent: EntityRead
     uploader: UserRead
@@ -37,23 +40,26 @@ class ExpenseRead(ExpenseFlowBase):
         """Return the kind of parent."""
         return self.parent.kind
 
-    @computed_field
-    def expense_total(self) -> float:
-        """Total cost of the expense."""
-        return sum(item.quantity * item.price for item in self.items)
 
-    @computed_field
-    def status(self) -> ExpenseStatus:
-        """Status of the expense."""
-        statuses = [split.status for item in self.items for split in item.splits]
+class ExpenseSummaryRead(ExpenseFlowBase):
+    """Expense read schema without the items."""
+
+    expense_id: UUID
+    name: str
+    category: ExpenseCategory
+    expense_date: dt.datetime
+    expense_total: Money
+    status: ExpenseStatus
 
-        lowest_status: ExpenseStatus = ExpenseStatus.paid
 
-        for status in statuses:
-            if status.ranking() < lowest_status.ranking():
-                lowest_status = status
+class ExpenseFilters(ExpenseFlowBase):
+    """Filters for expense listings."""
 
-        return lowest_status
+    since: dt.datetime | None = None
+    until: dt.datetime | None = None
+    category: ExpenseCategory | None = None
+    status: ExpenseStatus | None = None
+    parent_id: UUID | None = None
 
 
 class ExpenseCreate(ExpenseFlowBase):
@@ -73,7 +79,7 @@ class ExpenseItemRead(ExpenseFlowBase):
     expense_item_id: UUID
     name: str
     quantity: int
-    price: float
+    price: Money
     splits: list["ExpenseItemSplitRead"]
 
 
@@ -81,15 +87,15 @@ class ExpenseItemCreate(ExpenseFlowBase):
     """Create schema for expense items."""
 
     name: str
-    quantity: int
-    price: float
+    quantity: int = Field(ge=-MAX_QUANTITY, le=MAX_QUANTITY)
+    price: float = Field(allow_inf_nan=False, ge=-MAX_PRICE, le=MAX_PRICE)
 
 
 class ExpenseItemSplitCreate(ExpenseFlowBase):
     """Create schema for expense splitting."""
 
     user_id: UUID
-    proportion: float
+    proportion: float = Field(allow_inf_nan=False, ge=0, le=1)
 
 
 class ExpenseItemSplitRead(ExpenseFlowBase):
@@ -101,15 +107,36 @@ class ExpenseItemSplitRead(ExpenseFlowBase):
     status: ExpenseStatus
 
 
+class ExpenseImportResult(ExpenseFlowBase):
+    """Result of importing a row."""
+
+    row: int
+    expense_id: UUID | None = None
+    error: str | None = None
+
+
+class ExpenseImportReport(ExpenseFlowBase):
+    """Results of an expense import.
+
+    If the body turns out to be invalid part way through, 'error' is why, and
+    the results are of the rows before it, which were already imported.
+    """
+
+    created: int
+    failed: int
+    results: list[ExpenseImportResult]
+    error: str | None = None
+
+
 class ExpenseOverviewCategory(ExpenseFlowBase):
     """Expense overview category."""
 
     category: ExpenseCategory
-    total: float
+    total: Money
 
 
 class ExpenseOverview(ExpenseFlowBase):
     """Overview of a users expenses."""
 
-    total: float
+    total: Money
     categories: list[ExpenseOverviewCategory]
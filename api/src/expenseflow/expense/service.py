@@ -1,11 +1,34 @@
 """Expense services."""
 
-from uuid import UUID
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any
+from uuid import UUID, uuid4
 
 from loguru import logger
-from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy import (
+    ColumnElement,
+    ColumnExpressionArgument,
+    Exists,
+    Numeric,
+    Select,
+    cast,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.base import ExecutableOption
 
+from expenseflow.database.core import savepoint
 from expenseflow.entity.models import EntityModel
 from expenseflow.enums import ExpenseStatus
 from expenseflow.errors import (
@@ -14,19 +37,44 @@ from expenseflow.errors import (
     NotFoundError,
     RoleError,
 )
+from expenseflow.expense.imports import IMPORT_CHUNK_FAILED, ImportRow
 from expenseflow.expense.models import (
     ExpenseItemModel,
     ExpenseItemSplitModel,
     ExpenseModel,
 )
+from expenseflow.expense.money import (
+    MAX_CENTS,
+    PROPORTION_QUANTUM,
+    to_cents,
+    to_proportion,
+)
 from expenseflow.expense.schemas import (
     ExpenseCreate,
+    ExpenseFilters,
+    ExpenseImportResult,
     ExpenseItemCreate,
     ExpenseItemSplitCreate,
     ExpenseOverview,
     ExpenseOverviewCategory,
+    ExpenseSummaryRead,
 )
+from expenseflow.pagination import CursorKey
 from expenseflow.user.models import UserModel
+from expenseflow.user.service import get_users_by_ids
+
+
+def expense_read_options() -> tuple[ExecutableOption, ...]:
+    """Options loading everything 'ExpenseRead' serialises."""
+    # Collections are loaded with a query per level rather than joined, which
+    # would return a row for every split of every item of every expense
+    return (
+        joinedload(ExpenseModel.uploader),
+        joinedload(ExpenseModel.parent),
+        selectinload(ExpenseModel.items)
+        .selectinload(ExpenseItemModel.splits)
+        .joinedload(ExpenseItemSplitModel.user),
+    )
 
 
 async def create_expense(
@@ -39,21 +87,87 @@ async def create_expense(
     items: list[ExpenseItemModel] = await create_expense_items(
         session, creator, expense_in.items, expense_in.splits
     )
+    new_expense = build_expense(creator, expense_in, parent, items)
+
+    session.add(new_expense)
+    await session.flush()
+    await insert_expense_items(session, [(new_expense, items)])
+    return new_expense
+
 
-    new_expense = ExpenseModel(
+async def import_expenses(
+    session: AsyncSession,
+    creator: UserModel,
+    rows: list[ImportRow],
+    parent: EntityModel,
+) -> list[ExpenseImportResult]:
+    """Create the valid expenses of a chunk of imported rows.
+
+    Rows that aren't valid expenses, or whose splits aren't, are reported and
+    skipped. The rest are inserted together in a savepoint, with all of their
+    items and splits inserted in bulk. If the database rejects them, none of the
+    chunk's expenses are created and each of their rows is reported instead.
+    """
+    results: list[ExpenseImportResult] = []
+    new_expenses: list[tuple[ExpenseModel, list[ExpenseItemModel]]] = []
+    for row, expense_in in rows:
+        if isinstance(expense_in, str):
+            results.append(ExpenseImportResult(row=row, error=expense_in))
+            continue
+        try:
+            items = await create_expense_items(
+                session, creator, expense_in.items, expense_in.splits
+            )
+        except ExpenseFlowError as e:
+            results.append(ExpenseImportResult(row=row, error=e.message))
+            continue
+        except (ValueError, ArithmeticError) as e:
+            results.append(ExpenseImportResult(row=row, error=str(e)))
+            continue
+
+        new_expense = build_expense(creator, expense_in, parent, items)
+        new_expenses.append((new_expense, items))
+        results.append(ExpenseImportResult(row=row, expense_id=new_expense.expense_id))
+
+    try:
+        async with savepoint(session):
+            session.add_all(new_expense for new_expense, _ in new_expenses)
+            await session.flush()
+            await insert_expense_items(session, new_expenses)
+    except DBAPIError as e:
+        logger.warning(f"Unable to import a chunk of expenses: {e.orig}")
+        return [
+            (
+                result
+                if result.expense_id is None
+                else ExpenseImportResult(row=result.row, error=IMPORT_CHUNK_FAILED)
+            )
+            for result in results
+        ]
+    return results
+
+
+def build_expense(
+    creator: UserModel,
+    expense_in: ExpenseCreate,
+    parent: EntityModel,
+    items: list[ExpenseItemModel],
+) -> ExpenseModel:
+    """Build a new expense from its input and items, without adding the items."""
+    return ExpenseModel(
+        expense_id=uuid4(),
         name=expense_in.name,
         description=expense_in.description,
         category=expense_in.category,
         uploader=creator,
         expense_date=expense_in.expense_date,
+        total_cents=get_items_total_cents(items),
+        status=get_lowest_status(
+            split.status for item in items for split in item.splits
+        ),
         parent=parent,
-        items=items,
     )
 
-    session.add(new_expense)
-    await session.commit()
-    return new_expense
-
 
 async def update_expense(
     session: AsyncSession,
@@ -92,6 +206,10 @@ async def update_expense(
     expense.description = expense_in.description
     expense.category = expense_in.category
     expense.expense_date = expense_in.expense_date
+    expense.total_cents = get_items_total_cents(items)
+    expense.status = get_lowest_status(
+        split.status for item in items for split in item.splits
+    )
 
     # reset all splits to requested
     update_stmt = (
@@ -113,12 +231,8 @@ async def update_expense(
         )
     )
 
-    # attach new items
-    for item in items:
-        item.expense_id = expense.expense_id
-        session.add(item)  # Explicitly add
-
-    await session.commit()
+    await insert_expense_items(session, [(expense, items)])
+    await session.flush()
 
     return expense
 
@@ -138,70 +252,142 @@ async def create_expense_items(
         splits_in (list[ExpenseItemSplitCreate] | None): splits for the expense items
 
     Raises:
-        ExpenseFlowError: Raised if splits don't add up to 100%
+        ExpenseFlowError: Raised if splits don't add up to 100% or the total is too large
         NotFoundError: Raised if invalid user is specified in the split
 
     Returns:
         list[ExpenseItemModel]: newly created expense items
     """
-    return [
+    # Every item is split the same way
+    shares = await get_split_shares(session, splits_in, creator)
+
+    items = [
         ExpenseItemModel(
+            expense_item_id=uuid4(),
             name=item_in.name,
             quantity=item_in.quantity,
-            price=item_in.price,
-            splits=(await create_splits(session, splits_in, creator)),
+            price_cents=to_cents(item_in.price),
+            splits=create_splits(shares, creator),
         )
         for item_in in expense_items_in
     ]
+    if abs(get_items_total_cents(items)) > MAX_CENTS:
+        msg = "The expense total is too large to be stored."
+        raise ExpenseFlowError(msg)
+    return items
+
+
+async def insert_expense_items(
+    session: AsyncSession,
+    expense_items: list[tuple[ExpenseModel, list[ExpenseItemModel]]],
+) -> None:
+    """Insert expenses' new items and their splits in bulk.
+
+    The rows are inserted with one bulk INSERT per table rather than by the unit
+    of work, which tracks every object and fetches back their timestamps. The
+    models are then set as each expense's loaded items, so it can be returned
+    without being reloaded.
+
+    Args:
+        session (AsyncSession): db session
+        expense_items (list[tuple[ExpenseModel, list[ExpenseItemModel]]]): each
+            expense and its items from 'create_expense_items'
+    """
+    item_rows: list[dict[str, Any]] = []
+    split_rows: list[dict[str, Any]] = []
+    for expense, items in expense_items:
+        for item in items:
+            item.expense_id = expense.expense_id
+            item_rows.append(
+                {
+                    "expense_item_id": item.expense_item_id,
+                    "expense_id": item.expense_id,
+                    "name": item.name,
+                    "quantity": item.quantity,
+                    "price_cents": item.price_cents,
+                }
+            )
+            for split in item.splits:
+                split.expense_item_id = item.expense_item_id
+                split_rows.append(
+                    {
+                        "expense_item_id": split.expense_item_id,
+                        "user_id": split.user_id,
+                        "proportion": split.proportion,
+                        "status": split.status,
+                    }
+                )
+        set_committed_value(expense, "items", items)
 
+    if item_rows:
+        await session.execute(insert(ExpenseItemModel), item_rows)
+    if split_rows:
+        await session.execute(insert(ExpenseItemSplitModel), split_rows)
 
-async def create_splits(
+
+async def get_split_shares(
     session: AsyncSession,
     splits_in: list[ExpenseItemSplitCreate] | None,
     creator: UserModel,
-) -> list[ExpenseItemSplitModel]:
-    """Create splits from input."""
-    splits: list[ExpenseItemSplitModel] = []
-
-    if splits_in is not None and splits_in != []:
-
-        user_ids = [split.user_id for split in splits_in]
-        if len(user_ids) != len(set(user_ids)):
-            msg = "A user_id is duplicated in splits"
-            raise ExpenseFlowError(msg)
-
-        # Expense splits must sum to 100%
-        proportion_sum = sum([split.proportion for split in splits_in])
-        if proportion_sum != 1:
-            msg = f"Splits do not add up to 1, instead '{proportion_sum}'."
-            logger.info(msg)
-            raise ExpenseFlowError(msg)
-        for split_create in splits_in:
-            split_user = await session.get(UserModel, split_create.user_id)
-            if split_user is None:
-                raise NotFoundError(split_create.user_id, "user")
-            splits.append(
-                ExpenseItemSplitModel(
-                    user=split_user,
-                    proportion=split_create.proportion,
-                    # If the creator is splitting, they've already paid for it
-                    status=(
-                        ExpenseStatus.paid
-                        if split_user.user_id == creator.user_id
-                        else ExpenseStatus.requested
-                    ),
-                )
-            )
-    else:
-        splits = [
-            ExpenseItemSplitModel(
-                user=creator,
-                proportion=1.0,
-                status=ExpenseStatus.paid,  # Creator has paid for it
-            )
-        ]
+) -> list[tuple[UserModel, Decimal]]:
+    """Validate splits and resolve their users, once for all of an expense's items.
+
+    Raises:
+        ExpenseFlowError: Raised if a user is duplicated or splits don't add up to 1
+        NotFoundError: Raised if invalid user is specified in the split
 
-    return splits
+    Returns:
+        list[tuple[UserModel, Decimal]]: each split's user and proportion
+    """
+    if splits_in is None or splits_in == []:
+        return [(creator, Decimal(1))]
+
+    user_ids = [split.user_id for split in splits_in]
+    if len(user_ids) != len(set(user_ids)):
+        msg = "A user_id is duplicated in splits"
+        raise ExpenseFlowError(msg)
+
+    # Expense splits must sum to 100%, allowing for rounding each proportion
+    # to the stored scale, e.g. three splits of 1/3
+    proportions = [to_proportion(split.proportion) for split in splits_in]
+    proportion_sum = sum(proportions, Decimal(0))
+    if abs(proportion_sum - 1) > PROPORTION_QUANTUM * len(proportions) / 2:
+        msg = f"Splits do not add up to 1, instead '{proportion_sum}'."
+        logger.info(msg)
+        raise ExpenseFlowError(msg)
+
+    # The last split takes the rounding remainder so they add up exactly
+    proportions[-1] += 1 - proportion_sum
+
+    users = await get_users_by_ids(session, user_ids)
+    for user_id in user_ids:
+        if user_id not in users:
+            raise NotFoundError(user_id, "user")
+
+    return [
+        (users[user_id], proportion)
+        for user_id, proportion in zip(user_ids, proportions, strict=True)
+    ]
+
+
+def create_splits(
+    shares: list[tuple[UserModel, Decimal]], creator: UserModel
+) -> list[ExpenseItemSplitModel]:
+    """Create an item's splits from the expense's split shares."""
+    return [
+        ExpenseItemSplitModel(
+            user_id=user.user_id,
+            user=user,
+            proportion=proportion,
+            # If the creator is splitting, they've already paid for it
+            status=(
+                ExpenseStatus.paid
+                if user.user_id == creator.user_id
+                else ExpenseStatus.requested
+            ),
+        )
+        for user, proportion in shares
+    ]
 
 
 async def update_split_status(
@@ -234,6 +420,40 @@ async def update_split_status(
     )
 
     await session.execute(update_stmt)
+    await refresh_expense_status(session, expense)
+
+
+async def refresh_expense_status(session: AsyncSession, expense: ExpenseModel) -> None:
+    """Store the lowest status of an expense's splits on the expense."""
+    # Postgres orders enum values as they're declared, the same as their ranking
+    expense_id = expense.expense_id
+    stmt = lambda_stmt(
+        lambda: select(func.min(ExpenseItemSplitModel.status))
+        .join(
+            ExpenseItemModel,
+            ExpenseItemModel.expense_item_id == ExpenseItemSplitModel.expense_item_id,
+        )
+        .where(ExpenseItemModel.expense_id == expense_id)
+    )
+
+    lowest_status = (await session.execute(stmt)).scalar_one()
+    expense.status = lowest_status or ExpenseStatus.paid
+    await session.flush()
+
+
+def get_items_total_cents(items: Iterable[ExpenseItemModel]) -> int:
+    """Get the total cost of expense items in cents."""
+    return sum(item.quantity * item.price_cents for item in items)
+
+
+def get_lowest_status(statuses: Iterable[ExpenseStatus]) -> ExpenseStatus:
+    """Get the lowest ranked of the statuses, paid if there are none."""
+    lowest_status: ExpenseStatus = ExpenseStatus.paid
+    for status in statuses:
+        if status.ranking() < lowest_status.ranking():
+            lowest_status = status
+
+    return lowest_status
 
 
 def is_valid_expense_change(
@@ -283,15 +503,15 @@ async def get_user_split_status(
     session: AsyncSession, expense: ExpenseModel, user: UserModel
 ) -> ExpenseStatus:
     """Get current status of a users split."""
-    stmt = (
-        select(ExpenseItemSplitModel.status)
+    expense_id, user_id = expense.expense_id, user.user_id
+    stmt = lambda_stmt(
+        lambda: select(ExpenseItemSplitModel.status)
         .join(
             ExpenseItemModel,
             ExpenseItemModel.expense_item_id == ExpenseItemSplitModel.expense_item_id,
         )
-        .join(ExpenseModel, ExpenseModel.expense_id == ExpenseItemModel.expense_id)
-        .where(ExpenseModel.expense_id == expense.expense_id)
-        .where(ExpenseItemSplitModel.user_id == user.user_id)
+        .where(ExpenseItemModel.expense_id == expense_id)
+        .where(ExpenseItemSplitModel.user_id == user_id)
     )
 
     statuses = (await session.execute(stmt)).scalars().all()
@@ -320,15 +540,15 @@ async def get_split_users(
     session: AsyncSession, expense: ExpenseModel
 ) -> list[UserModel]:
     """Get the users an expense is split with."""
-    stmt = (
-        select(UserModel)
+    expense_id = expense.expense_id
+    stmt = lambda_stmt(
+        lambda: select(UserModel)
         .join(ExpenseItemSplitModel, ExpenseItemSplitModel.user_id == UserModel.user_id)
         .join(
             ExpenseItemModel,
             ExpenseItemModel.expense_item_id == ExpenseItemSplitModel.expense_item_id,
         )
-        .join(ExpenseModel, ExpenseModel.expense_id == ExpenseItemModel.expense_id)
-        .where(ExpenseModel.expense_id == expense.expense_id)
+        .where(ExpenseItemModel.expense_id == expense_id)
         .distinct()
     )
     return list((await session.execute(stmt)).scalars().all())
@@ -338,39 +558,12 @@ async def get_expense_status(
     session: AsyncSession, expense: ExpenseModel
 ) -> ExpenseStatus:
     """Get the status of an expense."""
-    stmt = (
-        select(ExpenseItemSplitModel.status)
-        .join(
-            ExpenseItemModel,
-            ExpenseItemModel.expense_item_id == ExpenseItemSplitModel.expense_item_id,
-        )
-        .join(ExpenseModel, ExpenseModel.expense_id == ExpenseItemModel.expense_id)
-        .where(ExpenseModel.expense_id == expense.expense_id)
+    expense_id = expense.expense_id
+    stmt = lambda_stmt(
+        lambda: select(ExpenseModel.status).where(ExpenseModel.expense_id == expense_id)
     )
 
-    statuses: list[ExpenseStatus] = list((await session.execute(stmt)).scalars().all())
-
-    lowest_status: ExpenseStatus = ExpenseStatus.paid
-    for status in statuses:
-        if status.ranking() < lowest_status.ranking():
-            lowest_status = status
-
-    return lowest_status
-
-
-async def get_uploaded_expenses(
-    session: AsyncSession, uploader: UserModel
-) -> list[ExpenseModel]:
-    """Get all expenses someone has uploaded."""
-    return list(
-        (
-            await session.execute(
-                select(ExpenseModel).where(ExpenseModel.uploader_id == uploader.user_id)
-            )
-        )
-        .scalars()
-        .all()
-    )
+    return (await session.execute(stmt)).scalar_one()
 
 
 async def get_expense_status_map(
@@ -395,26 +588,118 @@ async def get_expense_status_map(
     return dict([row.tuple() for row in splits])
 
 
+async def get_uploaded_expenses(
+    session: AsyncSession,
+    uploader: UserModel,
+    filters: ExpenseFilters | None = None,
+    *,
+    limit: int | None = None,
+    cursor: CursorKey | None = None,
+) -> list[ExpenseModel]:
+    """Get all expenses someone has uploaded, newest first."""
+    return await get_expenses(
+        session, uploaded_by(uploader), filters, limit=limit, cursor=cursor
+    )
+
+
 async def get_owned_expenses(
-    session: AsyncSession, parent: EntityModel
+    session: AsyncSession,
+    parent: EntityModel,
+    filters: ExpenseFilters | None = None,
+    *,
+    limit: int | None = None,
+    cursor: CursorKey | None = None,
 ) -> list[ExpenseModel]:
-    """Get all expenses owned by someone."""
-    return list(
-        (
-            await session.execute(
-                select(ExpenseModel).where(ExpenseModel.parent_id == parent.entity_id)
-            )
-        )
-        .scalars()
-        .all()
+    """Get all expenses owned by someone, newest first."""
+    return await get_expenses(
+        session, owned_by(parent), filters, limit=limit, cursor=cursor
     )
 
 
 async def get_all_expenses(
-    session: AsyncSession, user: UserModel
+    session: AsyncSession,
+    user: UserModel,
+    filters: ExpenseFilters | None = None,
+    *,
+    limit: int | None = None,
+    cursor: CursorKey | None = None,
+) -> list[ExpenseModel]:
+    """Gets all expenses that a user is involved in, newest first."""
+    return await get_expenses(
+        session, involves(user), filters, limit=limit, cursor=cursor
+    )
+
+
+async def get_expenses(
+    session: AsyncSession,
+    criteria: ColumnElement[bool],
+    filters: ExpenseFilters | None = None,
+    *,
+    limit: int | None = None,
+    cursor: CursorKey | None = None,
 ) -> list[ExpenseModel]:
-    """Gets all expenses that a user is involved in."""
-    exists_in_split_q = (
+    """Get the expenses matching the criteria, newest first."""
+    stmt = list_expenses(
+        select(ExpenseModel).where(criteria).options(*expense_read_options()),
+        filters,
+        limit=limit,
+        cursor=cursor,
+    )
+
+    return list((await session.execute(stmt)).scalars().all())
+
+
+def list_expenses[S: Select](
+    stmt: S,
+    filters: ExpenseFilters | None = None,
+    *,
+    limit: int | None = None,
+    cursor: CursorKey | None = None,
+) -> S:
+    """Filter, order and page an expense listing, newest first."""
+    stmt = stmt.order_by(
+        ExpenseModel.expense_date.desc(), ExpenseModel.expense_id.desc()
+    )
+
+    if cursor is not None:
+        stmt = stmt.where(
+            tuple_(ExpenseModel.expense_date, ExpenseModel.expense_id) < cursor
+        )
+    if filters is not None:
+        if filters.since is not None:
+            stmt = stmt.where(ExpenseModel.expense_date >= filters.since)
+        if filters.until is not None:
+            stmt = stmt.where(ExpenseModel.expense_date < filters.until)
+        if filters.category is not None:
+            stmt = stmt.where(ExpenseModel.category == filters.category)
+        if filters.status is not None:
+            stmt = stmt.where(ExpenseModel.status == filters.status)
+        if filters.parent_id is not None:
+            stmt = stmt.where(ExpenseModel.parent_id == filters.parent_id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    return stmt
+
+
+def expense_cursor_key(expense: ExpenseModel | ExpenseSummaryRead) -> CursorKey:
+    """Sort key of an expense in listings."""
+    return expense.expense_date, expense.expense_id
+
+
+def uploaded_by(uploader: UserModel) -> ColumnElement[bool]:
+    """Criteria for expenses someone has uploaded."""
+    return ExpenseModel.uploader_id == uploader.user_id
+
+
+def owned_by(parent: EntityModel) -> ColumnElement[bool]:
+    """Criteria for expenses owned by someone."""
+    return ExpenseModel.parent_id == parent.entity_id
+
+
+def split_with(user: UserModel) -> Exists:
+    """Criteria for expenses with an item split with a user."""
+    return (
         select(1)
         .select_from(ExpenseItemModel)
         .join(
@@ -427,60 +712,115 @@ async def get_all_expenses(
         .exists()
     )
 
-    stmt = select(ExpenseModel).where(
-        or_(
-            ExpenseModel.uploader_id == user.user_id,
-            exists_in_split_q,
-        )
+
+def involves(user: UserModel) -> ColumnElement[bool]:
+    """Criteria for expenses a user has uploaded or is split with."""
+    return or_(uploaded_by(user), split_with(user))
+
+
+async def get_expense_summaries(
+    session: AsyncSession,
+    criteria: ColumnElement[bool],
+    filters: ExpenseFilters | None = None,
+    *,
+    limit: int | None = None,
+    cursor: CursorKey | None = None,
+) -> list[ExpenseSummaryRead]:
+    """Get summaries of the expenses matching the criteria, without their items."""
+    stmt = list_expenses(
+        select(
+            ExpenseModel.expense_id,
+            ExpenseModel.name,
+            ExpenseModel.category,
+            ExpenseModel.expense_date,
+            to_amount(ExpenseModel.total_cents).label("expense_total"),
+            ExpenseModel.status,
+        ).where(criteria),
+        filters,
+        limit=limit,
+        cursor=cursor,
     )
 
-    return list((await session.execute(stmt)).scalars().all())
+    return [
+        ExpenseSummaryRead.model_validate(row)
+        for row in (await session.execute(stmt)).all()
+    ]
 
 
 async def get_expense(
     session: AsyncSession, user: UserModel, expense_id: UUID
 ) -> ExpenseModel | None:
     """Get a expense with a given 'id'. Expense must be owned, uploaded or split with the user."""
-    exists_in_split_q = (
-        select(1)
-        .select_from(ExpenseItemModel)
-        .join(
-            ExpenseItemSplitModel,
-            ExpenseItemModel.expense_item_id == ExpenseItemSplitModel.expense_item_id,
+    user_id, entity_id = user.user_id, user.entity_id
+    stmt = lambda_stmt(
+        lambda: select(ExpenseModel)
+        .where(ExpenseModel.expense_id == expense_id)
+        .where(
+            or_(
+                ExpenseModel.uploader_id == user_id,
+                ExpenseModel.parent_id == entity_id,
+                select(1)
+                .select_from(ExpenseItemModel)
+                .join(
+                    ExpenseItemSplitModel,
+                    ExpenseItemModel.expense_item_id
+                    == ExpenseItemSplitModel.expense_item_id,
+                )
+                .where(ExpenseItemModel.expense_id == expense_id)
+                .where(ExpenseItemSplitModel.user_id == user_id)
+                .exists(),
+            )
         )
-        .where(ExpenseItemModel.expense_id == expense_id)
-        .where(ExpenseItemSplitModel.user_id == user.user_id)
-        .exists()
+        .options(*expense_read_options())
     )
 
+    return (await session.execute(stmt)).scalar_one_or_none()
+
+
+def _owed_cents() -> ColumnElement[Decimal]:
+    """A split's share of its item's cost, in fractional cents."""
+    return (
+        ExpenseItemSplitModel.proportion
+        * ExpenseItemModel.price_cents
+        * ExpenseItemModel.quantity
+    )
+
+
+def to_amount(cents: ColumnExpressionArgument[Any]) -> ColumnElement[Decimal]:
+    """Convert cents to an amount, rounded to the nearest cent by the database."""
+    return cast(func.coalesce(cents, 0) / 100, Numeric(14, 2))
+
+
+async def get_owed_amounts(
+    session: AsyncSession, user: UserModel, expenses: list[ExpenseModel]
+) -> dict[UUID, Decimal]:
+    """Get how much a user's splits of each expense cost."""
     stmt = (
-        select(ExpenseModel)
-        .where(ExpenseModel.expense_id == expense_id)
+        select(ExpenseItemModel.expense_id, to_amount(func.sum(_owed_cents())))
+        .select_from(ExpenseItemSplitModel)
+        .join(
+            ExpenseItemModel,
+            ExpenseItemModel.expense_item_id == ExpenseItemSplitModel.expense_item_id,
+        )
+        .where(ExpenseItemSplitModel.user_id == user.user_id)
         .where(
-            or_(
-                ExpenseModel.uploader_id == user.user_id,
-                ExpenseModel.parent_id == user.entity_id,
-                exists_in_split_q,
+            ExpenseItemModel.expense_id.in_(
+                [expense.expense_id for expense in expenses]
             )
         )
+        .group_by(ExpenseItemModel.expense_id)
     )
 
-    return (await session.execute(stmt)).scalar_one_or_none()
+    return dict((await session.execute(stmt)).tuples().all())
 
 
 async def get_expenses_overview(
-    session: AsyncSession, user: UserModel
+    session: AsyncSession, user: UserModel, parent: EntityModel | None = None
 ) -> ExpenseOverview:
-    """Get an overview of a user's expenses."""
+    """Get an overview of a user's expenses, optionally only those owned by 'parent'."""
+    # The rollup adds the overall total as a row without a category
     categories_query = (
-        select(
-            ExpenseModel.category,
-            func.sum(
-                ExpenseItemModel.price
-                * ExpenseItemModel.quantity
-                * ExpenseItemSplitModel.proportion
-            ).label("category_total"),
-        )
+        select(ExpenseModel.category, to_amount(func.sum(_owed_cents())))
         .select_from(ExpenseItemSplitModel)
         .join(
             ExpenseItemModel,
@@ -488,16 +828,19 @@ async def get_expenses_overview(
         )
         .join(ExpenseModel, ExpenseModel.expense_id == ExpenseItemModel.expense_id)
         .where(ExpenseItemSplitModel.user_id == user.user_id)
-        .group_by(ExpenseModel.category)
+        .group_by(func.rollup(ExpenseModel.category))
     )
+    if parent is not None:
+        categories_query = categories_query.where(
+            ExpenseModel.parent_id == parent.entity_id
+        )
 
-    rows = (await session.execute(categories_query)).all()
-
-    categories = [
-        ExpenseOverviewCategory(category=category, total=round(total, 2))
-        for category, total in rows
-    ]
-
-    overall_total = round(sum(cat.total for cat in categories), 2)
+    overall_total = Decimal(0)
+    categories: list[ExpenseOverviewCategory] = []
+    for category, total in (await session.execute(categories_query)).tuples():
+        if category is None:
+            overall_total = total
+        else:
+            categories.append(ExpenseOverviewCategory(category=category, total=total))
 
     return ExpenseOverview(total=overall_total, categories=categories)
@@ -2,7 +2,7 @@
 
 from uuid import uuid4
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from expenseflow.database.base import BaseDBModel
@@ -15,6 +15,11 @@ class FriendModel(BaseDBModel, TimestampMixin):
     """DB Model for friends."""
 
     __tablename__ = "friend"
+    __table_args__ = (
+        # Requests are looked up from either side, filtered by status
+        Index("ix_friend_sender_id_status", "sender_id", "status"),
+        Index("ix_friend_receiver_id_status", "receiver_id", "status"),
+    )
 
     sender_id: Mapped[UserModel] = mapped_column(
         ForeignKey("user.user_id", ondelete="CASCADE"), primary_key=True, default=uuid4
@@ -1,23 +1,33 @@
 """Friend routes."""
 
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from expenseflow.auth.deps import CurrentUser
-from expenseflow.database.deps import DbSession
+from expenseflow.auth.deps import Audited, CurrentUser
+from expenseflow.database.deps import DbReadSession, DbSession
 from expenseflow.expense.models import ExpenseModel
-from expenseflow.expense.schemas import ExpenseRead
+from expenseflow.expense.schemas import (
+    ExpenseFilters,
+    ExpenseRead,
+    ExpenseSummaryRead,
+)
+from expenseflow.expense.service import expense_cursor_key, get_expense_summaries
 from expenseflow.friend.models import FriendModel
 from expenseflow.friend.schemas import FriendRead
 from expenseflow.friend.service import (
     create_accept_friend_request,
+    get_friend,
     get_friend_expenses,
     get_friends,
     get_received_friend_requests,
     get_sent_friend_requests,
     remove_friend,
+    shared_with,
 )
+from expenseflow.pagination import Cursor, OptionalPageLimit, fetch_limit, paginate
 from expenseflow.user.models import UserModel
 from expenseflow.user.schemas import UserRead
 from expenseflow.user.service import get_user_by_id, get_user_by_nickname
@@ -25,15 +35,28 @@ from expenseflow.user.service import get_user_by_id, get_user_by_nickname
 r = router = APIRouter()
 
 
+async def get_friend_or_404(
+    db: AsyncSession, user: UserModel, user_id: UUID
+) -> UserModel:
+    """Get one of the user's friends, or a 404 if they aren't friends."""
+    friend = await get_friend(db, user, user_id)
+    if friend is None:
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND,
+            detail=f"User under the id '{user_id}' could not be found",
+        )
+    return friend
+
+
 @r.get("", response_model=list[UserRead])
-async def friends(db: DbSession, user: CurrentUser) -> list[UserModel]:
+async def friends(db: DbReadSession, user: CurrentUser) -> list[UserModel]:
     """Get my friends."""
     return await get_friends(db, user)
 
 
 @r.get("/requests", response_model=list[UserRead])
 async def get_requests(
-    db: DbSession, user: CurrentUser, sent: bool  # noqa: FBT001
+    db: DbReadSession, user: CurrentUser, sent: bool  # noqa: FBT001
 ) -> list[UserModel]:
     """Get incoming friend requests."""
     if sent:
@@ -43,35 +66,52 @@ async def get_requests(
 
 
 @r.get("/{user_id}", response_model=UserRead)
-async def get(db: DbSession, user: CurrentUser, user_id: UUID) -> UserModel:
+async def get(db: DbReadSession, user: CurrentUser, user_id: UUID) -> UserModel:
     """Get friend by id."""
-    other_user = await get_user_by_id(db, user_id)
-    my_friends = await get_friends(db, user)
-    if other_user is None or other_user.user_id not in [f.user_id for f in my_friends]:
-        raise HTTPException(
-            status.HTTP_404_NOT_FOUND,
-            detail=f"User under the id '{user_id}' could not be found",
-        )
-    return other_user
+    return await get_friend_or_404(db, user, user_id)
 
 
 @r.get("/{user_id}/expenses", response_model=list[ExpenseRead])
-async def get_expenses(
-    db: DbSession, user: CurrentUser, user_id: UUID
+async def get_expenses(  # noqa: PLR0913
+    db: DbReadSession,
+    user: CurrentUser,
+    user_id: UUID,
+    response: Response,
+    filters: Annotated[ExpenseFilters, Depends()],
+    cursor: Cursor,
+    limit: OptionalPageLimit = None,
 ) -> list[ExpenseModel]:
-    """Get friend expenses."""
-    other_user = await get_user_by_id(db, user_id)
-    my_friends = await get_friends(db, user)
-    if other_user is None or other_user.user_id not in [f.user_id for f in my_friends]:
-        raise HTTPException(
-            status.HTTP_404_NOT_FOUND,
-            detail=f"User under the id '{user_id}' could not be found",
-        )
-
-    return await get_friend_expenses(db, user, other_user)
-
-
-@r.put("", response_model=FriendRead)
+    """Get friend expenses, newest first."""
+    other_user = await get_friend_or_404(db, user, user_id)
+    expenses = await get_friend_expenses(
+        db, user, other_user, filters, limit=fetch_limit(limit), cursor=cursor
+    )
+    return paginate(response, expenses, limit, key=expense_cursor_key)
+
+
+@r.get("/{user_id}/expenses/summary")
+async def get_expenses_summary(  # noqa: PLR0913
+    db: DbReadSession,
+    user: CurrentUser,
+    user_id: UUID,
+    response: Response,
+    filters: Annotated[ExpenseFilters, Depends()],
+    cursor: Cursor,
+    limit: OptionalPageLimit = None,
+) -> list[ExpenseSummaryRead]:
+    """Get summaries of friend expenses, newest first."""
+    other_user = await get_friend_or_404(db, user, user_id)
+    expenses = await get_expense_summaries(
+        db,
+        shared_with(user, other_user),
+        filters,
+        limit=fetch_limit(limit),
+        cursor=cursor,
+    )
+    return paginate(response, expenses, limit, key=expense_cursor_key)
+
+
+@r.put("", response_model=FriendRead, dependencies=[Audited])
 async def create_w_nickname(
     db: DbSession, user: CurrentUser, nickname: str
 ) -> FriendModel:
@@ -85,7 +125,7 @@ async def create_w_nickname(
     return await create_accept_friend_request(db, user, other_user)
 
 
-@r.put("/{user_id}", response_model=FriendRead)
+@r.put("/{user_id}", response_model=FriendRead, dependencies=[Audited])
 async def create(db: DbSession, user: CurrentUser, user_id: UUID) -> FriendModel:
     """Creates or Updates Friend Request."""
     other_user = await get_user_by_id(db, user_id)
@@ -97,7 +137,7 @@ async def create(db: DbSession, user: CurrentUser, user_id: UUID) -> FriendModel
     return await create_accept_friend_request(db, user, other_user)
 
 
-@r.delete("/{user_id}")
+@r.delete("/{user_id}", dependencies=[Audited])
 async def delete(db: DbSession, current_user: CurrentUser, user_id: UUID) -> None:
     """Deletes or cancels a friend/friend request."""
     other_user = await get_user_by_id(db, user_id)
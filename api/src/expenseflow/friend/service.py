@@ -1,16 +1,22 @@
 """Friend services."""
 
-from sqlalchemy import and_, or_, select
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from expenseflow.enums import FriendStatus
 from expenseflow.errors import ExpenseFlowError
-from expenseflow.expense.models import (
-    ExpenseItemModel,
-    ExpenseItemSplitModel,
-    ExpenseModel,
+from expenseflow.expense.models import ExpenseModel
+from expenseflow.expense.schemas import ExpenseFilters
+from expenseflow.expense.service import (
+    get_expenses,
+    owned_by,
+    split_with,
+    uploaded_by,
 )
 from expenseflow.friend.models import FriendModel
+from expenseflow.pagination import CursorKey
 from expenseflow.user.models import UserModel
 
 
@@ -39,43 +45,41 @@ async def get_friends(session: AsyncSession, user: UserModel) -> list[UserModel]
     ]
 
 
-async def get_friend_expenses(
-    session: AsyncSession, user: UserModel, friend: UserModel
+async def get_friend(
+    session: AsyncSession, user: UserModel, friend_id: UUID
+) -> UserModel | None:
+    """Get one of a user's friends by id, None if they aren't friends."""
+    friends = await get_friends(session, user)
+    return next((friend for friend in friends if friend.user_id == friend_id), None)
+
+
+async def get_friend_expenses(  # noqa: PLR0913
+    session: AsyncSession,
+    user: UserModel,
+    friend: UserModel,
+    filters: ExpenseFilters | None = None,
+    *,
+    limit: int | None = None,
+    cursor: CursorKey | None = None,
 ) -> list[ExpenseModel]:
-    """Get a user's expenses with a friend."""
-    u_id = user.user_id
-    f_id = friend.user_id
-
-    stmt = (
-        select(ExpenseModel)
-        .join(ExpenseItemModel, ExpenseItemModel.expense_id == ExpenseModel.expense_id)
-        .join(
-            ExpenseItemSplitModel,
-            ExpenseItemSplitModel.expense_item_id == ExpenseItemModel.expense_item_id,
-        )
-        .where(
-            or_(
-                and_(
-                    or_(
-                        ExpenseModel.uploader_id == u_id,
-                        ExpenseModel.parent_id == user.entity_id,
-                    ),
-                    ExpenseItemSplitModel.user_id == f_id,  # friend is in the split
-                ),
-                and_(
-                    or_(
-                        ExpenseModel.uploader_id == f_id,
-                        ExpenseModel.parent_id == friend.entity_id,
-                    ),
-                    ExpenseItemSplitModel.user_id == u_id,  # user is in the split
-                ),
-            )
-        )
-        .distinct()
+    """Get a user's expenses with a friend, newest first."""
+    return await get_expenses(
+        session, shared_with(user, friend), filters, limit=limit, cursor=cursor
     )
 
-    result = await session.execute(stmt)
-    return list(result.scalars().all())
+
+def shared_with(user: UserModel, friend: UserModel) -> ColumnElement[bool]:
+    """Criteria for expenses of either user that are split with the other."""
+    return or_(
+        and_(
+            or_(uploaded_by(user), owned_by(user)),
+            split_with(friend),  # friend is in the split
+        ),
+        and_(
+            or_(uploaded_by(friend), owned_by(friend)),
+            split_with(user),  # user is in the split
+        ),
+    )
 
 
 async def get_received_friend_requests(
@@ -143,7 +147,7 @@ async def create_accept_friend_request(
     if existing_request is None:
         friend_request = FriendModel(sender=sender, receiver=receiver)
         session.add(friend_request)
-        await session.commit()
+        await session.flush()
         return friend_request
 
     # Already accepted or already sent
@@ -154,7 +158,7 @@ async def create_accept_friend_request(
         return existing_request
 
     existing_request.status = FriendStatus.accepted
-    await session.commit()
+    await session.flush()
     return existing_request
 
 
@@ -183,5 +187,5 @@ async def remove_friend(
         return None
 
     await session.delete(existing_request)
-    await session.commit()
+    await session.flush()
     return existing_request
@@ -1,16 +1,26 @@
 """Group routes."""
 
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from expenseflow.auth.deps import CurrentUser
-from expenseflow.database.deps import DbSession
+from expenseflow.auth.deps import Audited, CurrentUser
+from expenseflow.database.deps import DbReadSession, DbSession
 from expenseflow.enums import GroupRole
 from expenseflow.errors import ExistsError, RoleError
 from expenseflow.expense.models import ExpenseModel
-from expenseflow.expense.schemas import ExpenseRead
-from expenseflow.expense.service import get_owned_expenses
+from expenseflow.expense.schemas import (
+    ExpenseFilters,
+    ExpenseRead,
+    ExpenseSummaryRead,
+)
+from expenseflow.expense.service import (
+    expense_cursor_key,
+    get_expense_summaries,
+    get_owned_expenses,
+    owned_by,
+)
 from expenseflow.group.models import GroupModel, GroupUserModel
 from expenseflow.group.schemas import (
     GroupCreate,
@@ -30,6 +40,7 @@ from expenseflow.group.service import (
     get_user_groups,
     update_group,
 )
+from expenseflow.pagination import Cursor, OptionalPageLimit, fetch_limit, paginate
 from expenseflow.user.service import get_user_by_id
 
 r = router = APIRouter()
@@ -68,14 +79,14 @@ async def get_many(user: CurrentUser) -> list[GroupUserRead]:
 
 @r.get("/with-members", response_model=list[GroupReadWithMembers])
 async def get_many_with_members(
-    session: DbSession, user: CurrentUser
+    session: DbReadSession, user: CurrentUser
 ) -> list[GroupReadWithMembers]:
     """Get user groups."""
     return await get_groups_with_members(session, user)
 
 
 @r.get("/{group_id}", response_model=GroupRead)
-async def get(db: DbSession, user: CurrentUser, group_id: UUID) -> GroupModel:
+async def get(db: DbReadSession, user: CurrentUser, group_id: UUID) -> GroupModel:
     """Get a group."""
     result = await get_group(db, user, group_id)
     if result is None:
@@ -86,13 +97,13 @@ async def get(db: DbSession, user: CurrentUser, group_id: UUID) -> GroupModel:
     return result
 
 
-@r.post("", response_model=GroupRead)
+@r.post("", response_model=GroupRead, dependencies=[Audited])
 async def create(db: DbSession, user: CurrentUser, group_in: GroupCreate) -> GroupModel:
     """Create a group."""
     return await create_group(db, user, group_in)
 
 
-@r.put("/{group_id}", response_model=GroupRead)
+@r.put("/{group_id}", response_model=GroupRead, dependencies=[Audited])
 async def update(
     db: DbSession, user: CurrentUser, group_id: UUID, group_in: GroupUpdate
 ) -> GroupModel:
@@ -108,7 +119,7 @@ async def update(
 
 @r.get("/{group_id}/users", response_model=list[UserGroupRead])
 async def get_users(
-    db: DbSession, user: CurrentUser, group_id: UUID
+    db: DbReadSession, user: CurrentUser, group_id: UUID
 ) -> list[UserGroupRead]:
     """Get users in a group."""
     group = await get_group(db, user, group_id)
@@ -122,7 +133,7 @@ async def get_users(
     return [to_user_group(u) for u in users]
 
 
-@r.put("/{group_id}/users/{user_id}")
+@r.put("/{group_id}/users/{user_id}", dependencies=[Audited])
 async def create_update_group_user(
     db: DbSession, user: CurrentUser, group_id: UUID, role: GroupRole, user_id: UUID
 ) -> UserGroupRead:
@@ -153,7 +164,7 @@ async def create_update_group_user(
     return to_user_group(result)
 
 
-@r.delete("/{group_id}/users/{user_id}")
+@r.delete("/{group_id}/users/{user_id}", dependencies=[Audited])
 async def delete_group_user(
     db: DbSession, current_user: CurrentUser, group_id: UUID, user_id: UUID
 ) -> UserGroupRead:
@@ -189,10 +200,16 @@ async def delete_group_user(
 
 
 @r.get("/{group_id}/expenses", response_model=list[ExpenseRead])
-async def get_group_expenses(
-    db: DbSession, user: CurrentUser, group_id: UUID
+async def get_group_expenses(  # noqa: PLR0913
+    db: DbReadSession,
+    user: CurrentUser,
+    group_id: UUID,
+    response: Response,
+    filters: Annotated[ExpenseFilters, Depends()],
+    cursor: Cursor,
+    limit: OptionalPageLimit = None,
 ) -> list[ExpenseModel]:
-    """Get all group expenses."""
+    """Get all group expenses, newest first."""
     group = await get_group(db, user, group_id)
     if group is None:
         raise HTTPException(
@@ -200,4 +217,31 @@ async def get_group_expenses(
             detail=f"Group under the id '{group_id}' could not be found",
         )
 
-    return await get_owned_expenses(db, group)
+    expenses = await get_owned_expenses(
+        db, group, filters, limit=fetch_limit(limit), cursor=cursor
+    )
+    return paginate(response, expenses, limit, key=expense_cursor_key)
+
+
+@r.get("/{group_id}/expenses/summary")
+async def get_group_expenses_summary(  # noqa: PLR0913
+    db: DbReadSession,
+    user: CurrentUser,
+    group_id: UUID,
+    response: Response,
+    filters: Annotated[ExpenseFilters, Depends()],
+    cursor: Cursor,
+    limit: OptionalPageLimit = None,
+) -> list[ExpenseSummaryRead]:
+    """Get summaries of all group expenses, newest first."""
+    group = await get_group(db, user, group_id)
+    if group is None:
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND,
+            detail=f"Group under the id '{group_id}' could not be found",
+        )
+
+    expenses = await get_expense_summaries(
+        db, owned_by(group), filters, limit=fetch_limit(limit), cursor=cursor
+    )
+    return paginate(response, expenses, limit, key=expense_cursor_key)
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -26,7 +26,7 @@ async def create_group(
     group_model.users.append(group_user)
 
     session.add(group_model)
-    await session.commit()
+    await session.flush()
     return group_model
 
 
@@ -79,15 +79,15 @@ async def get_group(
     session: AsyncSession, member: UserModel, group_id: UUID
 ) -> GroupModel | None:
     """Get a group if a user exists in the group."""
-    return (
-        await session.execute(
-            select(GroupModel)
-            .join(GroupUserModel)
-            .where(GroupModel.group_id == group_id)
-            .where(GroupModel.group_id == GroupUserModel.group_id)
-            .where(GroupUserModel.user_id == member.user_id)
-        )
-    ).scalar_one_or_none()
+    member_id = member.user_id
+    stmt = lambda_stmt(
+        lambda: select(GroupModel)
+        .join(GroupUserModel)
+        .where(GroupModel.group_id == group_id)
+        .where(GroupModel.group_id == GroupUserModel.group_id)
+        .where(GroupUserModel.user_id == member_id)
+    )
+    return (await session.execute(stmt)).scalar_one_or_none()
 
 
 async def update_group(
@@ -102,7 +102,7 @@ async def update_group(
         if field in update_data:
             setattr(group, field, update_data[field])
 
-    await session.commit()
+    await session.flush()
     return group
 
 
@@ -110,13 +110,13 @@ async def get_group_user(
     session: AsyncSession, user: UserModel, group: GroupModel
 ) -> GroupUserModel | None:
     """Get group user membership."""
-    return (
-        await session.execute(
-            select(GroupUserModel)
-            .where(GroupUserModel.group_id == group.group_id)
-            .where(GroupUserModel.user_id == user.user_id)
-        )
-    ).scalar_one_or_none()
+    group_id, user_id = group.group_id, user.user_id
+    stmt = lambda_stmt(
+        lambda: select(GroupUserModel)
+        .where(GroupUserModel.group_id == group_id)
+        .where(GroupUserModel.user_id == user_id)
+    )
+    return (await session.execute(stmt)).scalar_one_or_none()
 
 
 async def create_update_group_user_role(
@@ -162,7 +162,7 @@ async def create_update_group_user_role(
 
     new_user_membership = GroupUserModel(user=new_user, group=group, role=new_role)
     session.add(new_user_membership)
-    await session.commit()
+    await session.flush()
 
     return new_user_membership
 
@@ -211,5 +211,5 @@ async def delete_user_from_group(
         raise ExistsError(msg)
 
     await session.delete(deleted_user_membership)
-    await session.commit()
+    await session.flush()
     return deleted_user_membership
@@ -8,14 +8,19 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
 from expenseflow.audit.routes import router as audit_router
+from expenseflow.audit.writer import audit_writer
+from expenseflow.auth.deps import CurrentUserTokenID, jwt_manager
 from expenseflow.config import CONFIG
-from expenseflow.database.core import db_engine
-from expenseflow.database.service import initialise_database
+from expenseflow.database.core import db_engine, get_pool_status
+from expenseflow.database.migrations import check_schema_version
+from expenseflow.database.schemas import PoolStatusRead
 from expenseflow.expense.routes import router as expense_router
 from expenseflow.friend.routes import router as friend_router
 from expenseflow.group.routes import router as group_router
 from expenseflow.middleware import ExceptionMiddleware
+from expenseflow.pagination import NEXT_CURSOR_HEADER
 from expenseflow.plugin import PluginManager, plugin_registry
+from expenseflow.user.cache import identity_cache
 from expenseflow.user.routes import router as user_router
 
 
@@ -24,13 +29,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     """App lifespan."""
     from expenseflow.config import CONFIG
 
-    await initialise_database(db_engine)  # Creates tables in db if not already there
+    await check_schema_version(db_engine)  # Migrations are run before startup
+    jwt_manager.start()
+    audit_writer.start()
     plugin_manager = PluginManager.create_from_config_file(
         CONFIG.plugin_config_path, plugin_registry
     )
     await plugin_manager.start_plugins(app)
     yield
     await plugin_manager.stop_plugins()
+    await audit_writer.stop()
+    await jwt_manager.stop()
+    await identity_cache.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -47,6 +57,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 app.add_middleware(ExceptionMiddleware)
 
@@ -57,6 +68,16 @@ def get_health() -> dict:
     return {"status": "healthy"}
 
 
+@app.get("/metrics/db-pool")
+def get_db_pool_metrics(_: CurrentUserTokenID) -> PoolStatusRead:
+    """Database connection pool metrics endpoint.
+
+    Only the token is verified, so the metrics are still served when every
+    pooled connection is checked out.
+    """
+    return get_pool_status()
+
+
 @app.get("/", include_in_schema=False)
 def redirect_to_docs() -> RedirectResponse:
     """Redirect to docs page."""
@@ -0,0 +1,82 @@
+"""Keyset pagination."""
+
+import base64
+import binascii
+import datetime as dt
+import json
+from collections.abc import Callable
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Query, Response, status
+
+from expenseflow.errors import InvalidCursorError
+
+# Pages are returned as plain lists, the cursor for the next page is a header
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+# For listings that returned everything before they were paginated
+OptionalPageLimit = Annotated[int | None, Query(ge=1, le=MAX_PAGE_SIZE)]
+PageCursor = Annotated[str | None, Query()]
+
+CursorKey = tuple[dt.datetime, UUID]
+
+
+def encode_cursor(key: CursorKey) -> str:
+    """Encode the sort key of the last row on a page."""
+    created_at, identifier = key
+    raw = json.dumps([created_at.isoformat(), str(identifier)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """Decode a cursor back into a sort key."""
+    try:
+        created_at, identifier = json.loads(base64.urlsafe_b64decode(cursor))
+        return dt.datetime.fromisoformat(created_at), UUID(identifier)
+    except (binascii.Error, ValueError, TypeError) as e:
+        msg = f"Invalid cursor '{cursor}'."
+        raise InvalidCursorError(msg) from e
+
+
+def get_cursor(cursor: PageCursor = None) -> CursorKey | None:
+    """Decode the cursor query parameter."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+Cursor = Annotated[CursorKey | None, Depends(get_cursor)]
+
+
+def fetch_limit(limit: int | None) -> int | None:
+    """Rows to fetch for a page, one extra to tell whether there's a next page."""
+    return None if limit is None else limit + 1
+
+
+def split_page[T](rows: list[T], limit: int | None, key: Callable[[T], CursorKey]) -> tuple[list[T], str | None]:
+    """Split a page fetched with one extra row into the page and next cursor."""
+    if limit is None or len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    return page, encode_cursor(key(page[-1]))
+
+
+def set_next_cursor(response: Response, cursor: str | None) -> None:
+    """Tell the client where the next page starts."""
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+def paginate[T](response: Response, rows: list[T], limit: int | None, key: Callable[[T], CursorKey]) -> list[T]:
+    """Get the page of rows, telling the client where the next page starts."""
+    page, next_cursor = split_page(rows, limit, key)
+    set_next_cursor(response, next_cursor)
+    return page
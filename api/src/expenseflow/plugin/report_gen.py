@@ -3,9 +3,11 @@
 import asyncio
 import datetime as dt
 from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from io import BytesIO
 from pathlib import Path
 from typing import Any
+from uuid import UUID
 
 import matplotlib.pyplot as plt
 from fastapi.responses import FileResponse
@@ -16,7 +18,11 @@ from reportlab.pdfgen import canvas
 from expenseflow.auth.deps import CurrentUser
 from expenseflow.database.deps import DbSession
 from expenseflow.expense.models import ExpenseModel
-from expenseflow.expense.service import get_owned_expenses
+from expenseflow.expense.service import (
+    get_expenses_overview,
+    get_owed_amounts,
+    get_owned_expenses,
+)
 from expenseflow.plugin import Plugin, PluginSettings, plugin_registry
 
 
@@ -62,8 +68,9 @@ class ReportGenPlugin(Plugin[ReportGenSettings]):
         self.PDF_PATH = f"report_{uuid.uuid4()}.pdf"
         budget_data = await self.get_budget_and_distribution(db, user)
         transactions = await self.get_recent_transactions(db, user)
+        owed_amounts = await get_owed_amounts(db, user, transactions)
         await self.generate_chart(db, user)
-        self.generate_pdf_report(budget_data, transactions, user)
+        self.generate_pdf_report(budget_data, transactions, owed_amounts, user)
         return FileResponse(
             self.PDF_PATH, media_type="application/pdf", filename=self.PDF_PATH
         )
@@ -72,28 +79,12 @@ class ReportGenPlugin(Plugin[ReportGenSettings]):
         self, db: DbSession, user: CurrentUser
     ) -> dict[str, Any]:
         """Get budget data and category distribution using service methods."""
-        owned_expenses = await get_owned_expenses(db, user)
-
-        total_spent = sum(
-            item.price * split.proportion * item.quantity
-            for expense in owned_expenses
-            for item in expense.items
-            for split in item.splits
-            if split.user_id == user.user_id
-        )
+        overview = await get_expenses_overview(db, user, parent=user)
 
-        # Calculate category distribution
-        category_distribution: dict = {}
-        for expense in owned_expenses:
-            for item in expense.items:
-                for split in item.splits:
-                    if split.user_id != user.user_id:
-                        continue
-                    i_total_price = item.price * item.quantity * split.proportion
-                    if expense.category in category_distribution:
-                        category_distribution[expense.category] += i_total_price
-                    else:
-                        category_distribution[expense.category] = i_total_price
+        total_spent = overview.total
+        category_distribution = {
+            category.category: float(category.total) for category in overview.categories
+        }
 
         return {
             "budget": user.budget,
@@ -170,6 +161,7 @@ class ReportGenPlugin(Plugin[ReportGenSettings]):
         self,
         budget_data: dict[str, Any],
         recent_transactions: list[ExpenseModel],
+        owed_amounts: dict[UUID, Decimal],
         user: CurrentUser,
     ) -> None:
         """Generate PDF report with budget data and recent transactions."""
@@ -252,11 +244,7 @@ class ReportGenPlugin(Plugin[ReportGenSettings]):
             date_str = (
                 t.created_at.strftime("%Y-%m-%d") if hasattr(t, "created_at") else ""
             )
-            price = f"${sum(
-            item.price * item.quantity * split.proportion
-            for item in t.items
-            for split in item.splits if split.user_id == user.user_id
-            ):.2f}"
+            price = f"${owed_amounts.get(t.expense_id, Decimal(0)):.2f}"
 
             for i, val in enumerate([date_str, name, price]):
                 c.rect(x, y, col_widths[i], row_height, fill=0)
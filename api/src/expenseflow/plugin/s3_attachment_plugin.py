@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 
-from expenseflow.auth.deps import CurrentUser
+from expenseflow.auth.deps import Audited, CurrentUser
 from expenseflow.database.deps import DbSession
 from expenseflow.expense.models import ExpenseModel
 from expenseflow.expense.schemas import ExpenseRead
@@ -62,6 +62,7 @@ class S3AttachmentPlugin(Plugin[S3AttachmentPluginSettings]):
             self.attach,
             methods=["POST"],
             response_model=ExpenseRead,
+            dependencies=[Audited],
         )
 
         self._app.add_api_route(
@@ -8,7 +8,7 @@ import boto3
 from botocore.exceptions import ClientError
 from fastapi import HTTPException, UploadFile, status
 
-from expenseflow.auth.deps import CurrentUser
+from expenseflow.auth.deps import Audited, CurrentUser
 from expenseflow.database.deps import DbSession
 from expenseflow.entity.service import get_entity
 from expenseflow.enums import ExpenseCategory
@@ -36,6 +36,7 @@ class TextractPlugin(Plugin[TextractPluginSettings]):
             self.handle_receipt,
             methods=["POST"],
             response_model=ExpenseRead,
+            dependencies=[Audited],
         )
 
     def _on_call(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
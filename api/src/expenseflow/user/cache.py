@@ -0,0 +1,158 @@
+"""User identity cache."""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from loguru import logger
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from expenseflow.config import CONFIG
+from expenseflow.user.schemas import UserSnapshot
+
+
+class IdentityCache(ABC):
+    """Cache of user snapshots keyed by token id."""
+
+    @abstractmethod
+    async def get(self, token_id: str) -> UserSnapshot | None:
+        """Get the cached snapshot for a token id."""
+
+    @abstractmethod
+    async def set(self, snapshot: UserSnapshot) -> None:
+        """Cache a snapshot under its token id."""
+
+    @abstractmethod
+    async def invalidate(self, token_id: str) -> None:
+        """Remove the cached snapshot for a token id."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release any resources held by the cache."""
+
+    @staticmethod
+    def create(url: str, ttl: float, max_size: int) -> "IdentityCache":
+        """Create identity cache from a url.
+
+        'redis://' and 'rediss://' urls use a Redis compatible server, anything
+        else uses an in-process LRU cache.
+        """
+        if url.startswith(("redis://", "rediss://")):
+            return RedisIdentityCache(url, ttl)
+
+        return InMemoryIdentityCache(ttl, max_size)
+
+
+class InMemoryIdentityCache(IdentityCache):
+    """In-process LRU identity cache."""
+
+    _ttl: float
+    _max_size: int
+    _entries: OrderedDict[str, tuple[UserSnapshot, float]]
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        """Create in-memory identity cache."""
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries = OrderedDict()
+
+    async def get(self, token_id: str) -> UserSnapshot | None:
+        """Get the cached snapshot for a token id."""
+        entry = self._entries.get(token_id)
+        if entry is None:
+            return None
+
+        snapshot, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[token_id]
+            return None
+
+        self._entries.move_to_end(token_id)
+        return snapshot
+
+    async def set(self, snapshot: UserSnapshot) -> None:
+        """Cache a snapshot under its token id."""
+        if self._max_size <= 0 or self._ttl <= 0:
+            return
+
+        self._entries[snapshot.token_id] = (snapshot, time.monotonic() + self._ttl)
+        self._entries.move_to_end(snapshot.token_id)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, token_id: str) -> None:
+        """Remove the cached snapshot for a token id."""
+        self._entries.pop(token_id, None)
+
+    def __len__(self) -> int:
+        """Number of cached snapshots."""
+        return len(self._entries)
+
+
+class RedisIdentityCache(IdentityCache):
+    """Identity cache backed by a Redis compatible server.
+
+    The cache is an optimisation, so an unreachable server is treated as a miss
+    rather than failing the request.
+    """
+
+    _key_prefix = "identity:"
+
+    _client: Redis
+    _ttl: float
+
+    def __init__(self, url: str, ttl: float) -> None:
+        """Create Redis identity cache."""
+        self._client = Redis.from_url(url)
+        self._ttl = ttl
+
+    async def get(self, token_id: str) -> UserSnapshot | None:
+        """Get the cached snapshot for a token id."""
+        try:
+            value = await self._client.get(self._key_prefix + token_id)
+        except RedisError as e:
+            logger.warning(f"Unable to read from identity cache: {e}")
+            return None
+
+        if value is None:
+            return None
+
+        try:
+            return UserSnapshot.model_validate_json(value)
+        except ValidationError as e:
+            logger.warning(f"Discarding invalid identity cache entry: {e}")
+            return None
+
+    async def set(self, snapshot: UserSnapshot) -> None:
+        """Cache a snapshot under its token id."""
+        if self._ttl <= 0:
+            return
+
+        try:
+            await self._client.set(
+                self._key_prefix + snapshot.token_id,
+                snapshot.model_dump_json(),
+                px=int(self._ttl * 1000),
+            )
+        except RedisError as e:
+            logger.warning(f"Unable to write to identity cache: {e}")
+
+    async def invalidate(self, token_id: str) -> None:
+        """Remove the cached snapshot for a token id."""
+        try:
+            await self._client.delete(self._key_prefix + token_id)
+        except RedisError as e:
+            logger.error(f"Unable to invalidate identity cache entry: {e}")
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+
+
+identity_cache = IdentityCache.create(
+    CONFIG.identity_cache_url,
+    ttl=CONFIG.identity_cache_ttl,
+    max_size=CONFIG.identity_cache_max_size,
+)
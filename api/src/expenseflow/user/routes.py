@@ -4,8 +4,8 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
 
-from expenseflow.auth.deps import CurrentUser, CurrentUserTokenID
-from expenseflow.database.deps import DbSession
+from expenseflow.auth.deps import Audited, CurrentUser, CurrentUserTokenID
+from expenseflow.database.deps import DbReadSession, DbSession
 from expenseflow.errors import ExistsError
 from expenseflow.user.models import UserModel
 from expenseflow.user.schemas import (
@@ -33,7 +33,7 @@ async def get_me(user: CurrentUser) -> UserModel:
 
 
 @r.get("/all", response_model=list[UserReadMinimal])
-async def get_all(db: DbSession, me: CurrentUser) -> list[UserModel]:
+async def get_all(db: DbReadSession, me: CurrentUser) -> list[UserModel]:
     """Get all users."""
     users = await get_all_users(db)
     return [u for u in users if u.user_id != me.user_id]
@@ -41,7 +41,7 @@ async def get_all(db: DbSession, me: CurrentUser) -> list[UserModel]:
 
 @r.get("/nickname-taken", response_model=bool)
 async def check_nickname_taken(
-    db: DbSession, _: CurrentUserTokenID, nickname: str
+    db: DbReadSession, _: CurrentUserTokenID, nickname: str
 ) -> bool:
     """Check if nickname is taken."""
     user = await get_user_by_nickname(db, nickname)
@@ -49,7 +49,7 @@ async def check_nickname_taken(
 
 
 @r.get("/{user_id}", response_model=UserRead)
-async def get_user(db: DbSession, _: CurrentUser, user_id: UUID) -> UserModel:
+async def get_user(db: DbReadSession, _: CurrentUser, user_id: UUID) -> UserModel:
     """Endpoint to get user by id."""
     user = await get_user_by_id(db, user_id)
     if user is None:
@@ -81,7 +81,7 @@ async def create(
         ) from e
 
 
-@r.put("", response_model=UserRead)
-async def update(user: CurrentUser, user_in: UserUpdate) -> UserModel:
+@r.put("", response_model=UserRead, dependencies=[Audited])
+async def update(db: DbSession, user: CurrentUser, user_in: UserUpdate) -> UserModel:
     """Create a new user."""
-    return await update_user(user, user_in)
+    return await update_user(db, user, user_in)
@@ -43,3 +43,15 @@ class UserCreateInternal(UserCreate):
     """Create user schema."""
 
     token_id: str
+
+
+class UserSnapshot(ExpenseFlowBase):
+    """Cached user identity schema."""
+
+    user_id: UUID
+    entity_id: UUID
+    token_id: str
+    nickname: str
+    first_name: str
+    last_name: str
+    budget: int
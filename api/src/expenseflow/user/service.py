@@ -1,13 +1,19 @@
 """User service."""
 
+from collections.abc import Iterable
+from functools import partial
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from expenseflow.database.core import after_commit, savepoint
 from expenseflow.errors import ExistsError
+from expenseflow.user.cache import identity_cache
 from expenseflow.user.models import UserModel
-from expenseflow.user.schemas import UserCreateInternal, UserUpdate
+from expenseflow.user.schemas import UserCreateInternal, UserSnapshot, UserUpdate
 
 
 async def get_user_by_id(session: AsyncSession, user_id: UUID) -> UserModel | None:
@@ -15,6 +21,16 @@ async def get_user_by_id(session: AsyncSession, user_id: UUID) -> UserModel | No
     return await session.get(UserModel, user_id)
 
 
+async def get_users_by_ids(
+    session: AsyncSession, user_ids: Iterable[UUID]
+) -> dict[UUID, UserModel]:
+    """Get the users with the given ids in one query, by their id."""
+    users = await session.execute(
+        select(UserModel).where(UserModel.user_id.in_(set(user_ids)))
+    )
+    return {user.user_id: user for user in users.scalars()}
+
+
 async def get_all_users(session: AsyncSession) -> list[UserModel]:
     """Get all users."""
     return list((await session.execute(select(UserModel))).scalars().all())
@@ -24,18 +40,36 @@ async def get_user_by_token_id(
     session: AsyncSession, token_id: str
 ) -> UserModel | None:
     """Get user by their token id."""
-    return (
-        await session.execute(select(UserModel).where(UserModel.token_id == token_id))
-    ).scalar_one_or_none()
+    stmt = lambda_stmt(lambda: select(UserModel).where(UserModel.token_id == token_id))
+    return (await session.execute(stmt)).scalar_one_or_none()
+
+
+async def get_cached_user_by_token_id(
+    session: AsyncSession, token_id: str
+) -> UserModel | None:
+    """Get user by their token id, going through the identity cache.
+
+    A cached user is attached to the session without querying the database, so
+    it can still be modified and used in relationships like a loaded user.
+    """
+    snapshot = await identity_cache.get(token_id)
+    if snapshot is not None:
+        cached_user = UserModel(**snapshot.model_dump())
+        make_transient_to_detached(cached_user)
+        return await session.merge(cached_user, load=False)
+
+    user = await get_user_by_token_id(session, token_id)
+    if user is not None:
+        await identity_cache.set(UserSnapshot.model_validate(user))
+    return user
 
 
 async def get_user_by_nickname(
     session: AsyncSession, nickname: str
 ) -> UserModel | None:
     """Get user by their nickname."""
-    return (
-        await session.execute(select(UserModel).where(UserModel.nickname == nickname))
-    ).scalar_one_or_none()
+    stmt = lambda_stmt(lambda: select(UserModel).where(UserModel.nickname == nickname))
+    return (await session.execute(stmt)).scalar_one_or_none()
 
 
 async def create_user(session: AsyncSession, user_in: UserCreateInternal) -> UserModel:
@@ -57,12 +91,27 @@ async def create_user(session: AsyncSession, user_in: UserCreateInternal) -> Use
         budget=user_in.budget,
     )
 
-    session.add(new_user)
-    await session.commit()
+    try:
+        async with savepoint(session):
+            session.add(new_user)
+            await session.flush()
+    except IntegrityError as e:
+        # Lost a race with a concurrent request creating the same user
+        existing_user = await get_user_by_token_id(session, user_in.token_id)
+        if existing_user is not None:
+            return existing_user
+        msg = f"User already exists with the nickname '{user_in.nickname}'."
+        raise ExistsError(msg) from e
+
+    after_commit(session, partial(identity_cache.invalidate, new_user.token_id))
     return new_user
 
 
-async def update_user(user: UserModel, user_in: UserUpdate) -> UserModel:
+async def update_user(
+    session: AsyncSession, user: UserModel, user_in: UserUpdate
+) -> UserModel:
     """Update a user."""
     user.budget = user_in.budget
+    # Invalidated once committed, so a concurrent request can't re-cache the old row
+    after_commit(session, partial(identity_cache.invalidate, user.token_id))
     return user
@@ -0,0 +1,138 @@
+"""Audit policy tests."""
+
+import json
+from pathlib import Path
+
+import pytest
+from starlette.requests import Request
+
+from expenseflow.audit.policy import (
+    REDACTED,
+    AuditPolicy,
+    AuditPolicyError,
+    AuditRule,
+)
+
+
+def test_default_policy_audits_everything():
+    policy = AuditPolicy()
+
+    assert policy.should_audit("GET", "/expenses/all")
+    assert policy.should_audit("POST", "/expenses")
+
+
+def test_write_sample_rate():
+    policy = AuditPolicy(write_sample_rate=0)
+
+    assert not policy.should_audit("POST", "/expenses")
+    assert not policy.should_audit("put", "/users")
+
+
+def test_first_matching_rule_wins():
+    policy = AuditPolicy(
+        write_sample_rate=0,
+        rules=[
+            AuditRule(methods=["post"], path="/expenses/*/attachments", audit=False),
+            AuditRule(methods=["POST"], path="/expenses*", sample_rate=1),
+            AuditRule(path="/expenses*", audit=False),
+        ],
+    )
+
+    assert not policy.should_audit("POST", "/expenses/1/attachments")
+    assert policy.should_audit("POST", "/expenses")
+    assert not policy.should_audit("PUT", "/expenses/1")
+    assert not policy.should_audit("POST", "/groups")
+
+
+def test_redact_fields():
+    policy = AuditPolicy(redact_fields=["Password"])
+
+    body = policy.prepare_body(b'{"name": "n", "password": "p", "items": [{"PASSWORD": "p", "price": 1}]}')
+
+    assert body == {
+        "name": "n",
+        "password": REDACTED,
+        "items": [{"PASSWORD": REDACTED, "price": 1}],
+    }
+
+
+def test_truncate_body():
+    policy = AuditPolicy(max_body_size=20)
+    large = json.dumps({"description": "x" * 100}).encode()
+
+    assert policy.prepare_body(b'{"a": 1}') == {"a": 1}
+    assert policy.prepare_body(large) == {
+        "_truncated": True,
+        "_original_size": len(large),
+        "_preview": large[:20].decode(),
+    }
+
+
+def test_truncate_body_without_preview_when_redacting():
+    policy = AuditPolicy(max_body_size=20, redact_fields=["password"])
+
+    body = policy.prepare_body(json.dumps({"password": "x" * 100}).encode())
+
+    assert body is not None
+    assert body["_truncated"] is True
+    assert "_preview" not in body
+
+
+def test_raw_bodies():
+    policy = AuditPolicy()
+
+    assert policy.prepare_body(b"") is None
+    assert policy.prepare_body(b"[1, 2]") == {"body": [1, 2]}
+    assert policy.prepare_body(b"{not json") == {
+        "_invalid_json": True,
+        "_original_size": 9,
+    }
+
+
+@pytest.mark.asyncio
+async def test_capture_body():
+    policy = AuditPolicy()
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b'{"a": 1}', "more_body": False}
+
+    def request(content_type: str | None) -> Request:
+        headers = [(b"content-length", b"8")]
+        if content_type is not None:
+            headers.append((b"content-type", content_type.encode()))
+        return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+    assert await policy.capture_body(request("application/json")) == {"a": 1}
+    assert await policy.capture_body(request("application/merge-patch+json; charset=utf-8")) == {"a": 1}
+    assert await policy.capture_body(request(None)) is None
+    assert await policy.capture_body(request("multipart/form-data; boundary=x")) == {
+        "_content_type": "multipart/form-data",
+        "_content_length": "8",
+    }
+
+
+def test_load(tmp_path: Path):
+    policy_file = tmp_path / "audit_policy.yml"
+    policy_file.write_text(
+        "write_sample_rate: 0.5\nrules:\n  - methods: [post]\n    path: /audits*\n    audit: false\n"
+    )
+
+    policy = AuditPolicy.load(str(policy_file))
+
+    assert policy.write_sample_rate == 0.5
+    assert policy.rules[0].methods == ["POST"]
+    assert not policy.should_audit("POST", "/audits")
+
+
+def test_load_missing_file(tmp_path: Path):
+    policy = AuditPolicy.load(str(tmp_path / "missing.yml"))
+
+    assert policy == AuditPolicy()
+
+
+def test_load_invalid_file(tmp_path: Path):
+    policy_file = tmp_path / "audit_policy.yml"
+    policy_file.write_text("write_sample_rate: 2\n")
+
+    with pytest.raises(AuditPolicyError):
+        AuditPolicy.load(str(policy_file))
@@ -0,0 +1,127 @@
+"""Audit partition and retention tests."""
+
+import datetime as dt
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from expenseflow.audit.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    ensure_partitions,
+    get_partitions,
+    is_partitioned,
+    partition_month,
+    partition_name,
+)
+from expenseflow.audit.retention import apply_retention, get_expired_partitions
+from expenseflow.audit.schemas import AuditCreate
+from expenseflow.user.schemas import UserCreateInternal
+
+
+@pytest.fixture
+def engine(session: AsyncSession) -> AsyncEngine:
+    assert isinstance(session.bind, AsyncEngine)
+    return session.bind
+
+
+def test_partition_names():
+    month = dt.date(2026, 3, 1)
+
+    assert partition_name(month) == "audit_y2026m03"
+    assert partition_month(partition_name(month)) == month
+    assert partition_month(DEFAULT_PARTITION) is None
+
+
+def test_add_months():
+    assert add_months(dt.date(2026, 12, 1), 1) == dt.date(2027, 1, 1)
+    assert add_months(dt.date(2026, 1, 1), -13) == dt.date(2024, 12, 1)
+
+
+@pytest.mark.asyncio()
+async def test_ensure_partitions(engine: AsyncEngine):
+    now = dt.datetime(1999, 11, 15, tzinfo=dt.UTC)
+
+    async with engine.begin() as conn:
+        assert await is_partitioned(conn)
+        created = await ensure_partitions(conn, months_ahead=2, now=now)
+        again = await ensure_partitions(conn, months_ahead=2, now=now)
+        partitions = await get_partitions(conn)
+
+    assert created == ["audit_y1999m11", "audit_y1999m12", "audit_y2000m01"]
+    assert again == []
+    assert set(created) <= set(partitions)
+    assert DEFAULT_PARTITION in partitions
+
+
+@pytest.mark.asyncio()
+async def test_ensure_partitions_moves_default_rows(
+    session: AsyncSession,
+    engine: AsyncEngine,
+    user_create_internal: UserCreateInternal,
+):
+    from expenseflow.audit.service import create_audit
+    from expenseflow.user.service import create_user
+
+    user = await create_user(session, user_create_internal)
+    # No partition was created for the month, so its rows are in the default one
+    lapsed = dt.datetime(1997, 5, 20, tzinfo=dt.UTC)
+    audit = await create_audit(session, user, AuditCreate(method="POST", endpoint="/expenses"))
+    audit.created_at = lapsed
+    await session.commit()
+
+    async with engine.begin() as conn:
+        created = await ensure_partitions(conn, months_ahead=0, now=lapsed)
+        count = "SELECT count(*) FROM {} WHERE audit_id = :audit_id"
+        moved = await conn.scalar(text(count.format("audit_y1997m05")), {"audit_id": audit.audit_id})
+        left = await conn.scalar(text(count.format(DEFAULT_PARTITION)), {"audit_id": audit.audit_id})
+
+    assert created == ["audit_y1997m05"]
+    assert moved == 1
+    assert left == 0
+
+
+@pytest.mark.asyncio()
+async def test_apply_retention(
+    session: AsyncSession,
+    engine: AsyncEngine,
+    user_create_internal: UserCreateInternal,
+    tmp_path: Path,
+):
+    from expenseflow.audit.service import create_audit, get_audits
+    from expenseflow.user.service import create_user
+
+    user = await create_user(session, user_create_internal)
+    old = dt.datetime(1998, 1, 20, tzinfo=dt.UTC)
+
+    async with engine.begin() as conn:
+        await ensure_partitions(conn, months_ahead=1, now=old)
+
+    audit = await create_audit(session, user, AuditCreate(method="POST", endpoint="/expenses"))
+    audit.created_at = old
+    await session.commit()
+
+    now = dt.datetime(1998, 6, 1, tzinfo=dt.UTC)
+    async with engine.connect() as conn:
+        expired = await get_expired_partitions(conn, retention_months=3, now=now)
+    assert "audit_y1998m01" in expired
+    assert "audit_y1998m02" in expired
+    assert "audit_y1998m03" not in expired
+
+    dropped = await apply_retention(engine, retention_months=3, archive_dir=tmp_path, now=now)
+
+    assert "audit_y1998m01" in dropped
+    async with engine.connect() as conn:
+        assert "audit_y1998m01" not in await get_partitions(conn)
+
+    with gzip.open(tmp_path / "audit_y1998m01.ndjson.gz", "rt") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["audit_id"] for r in records] == [str(audit.audit_id)]
+    assert records[0]["endpoint"] == "/expenses"
+
+    session.expunge_all()
+    assert await get_audits(session, user) == []
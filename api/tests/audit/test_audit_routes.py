@@ -193,3 +193,77 @@ async def test_get_audits_with_none_request_body(
     assert audit["method"] == "GET"
     assert audit["endpoint"] == "/api/dashboard"
     assert audit["request_body"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_audits_paginated(
+    test_client: AsyncClient, session: AsyncSession, default_user: UserModel
+):
+    """Test following cursors through a user's audit log."""
+    from expenseflow.audit.service import create_audit
+    from expenseflow.pagination import NEXT_CURSOR_HEADER
+
+    created = [
+        await create_audit(
+            session, default_user, AuditCreate(method="POST", endpoint=f"/api/{i}")
+        )
+        for i in range(5)
+    ]
+
+    seen: list[str] = []
+    params: dict[str, str | int] = {"limit": 2}
+    pages = 0
+    while True:
+        resp = await test_client.get("/audits", params=params)
+        assert resp.status_code == 200
+        page = resp.json()
+        assert len(page) <= 2
+        seen.extend(a["audit_id"] for a in page)
+        pages += 1
+
+        next_cursor = resp.headers.get(NEXT_CURSOR_HEADER)
+        if next_cursor is None:
+            break
+        params["cursor"] = next_cursor
+
+    assert pages == 3
+    assert len(seen) == len(set(seen))
+    assert set(seen) == {str(a.audit_id) for a in created}
+
+
+@pytest.mark.asyncio
+async def test_get_audits_filtered(
+    test_client: AsyncClient, session: AsyncSession, default_user: UserModel
+):
+    """Test filtering audit logs by method and endpoint prefix."""
+    from expenseflow.audit.service import create_audit
+
+    await create_audit(
+        session, default_user, AuditCreate(method="POST", endpoint="/expenses")
+    )
+    put = await create_audit(
+        session, default_user, AuditCreate(method="PUT", endpoint="/expenses/1")
+    )
+    await create_audit(
+        session, default_user, AuditCreate(method="PUT", endpoint="/groups/1")
+    )
+
+    resp = await test_client.get(
+        "/audits", params={"method": "put", "endpoint_prefix": "/expenses"}
+    )
+
+    assert resp.status_code == 200
+    assert [a["audit_id"] for a in resp.json()] == [str(put.audit_id)]
+
+    resp = await test_client.get(
+        "/audits", params={"since": "2000-01-01T00:00:00Z", "until": "2000-01-02"}
+    )
+    assert resp.status_code == 200
+    assert resp.json() == []
+
+
+@pytest.mark.asyncio
+async def test_get_audits_invalid_cursor(test_client: AsyncClient):
+    """Test an undecodable cursor is rejected."""
+    resp = await test_client.get("/audits", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
@@ -0,0 +1,183 @@
+"""Audit writer tests."""
+
+import asyncio
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from expenseflow.audit.schemas import AuditCreate
+from expenseflow.audit.writer import AuditWriter
+from expenseflow.user.models import UserModel
+from expenseflow.user.schemas import UserCreateInternal
+
+
+@pytest.fixture
+def audit_create():
+    """Fixture for creating an audit log."""
+    return AuditCreate(
+        method="POST",
+        endpoint="/expenses",
+        request_body={"name": "Lunch"},
+    )
+
+
+def record_batches(monkeypatch: pytest.MonkeyPatch, writer: AuditWriter) -> list[list[dict[str, Any]]]:
+    batches: list[list[dict[str, Any]]] = []
+
+    async def mock_flush(records: list[dict[str, Any]]) -> None:
+        batches.append(records)
+
+    monkeypatch.setattr(writer, "_flush", mock_flush)
+    return batches
+
+
+@pytest.mark.asyncio()
+async def test_flushes_full_batches(monkeypatch: pytest.MonkeyPatch, user_model: UserModel, audit_create: AuditCreate):
+    writer = AuditWriter(async_sessionmaker(), batch_size=3, flush_interval=60)
+    batches = record_batches(monkeypatch, writer)
+
+    writer.start()
+    for _ in range(7):
+        await writer.write(user_model, audit_create)
+    await writer.stop()
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert all(r["user_id"] == user_model.user_id for b in batches for r in b)
+
+
+@pytest.mark.asyncio()
+async def test_flushes_after_interval(
+    monkeypatch: pytest.MonkeyPatch, user_model: UserModel, audit_create: AuditCreate
+):
+    writer = AuditWriter(async_sessionmaker(), batch_size=100, flush_interval=0.05)
+    batches = record_batches(monkeypatch, writer)
+
+    writer.start()
+    await writer.write(user_model, audit_create)
+    await asyncio.sleep(0.2)
+
+    assert [len(b) for b in batches] == [1]
+    await writer.stop()
+
+
+@pytest.mark.asyncio()
+async def test_full_queue_applies_backpressure(
+    monkeypatch: pytest.MonkeyPatch, user_model: UserModel, audit_create: AuditCreate
+):
+    writer = AuditWriter(async_sessionmaker(), max_queue_size=1, batch_size=1, flush_interval=0)
+    release = asyncio.Event()
+    flushed: list[dict[str, Any]] = []
+
+    async def mock_flush(records: list[dict[str, Any]]) -> None:
+        await release.wait()
+        flushed.extend(records)
+
+    monkeypatch.setattr(writer, "_flush", mock_flush)
+
+    writer.start()
+    await writer.write(user_model, audit_create)  # Picked up by the blocked flush
+    await asyncio.sleep(0)
+    await writer.write(user_model, audit_create)  # Fills the queue
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(writer.write(user_model, audit_create), 0.05)
+
+    release.set()
+    await writer.stop()
+    assert len(flushed) == 2
+
+
+@pytest.mark.asyncio()
+async def test_failed_flush_keeps_writer_running(user_model: UserModel, audit_create: AuditCreate):
+    attempts = 0
+
+    def lost_connection() -> AsyncSession:
+        nonlocal attempts
+        attempts += 1
+        msg = "Connection refused"
+        raise OSError(msg)
+
+    writer = AuditWriter(cast("async_sessionmaker[AsyncSession]", lost_connection), batch_size=1, flush_interval=0)
+
+    writer.start()
+    await writer.write(user_model, audit_create)
+    await writer.write(user_model, audit_create)
+    await asyncio.sleep(0.05)
+
+    assert writer.is_running
+    await writer.stop()
+    assert attempts == 2
+
+
+@pytest.mark.asyncio()
+async def test_stopped_writer_releases_waiting_writers(
+    monkeypatch: pytest.MonkeyPatch, user_model: UserModel, audit_create: AuditCreate
+):
+    writer = AuditWriter(async_sessionmaker(), max_queue_size=1)
+    batches = record_batches(monkeypatch, writer)
+    fail = asyncio.Event()
+
+    async def failing_flush_batches() -> None:
+        await fail.wait()
+        raise RuntimeError
+
+    monkeypatch.setattr(writer, "_flush_batches", failing_flush_batches)
+
+    writer.start()
+    await writer.write(user_model, audit_create)  # Fills the queue
+    waiting = asyncio.create_task(writer.write(user_model, audit_create))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    fail.set()
+    await asyncio.wait_for(waiting, 1)
+    await asyncio.sleep(0)
+    assert not writer.is_running
+    assert [len(b) for b in batches] == [1, 1]
+
+    # Later records are written directly
+    await writer.write(user_model, audit_create)
+    assert [len(b) for b in batches] == [1, 1, 1]
+    await writer.stop()
+
+
+@pytest.mark.asyncio()
+async def test_records_are_written(
+    session: AsyncSession,
+    user_create_internal: UserCreateInternal,
+    audit_create: AuditCreate,
+):
+    from expenseflow.audit.service import get_audits
+    from expenseflow.user.service import create_user
+
+    user = await create_user(session, user_create_internal)
+    writer = AuditWriter(async_sessionmaker(session.bind), batch_size=2)
+
+    writer.start()
+    for _ in range(3):
+        await writer.write(user, audit_create)
+    await writer.stop()
+
+    audits = await get_audits(session, user)
+    assert len(audits) == 3
+    assert all(a.endpoint == audit_create.endpoint for a in audits)
+    assert len({a.audit_id for a in audits}) == 3
+
+
+@pytest.mark.asyncio()
+async def test_writes_directly_when_not_started(
+    session: AsyncSession,
+    user_create_internal: UserCreateInternal,
+    audit_create: AuditCreate,
+):
+    from expenseflow.audit.service import get_audits
+    from expenseflow.user.service import create_user
+
+    user = await create_user(session, user_create_internal)
+    writer = AuditWriter(async_sessionmaker(session.bind))
+
+    await writer.write(user, audit_create)
+
+    audits = await get_audits(session, user)
+    assert len(audits) == 1
@@ -1,14 +1,21 @@
 """Auth dependency tests."""
 
+import json
+
 import pytest
 from expenseflow.audit.schemas import AuditCreate
-from expenseflow.auth.deps import get_current_user, get_user_token_identifier
+from expenseflow.audit.policy import AuditPolicy, AuditRule
+from expenseflow.auth.deps import (
+    audit_request,
+    get_current_user,
+    get_user_token_identifier,
+)
 from expenseflow.auth.service import JWTError
 from expenseflow.user.models import UserModel
 from fastapi import HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.datastructures import URL
+from starlette.datastructures import URL, Headers
 
 
 class MockRequest(Request):
@@ -39,11 +46,18 @@ class MockRequest(Request):
         """Get url."""
         return self._url
 
-    async def json(self) -> dict | None:
-        """Get json."""
-        if isinstance(self._json_data, Exception):
-            raise self._json_data
-        return self._json_data
+    @property
+    def headers(self) -> Headers:
+        """Get headers."""
+        if self._json_data is None:
+            return Headers()
+        return Headers({"content-type": "application/json"})
+
+    async def body(self) -> bytes:
+        """Get body."""
+        if self._json_data is None:
+            return b""
+        return json.dumps(self._json_data).encode()
 
 
 @pytest.mark.asyncio
@@ -83,7 +97,6 @@ async def test_get_current_user_success(
     monkeypatch: pytest.MonkeyPatch, user_model: UserModel, session: AsyncSession
 ):
     mock_user_token_id = "user123"  # noqa: S105
-    mock_request = MockRequest(json_data={"key": "value"})
 
     async def mock_get_user_by_token_id(
         sess: AsyncSession, user_token_id: str
@@ -92,31 +105,24 @@ async def test_get_current_user_success(
         assert user_token_id == mock_user_token_id
         return user_model
 
-    async def mock_create_audit(
-        session_: AsyncSession, user_: UserModel, audit_create: AuditCreate
-    ) -> None:
-        assert session_ == session
-        assert user_ == user_model
-        assert audit_create.method == "POST"
-        assert audit_create.endpoint == "/some-endpoint"
-        assert audit_create.request_body == {"key": "value"}
+    async def mock_write_audit(user_: UserModel, audit_create: AuditCreate) -> None:
+        pytest.fail("Resolving the current user should not audit")
 
     monkeypatch.setattr(
-        "expenseflow.auth.deps.get_user_by_token_id", mock_get_user_by_token_id
+        "expenseflow.auth.deps.get_cached_user_by_token_id", mock_get_user_by_token_id
     )
-    monkeypatch.setattr("expenseflow.auth.deps.create_audit", mock_create_audit)
+    monkeypatch.setattr("expenseflow.auth.deps.audit_writer.write", mock_write_audit)
 
-    result = await get_current_user(session, mock_user_token_id, mock_request)
+    result = await get_current_user(session, mock_user_token_id)
 
     assert result == user_model
 
 
 @pytest.mark.asyncio
 async def test_get_current_user_not_found(
-    monkeypatch: pytest.MonkeyPatch, user_model: UserModel, session: AsyncSession
+    monkeypatch: pytest.MonkeyPatch, session: AsyncSession
 ):
     mock_user_token_id = "user123"  # noqa: S105
-    mock_request = MockRequest(json_data={"irrelevant": True})
 
     async def mock_get_user_by_token_id(
         session: AsyncSession, user_token_id: str
@@ -124,11 +130,49 @@ async def test_get_current_user_not_found(
         return None
 
     monkeypatch.setattr(
-        "expenseflow.auth.deps.get_user_by_token_id", mock_get_user_by_token_id
+        "expenseflow.auth.deps.get_cached_user_by_token_id", mock_get_user_by_token_id
     )
 
     with pytest.raises(HTTPException) as exc_info:
-        await get_current_user(session, mock_user_token_id, mock_request)
+        await get_current_user(session, mock_user_token_id)
 
     assert exc_info.value.status_code == 401
     assert "Unable to match" in exc_info.value.detail
+
+
+@pytest.mark.asyncio
+async def test_audit_request(monkeypatch: pytest.MonkeyPatch, user_model: UserModel):
+    mock_request = MockRequest(json_data={"key": "value"})
+    audits: list[AuditCreate] = []
+
+    async def mock_write_audit(user_: UserModel, audit_create: AuditCreate) -> None:
+        assert user_ == user_model
+        audits.append(audit_create)
+
+    monkeypatch.setattr("expenseflow.auth.deps.audit_writer.write", mock_write_audit)
+    monkeypatch.setattr("expenseflow.auth.deps.audit_policy", AuditPolicy())
+
+    await audit_request(user_model, mock_request)
+
+    assert len(audits) == 1
+    assert audits[0].method == "POST"
+    assert audits[0].endpoint == "/some-endpoint"
+    assert audits[0].request_body == {"key": "value"}
+
+
+@pytest.mark.asyncio
+async def test_audit_request_excluded_by_policy(
+    monkeypatch: pytest.MonkeyPatch, user_model: UserModel
+):
+    mock_request = MockRequest(method="GET", url="/audits")
+
+    async def mock_write_audit(user_: UserModel, audit_create: AuditCreate) -> None:
+        pytest.fail("Request should not have been audited")
+
+    monkeypatch.setattr("expenseflow.auth.deps.audit_writer.write", mock_write_audit)
+    monkeypatch.setattr(
+        "expenseflow.auth.deps.audit_policy",
+        AuditPolicy(rules=[AuditRule(path="/audits*", audit=False)]),
+    )
+
+    await audit_request(user_model, mock_request)
@@ -1,55 +1,123 @@
 """Auth service tests."""
 
-from unittest.mock import MagicMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from expenseflow.auth.service import JWTError, JWTManager
+from expenseflow.auth.jwks import JWKSError
+from expenseflow.auth.service import JWTError, JWTManager, VerifiedTokenCache
 
 
 @pytest.fixture
 def jwt_manager():
-    return JWTManager(jwt_audience="test-audience", domain="test.auth0.com")
+    manager = JWTManager(jwt_audience="test-audience", domain="test.auth0.com")
+    manager.token_cache.clear()
+    return manager
+
+
+@pytest.fixture
+def mock_jwks_client(
+    jwt_manager: JWTManager, monkeypatch: pytest.MonkeyPatch
+) -> MagicMock:
+    client = MagicMock()
+    client.get_signing_key = AsyncMock(return_value=MagicMock())
+    monkeypatch.setattr(jwt_manager, "jwks_client", client)
+    monkeypatch.setattr(
+        "expenseflow.auth.service.jwt.get_unverified_header",
+        lambda _: {"kid": "test-kid"},
+    )
+    return client
 
 
-@patch("expenseflow.auth.service.jwt.PyJWKClient")
 @pytest.mark.asyncio
 async def test_verify_jwk_client_error(
-    mock_jwk_client: MagicMock, jwt_manager: JWTManager
+    mock_jwks_client: MagicMock, jwt_manager: JWTManager
 ):
-    mock_jwk_client.return_value.get_signing_key_from_jwt.side_effect = Exception(
-        "Key error"
-    )
+    mock_jwks_client.get_signing_key.side_effect = JWKSError("Key error")
     token = "invalid.token"  # noqa: S105
 
     with pytest.raises(JWTError):
         await jwt_manager.verify(token)
 
 
-@patch("expenseflow.auth.service.jwt.PyJWKClient")
+@pytest.mark.asyncio
+async def test_verify_malformed_token(jwt_manager: JWTManager):
+    with pytest.raises(JWTError):
+        await jwt_manager.verify("not-a-token")
+
+
 @patch("expenseflow.auth.service.jwt.decode")
 @pytest.mark.asyncio
 async def test_verify_missing_sub(
-    mock_decode: MagicMock, mock_jwk_client: MagicMock, jwt_manager: JWTManager
+    mock_decode: MagicMock, mock_jwks_client: MagicMock, jwt_manager: JWTManager
 ):
-    mock_key = MagicMock()
-    mock_jwk_client.return_value.get_signing_key_from_jwt.return_value.key = mock_key
-
     mock_decode.return_value = {"some": "data"}  # No 'sub'
 
     with pytest.raises(JWTError):
         await jwt_manager.verify("token-without-sub")
 
 
-@patch("expenseflow.auth.service.jwt.PyJWKClient")
 @patch("expenseflow.auth.service.jwt.decode")
 @pytest.mark.asyncio
 async def test_verify_invalid_signature(
-    mock_decode: MagicMock, mock_jwk_client: MagicMock, jwt_manager: JWTManager
+    mock_decode: MagicMock, mock_jwks_client: MagicMock, jwt_manager: JWTManager
 ):
-    mock_key = MagicMock()
-    mock_jwk_client.return_value.get_signing_key_from_jwt.return_value.key = mock_key
-
     mock_decode.side_effect = Exception("Signature invalid")
 
     with pytest.raises(JWTError):
         await jwt_manager.verify("bad-token")
+
+
+@patch("expenseflow.auth.service.jwt.decode")
+@pytest.mark.asyncio
+async def test_verify_caches_verified_token(
+    mock_decode: MagicMock, mock_jwks_client: MagicMock, jwt_manager: JWTManager
+):
+    mock_decode.return_value = {"sub": "user123", "exp": time.time() + 60}
+
+    assert await jwt_manager.verify("good-token") == "user123"
+    assert await jwt_manager.verify("good-token") == "user123"
+
+    assert mock_decode.call_count == 1
+    assert mock_jwks_client.get_signing_key.await_count == 1
+    assert jwt_manager.token_cache.hits == 1
+    assert jwt_manager.token_cache.misses == 1
+
+
+@patch("expenseflow.auth.service.jwt.decode")
+@pytest.mark.asyncio
+async def test_verify_does_not_cache_without_exp(
+    mock_decode: MagicMock, mock_jwks_client: MagicMock, jwt_manager: JWTManager
+):
+    mock_decode.return_value = {"sub": "user123"}
+
+    await jwt_manager.verify("no-exp-token")
+    await jwt_manager.verify("no-exp-token")
+
+    assert mock_decode.call_count == 2
+    assert len(jwt_manager.token_cache) == 0
+
+
+def test_token_cache_evicts_expired():
+    cache = VerifiedTokenCache(max_size=10)
+    key = VerifiedTokenCache.key_for("token")
+    cache.set(key, "user123", time.time() - 1)
+
+    assert cache.get(key) is None
+    assert len(cache) == 0
+    assert cache.misses == 1
+
+
+def test_token_cache_evicts_least_recently_used():
+    cache = VerifiedTokenCache(max_size=2)
+    expires_at = time.time() + 60
+    cache.set("a", "user-a", expires_at)
+    cache.set("b", "user-b", expires_at)
+
+    assert cache.get("a") == "user-a"  # 'b' is now least recently used
+    cache.set("c", "user-c", expires_at)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "user-a"
+    assert cache.get("c") == "user-c"
+    assert len(cache) == 2
@@ -0,0 +1,179 @@
+"""JWKS client tests."""
+
+import asyncio
+import json
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from expenseflow.auth.jwks import JWKSClient, JWKSError, StaticJWKSClient
+
+
+class JWKSStub:
+    """Local JWKS server that counts how often it is hit."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.requests = 0
+        self.fail = False
+        self.delay = 0.0
+        self.kids = ["kid-1"]
+
+    def jwks(self) -> dict:  # noqa: D102
+        keys = []
+        for kid in self.kids:
+            public_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).public_key()
+            jwk = RSAAlgorithm.to_jwk(public_key, as_dict=True)
+            keys.append({**jwk, "kid": kid, "use": "sig", "alg": "RS256"})
+        return {"keys": keys}
+
+
+@pytest.fixture
+def jwks_stub() -> Generator[tuple[JWKSStub, str]]:
+    stub = JWKSStub()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            stub.requests += 1
+            if stub.delay:
+                threading.Event().wait(stub.delay)
+            if stub.fail:
+                self.send_response(503)
+                self.end_headers()
+                return
+            body = json.dumps(stub.jwks()).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:  # noqa: ANN002
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield stub, f"http://127.0.0.1:{server.server_port}/.well-known/jwks.json"
+
+    server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_get_signing_key(jwks_stub: tuple[JWKSStub, str]):
+    stub, url = jwks_stub
+    client = JWKSClient(url)
+
+    key = await client.get_signing_key("kid-1")
+
+    assert key.key_id == "kid-1"
+    assert stub.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(jwks_stub: tuple[JWKSStub, str]):
+    stub, url = jwks_stub
+    stub.delay = 0.1
+    client = JWKSClient(url)
+
+    keys = await asyncio.gather(*[client.get_signing_key("kid-1") for _ in range(10)])
+
+    assert all(k.key_id == "kid-1" for k in keys)
+    assert stub.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid(jwks_stub: tuple[JWKSStub, str]):
+    stub, url = jwks_stub
+    client = JWKSClient(url, min_refresh_interval=60)
+
+    await client.get_signing_key("kid-1")
+    with pytest.raises(JWKSError):
+        await client.get_signing_key("forged-kid")
+    with pytest.raises(JWKSError):
+        await client.get_signing_key("forged-kid")
+
+    # Forged key ids don't trigger a refetch every time
+    assert stub.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_rotated_kid_is_fetched(jwks_stub: tuple[JWKSStub, str]):
+    stub, url = jwks_stub
+    client = JWKSClient(url, min_refresh_interval=0)
+
+    await client.get_signing_key("kid-1")
+    stub.kids = ["kid-2"]
+    key = await client.get_signing_key("kid-2")
+
+    assert key.key_id == "kid-2"
+    assert stub.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_keys_served_while_provider_fails(
+    jwks_stub: tuple[JWKSStub, str],
+):
+    stub, url = jwks_stub
+    client = JWKSClient(url, cache_ttl=0)
+
+    await client.get_signing_key("kid-1")
+    stub.fail = True
+
+    key = await client.get_signing_key("kid-1")
+    await client.refresh()
+
+    assert key.key_id == "kid-1"
+    assert stub.requests >= 2
+
+
+@pytest.mark.asyncio
+async def test_unavailable_provider_without_keys(jwks_stub: tuple[JWKSStub, str]):
+    stub, url = jwks_stub
+    stub.fail = True
+    client = JWKSClient(url)
+
+    with pytest.raises(JWKSError):
+        await client.get_signing_key("kid-1")
+
+
+@pytest.mark.asyncio
+async def test_background_refresh(jwks_stub: tuple[JWKSStub, str]):
+    stub, url = jwks_stub
+    client = JWKSClient(url, cache_ttl=0.2, refresh_margin=0.1, min_refresh_interval=0)
+
+    client.start()
+    await asyncio.sleep(0.35)
+    await client.stop()
+
+    assert stub.requests >= 2
+
+
+@pytest.mark.asyncio
+async def test_static_jwks_client(tmp_path: Path):
+    stub = JWKSStub()
+    stub.kids = ["kid-1", "kid-2"]
+    jwks = stub.jwks()
+    jwks_file = tmp_path / "jwks.json"
+    jwks_file.write_text(json.dumps(jwks))
+
+    for client in (
+        StaticJWKSClient(jwks),
+        StaticJWKSClient.from_source(str(jwks_file)),
+        StaticJWKSClient.from_source(json.dumps(jwks)),
+    ):
+        assert (await client.get_signing_key("kid-2")).key_id == "kid-2"
+        with pytest.raises(JWKSError):
+            await client.get_signing_key("kid-3")
+
+
+def test_static_jwks_client_invalid_source(tmp_path: Path):
+    with pytest.raises(JWKSError):
+        StaticJWKSClient.from_source(str(tmp_path / "missing.json"))
+    with pytest.raises(JWKSError):
+        StaticJWKSClient.from_source("{not json")
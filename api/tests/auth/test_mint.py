@@ -0,0 +1,73 @@
+"""Token minting tests."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from expenseflow.auth.mint import (
+    build_jwks,
+    generate_key,
+    main,
+    mint_token,
+    synthetic_subject,
+)
+from expenseflow.auth.service import JWTError, JWTManager
+
+
+@pytest.fixture
+def offline_jwt_manager(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> tuple[JWTManager, Path]:
+    main(["--users", "3", "--out-dir", str(tmp_path), "--audience", "aud"])
+
+    # Side step the singleton so the shared manager is left untouched
+    monkeypatch.setattr(JWTManager, "_instance", None)
+    manager = JWTManager(
+        jwt_audience="aud",
+        domain="",
+        jwks_source=str(tmp_path / "jwks.json"),
+    )
+    return manager, tmp_path
+
+
+@pytest.mark.asyncio
+async def test_minted_tokens_verify(offline_jwt_manager: tuple[JWTManager, Path]):
+    manager, out_dir = offline_jwt_manager
+    tokens = json.loads((out_dir / "tokens.json").read_text())
+
+    assert list(tokens) == [synthetic_subject(i) for i in range(3)]
+    for sub, token in tokens.items():
+        assert await manager.verify(token) == sub
+
+
+@pytest.mark.asyncio
+async def test_tokens_from_other_keys_are_rejected(
+    offline_jwt_manager: tuple[JWTManager, Path],
+):
+    manager, _ = offline_jwt_manager
+
+    token = mint_token(generate_key(), "sub", audience="aud", domain="")
+
+    with pytest.raises(JWTError):
+        await manager.verify(token)
+
+
+@pytest.mark.asyncio
+async def test_expired_tokens_are_rejected(
+    offline_jwt_manager: tuple[JWTManager, Path],
+):
+    from expenseflow.auth.mint import load_key
+
+    manager, out_dir = offline_jwt_manager
+    key = load_key(out_dir / "private_key.pem")
+
+    token = mint_token(key, "sub", audience="aud", domain="", expires_in=-60)
+
+    with pytest.raises(JWTError):
+        await manager.verify(token)
+
+
+def test_build_jwks():
+    jwks = build_jwks(generate_key(), kid="kid")
+
+    assert [k["kid"] for k in jwks["keys"]] == ["kid"]
+    assert "d" not in jwks["keys"][0]
@@ -3,11 +3,12 @@
 import asyncio
 import os
 from collections.abc import AsyncGenerator
+from contextlib import nullcontext
 
 import pytest
 import pytest_asyncio
 from expenseflow.audit.models import AuditModel
-from expenseflow.database.service import initialise_database
+from expenseflow.database.migrations import upgrade
 from expenseflow.expense.models import (
     ExpenseItemModel,
     ExpenseItemSplitModel,
@@ -100,7 +101,7 @@ async def db() -> AsyncGenerator[None]:
     # Create fresh new one
     create_database(SYNC_TEST_DB_URL)
 
-    await initialise_database(test_engine)
+    await upgrade(test_engine)
     yield
 
 
@@ -141,13 +142,27 @@ async def test_client(
     """Test client fixture."""
     # Need to override
 
-    from expenseflow.auth.deps import get_current_user, get_user_token_identifier
-    from expenseflow.database.deps import get_db
+    from expenseflow.auth.deps import (
+        audit_request,
+        get_current_user,
+        get_user_token_identifier,
+    )
+    from expenseflow.database.deps import (
+        get_db,
+        get_read_db,
+        get_read_session_factory,
+    )
 
     # Override dependencies
     test_app.dependency_overrides[get_current_user] = lambda: default_user
+    test_app.dependency_overrides[audit_request] = lambda: None
     test_app.dependency_overrides[get_user_token_identifier] = lambda: "token_id"
     test_app.dependency_overrides[get_db] = lambda: session
+    test_app.dependency_overrides[get_read_db] = lambda: session
+    # Sessions opened from the factory are the test's session, left open
+    test_app.dependency_overrides[get_read_session_factory] = lambda: lambda: (
+        nullcontext(session)
+    )
 
     async with AsyncClient(
         transport=ASGITransport(app=test_app), base_url="http://test"
@@ -0,0 +1,127 @@
+"""Schema migration tests."""
+
+import datetime as dt
+
+import pytest
+from sqlalchemy import Connection, inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from expenseflow.audit.partitions import (
+    add_months,
+    get_partitions,
+    is_partitioned,
+    month_start,
+    partition_name,
+)
+from expenseflow.database import migrations
+from expenseflow.database.migrations import (
+    HEAD,
+    MIGRATIONS,
+    SchemaVersionError,
+    check_schema_version,
+    get_schema_version,
+    run_migrations,
+)
+from expenseflow.user.schemas import UserCreateInternal
+
+
+@pytest.fixture
+def engine(session: AsyncSession) -> AsyncEngine:
+    assert isinstance(session.bind, AsyncEngine)
+    return session.bind
+
+
+def index_names(conn: Connection, table: str) -> set[str | None]:
+    return {index["name"] for index in inspect(conn).get_indexes(table)}
+
+
+def column_types(conn: Connection, table: str) -> dict[str, str]:
+    return {column["name"]: str(column["type"]) for column in inspect(conn).get_columns(table)}
+
+
+def test_migration_versions_are_sequential():
+    assert [m.version for m in MIGRATIONS] == list(range(1, len(MIGRATIONS) + 1))
+    assert MIGRATIONS[-1].version == HEAD
+
+
+@pytest.mark.asyncio()
+async def test_schema_is_at_head(session: AsyncSession):
+    conn = await session.connection()
+
+    assert await get_schema_version(conn) == HEAD
+    assert await run_migrations(conn) == []
+
+
+@pytest.mark.asyncio()
+async def test_check_schema_version(engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch):
+    assert await check_schema_version(engine) == HEAD
+
+    monkeypatch.setattr(migrations, "HEAD", HEAD + 1)
+    with pytest.raises(SchemaVersionError):
+        await check_schema_version(engine)
+
+
+@pytest.mark.asyncio()
+async def test_legacy_schema_is_upgraded(session: AsyncSession, user_create_internal: UserCreateInternal):
+    from expenseflow.user.service import create_user
+
+    user = await create_user(session, user_create_internal)
+    conn = await session.connection()
+
+    # Recreate the schema as it was before migrations existed
+    await conn.execute(text("DROP TABLE schema_version"))
+    await conn.execute(text("DROP TABLE audit CASCADE"))
+    await conn.execute(text("DROP INDEX ix_expense_item_split_user_id_expense_item_id"))
+    await conn.execute(text("ALTER TABLE expense DROP COLUMN total_cents, DROP COLUMN status"))
+    await conn.execute(
+        text("ALTER TABLE expense_item DROP COLUMN price_cents, ADD COLUMN price DOUBLE PRECISION NOT NULL")
+    )
+    await conn.execute(text("ALTER TABLE expense_item_split ALTER COLUMN proportion TYPE DOUBLE PRECISION"))
+    await conn.execute(
+        text(
+            "CREATE TABLE audit ("
+            "audit_id UUID PRIMARY KEY, "
+            'user_id UUID NOT NULL REFERENCES "user" (user_id) ON DELETE CASCADE, '
+            "method VARCHAR NOT NULL, "
+            "endpoint VARCHAR NOT NULL, "
+            "request_body JSON, "
+            "created_at TIMESTAMPTZ NOT NULL DEFAULT now(), "
+            "updated_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        )
+    )
+    created_at = dt.datetime.now(dt.UTC) - dt.timedelta(days=70)
+    await conn.execute(
+        text(
+            "INSERT INTO audit (audit_id, user_id, method, endpoint, created_at) "
+            "VALUES (gen_random_uuid(), :user_id, 'POST', '/expenses', :created_at)"
+        ),
+        {"user_id": user.user_id, "created_at": created_at},
+    )
+
+    assert await run_migrations(conn) == [m.version for m in MIGRATIONS[1:]]
+
+    assert await get_schema_version(conn) == HEAD
+    assert await is_partitioned(conn)
+    assert await conn.scalar(text("SELECT count(*) FROM audit")) == 1
+
+    partitions = await get_partitions(conn)
+    oldest_month = month_start(created_at.date())
+    assert partition_name(oldest_month) in partitions
+    assert partition_name(add_months(oldest_month, 1)) in partitions
+
+    assert "ix_expense_item_split_user_id_expense_item_id" in (await conn.run_sync(index_names, "expense_item_split"))
+    assert "ix_audit_user_id_created_at" in (await conn.run_sync(index_names, "audit"))
+    expense_indexes = await conn.run_sync(index_names, "expense")
+    assert {
+        "ix_expense_uploader_id_expense_date",
+        "ix_expense_parent_id_expense_date",
+    } <= expense_indexes
+    assert "ix_expense_uploader_id" not in expense_indexes
+
+    item_types = await conn.run_sync(column_types, "expense_item")
+    assert item_types["price_cents"] == "BIGINT"
+    assert "price" not in item_types
+    split_types = await conn.run_sync(column_types, "expense_item_split")
+    assert split_types["proportion"] == "NUMERIC(7, 6)"
+    expense_types = await conn.run_sync(column_types, "expense")
+    assert {"total_cents", "status"} <= expense_types.keys()
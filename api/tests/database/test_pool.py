@@ -0,0 +1,81 @@
+"""Connection pool tests."""
+
+import os
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from expenseflow.database.pool import InstrumentedAsyncPool, PoolMetrics
+
+
+def test_wait_time_histogram():
+    metrics = PoolMetrics()
+
+    metrics.observe_checkout(0.0005)
+    metrics.observe_checkout(0.003)
+    metrics.observe_checkout(60)
+    metrics.observe_failure()
+
+    histogram = metrics.wait_time_histogram()
+    assert metrics.checkouts == 3
+    assert metrics.failures == 1
+    assert histogram["0.001"] == 1
+    assert histogram["0.005"] == 2
+    assert histogram["10"] == 2
+    assert histogram["+Inf"] == 3
+
+
+@pytest.mark.asyncio()
+async def test_instrumented_pool():
+    engine = create_async_engine(
+        os.environ["DB_URL"],
+        poolclass=InstrumentedAsyncPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    pool = engine.pool
+    assert isinstance(pool, InstrumentedAsyncPool)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+        status = pool.status_read()
+        assert status.checked_out == 1
+        assert status.checkouts == 1
+
+        # The only connection is checked out, so this one times out
+        with pytest.raises(PoolTimeoutError):
+            async with engine.connect():
+                pass
+
+    status = pool.status_read()
+    assert status.checked_out == 0
+    assert status.checkout_failures == 1
+    assert status.wait_time_histogram["+Inf"] == 1
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio()
+async def test_db_pool_metrics(test_client: AsyncClient):
+    response = await test_client.get("/metrics/db-pool")
+
+    assert response.status_code == 200
+    assert {"size", "checked_out", "wait_time_histogram"} <= response.json().keys()
+
+
+@pytest.mark.asyncio()
+async def test_db_pool_metrics_requires_token(test_app: FastAPI, monkeypatch: pytest.MonkeyPatch):
+    from expenseflow.auth.deps import get_user_token_identifier
+
+    overrides = {k: v for k, v in test_app.dependency_overrides.items() if k is not get_user_token_identifier}
+    monkeypatch.setattr(test_app, "dependency_overrides", overrides)
+    async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as client:
+        response = await client.get("/metrics/db-pool")
+
+    assert response.status_code in {401, 403}
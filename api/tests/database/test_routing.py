@@ -0,0 +1,73 @@
+"""Read replica routing tests."""
+
+import time
+
+import pytest
+from fastapi import Request
+
+from expenseflow.database import core
+from expenseflow.database.routing import RecentWriters, client_key, is_write_request
+
+
+def make_request(method: str = "GET", credentials: str | None = "credentials") -> Request:
+    headers = [] if credentials is None else [(b"authorization", f"Bearer {credentials}".encode())]
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+def test_recent_writers(monkeypatch: pytest.MonkeyPatch):
+    writers = RecentWriters(5.0, max_size=2)
+
+    writers.mark("a")
+    assert writers.is_recent("a")
+    assert not writers.is_recent("b")
+
+    writers.mark("b")
+    writers.mark("c")
+    assert len(writers) == 2
+    assert not writers.is_recent("a")
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+    assert not writers.is_recent("b")
+    assert len(writers) == 1
+
+
+def test_recent_writers_disabled():
+    writers = RecentWriters(0)
+
+    writers.mark("a")
+
+    assert not writers.is_recent("a")
+
+
+def test_client_key():
+    assert client_key(make_request(credentials="a")) == client_key(make_request(credentials="a"))
+    assert client_key(make_request(credentials="a")) != client_key(make_request(credentials="b"))
+    assert client_key(make_request(credentials=None)) is None
+
+
+def test_is_write_request():
+    assert not is_write_request(make_request("GET"))
+    assert is_write_request(make_request("POST"))
+    assert is_write_request(make_request("DELETE"))
+
+
+def test_read_routing(monkeypatch: pytest.MonkeyPatch):
+    replica_factory = object()
+    writers = RecentWriters(5.0)
+    monkeypatch.setattr(core, "recent_writers", writers)
+    monkeypatch.setattr(core, "read_session_factory", replica_factory)
+
+    # Without a replica everything goes to the primary
+    monkeypatch.setattr(core, "read_engine", core.db_engine)
+    assert core.get_read_session_factory(make_request()) is core.session_factory
+
+    monkeypatch.setattr(core, "read_engine", object())
+    assert core.get_read_session_factory(make_request()) is replica_factory
+
+    # Clients read their own writes from the primary
+    key = client_key(make_request("POST", credentials="writer"))
+    assert key is not None
+    writers.mark(key)
+    assert core.get_read_session_factory(make_request(credentials="writer")) is core.session_factory
+    assert core.get_read_session_factory(make_request()) is replica_factory
@@ -0,0 +1,84 @@
+"""Unit of work tests."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from expenseflow.group.schemas import GroupCreate
+from expenseflow.user.models import UserModel
+from expenseflow.user.schemas import UserCreateInternal
+from tests.factories import UserCreateInternalFactory
+
+
+@pytest.mark.asyncio()
+async def test_services_do_not_commit(
+    session: AsyncSession,
+    user_create_internal: UserCreateInternal,
+    group_create: GroupCreate,
+):
+    from expenseflow.group.service import create_group
+    from expenseflow.user.service import create_user
+
+    commits = 0
+
+    def count_commit(_: object) -> None:
+        nonlocal commits
+        commits += 1
+
+    event.listen(session.sync_session, "after_commit", count_commit)
+
+    user = await create_user(session, user_create_internal)
+    await create_group(session, user, group_create)
+
+    assert commits == 0
+    assert session.in_transaction()
+
+
+@pytest.mark.asyncio()
+async def test_savepoint_only_rolls_back_block(session: AsyncSession, user_create_internal: UserCreateInternal):
+    from expenseflow.database.core import savepoint
+    from expenseflow.user.service import create_user, get_user_by_token_id
+
+    user = await create_user(session, user_create_internal)
+    other_user_in = UserCreateInternalFactory.build()
+
+    with pytest.raises(ValueError):  # noqa: PT011, PT012
+        async with savepoint(session):
+            await create_user(session, other_user_in)
+            raise ValueError
+
+    assert await get_user_by_token_id(session, user.token_id) is not None
+    assert await get_user_by_token_id(session, other_user_in.token_id) is None
+
+
+@pytest.mark.asyncio()
+async def test_create_user_conflict_keeps_transaction_usable(
+    session: AsyncSession,
+    user_create_internal: UserCreateInternal,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from expenseflow.errors import ExistsError
+    from expenseflow.user import service
+    from expenseflow.user.service import create_user, get_user_by_token_id
+
+    async def no_user(*_: object) -> None:
+        return None
+
+    # Skip the nickname pre-check to simulate losing a race for it
+    monkeypatch.setattr(service, "get_user_by_nickname", no_user)
+
+    existing = UserModel(
+        nickname="taken",
+        first_name="a",
+        last_name="b",
+        token_id="other",  # noqa: S106
+        budget=0,
+    )
+    session.add(existing)
+    await session.flush()
+
+    user_in = user_create_internal.model_copy(update={"nickname": "taken"})
+    with pytest.raises(ExistsError):
+        await create_user(session, user_in)
+
+    assert await get_user_by_token_id(session, "other") is not None
@@ -0,0 +1,39 @@
+"""Expense export formatting tests."""
+
+import datetime as dt
+import json
+from decimal import Decimal
+from uuid import uuid4
+
+from expenseflow.enums import ExpenseStatus
+from expenseflow.expense.exports import format_csv, format_ndjson
+
+columns = ["expense_id", "name", "expense_date", "price", "status"]
+
+
+def test_format_rows():
+    expense_id = uuid4()
+    expense_date = dt.datetime(2024, 5, 1, 12, tzinfo=dt.UTC)
+    rows = [
+        (
+            expense_id,
+            'Lunch, "team"',
+            expense_date,
+            Decimal("12.50"),
+            ExpenseStatus.paid,
+        )
+    ]
+
+    assert format_csv([columns, *rows]).splitlines() == [
+        "expense_id,name,expense_date,price,status",
+        f'{expense_id},"Lunch, ""team""",2024-05-01T12:00:00+00:00,12.50,paid',
+    ]
+    assert [json.loads(line) for line in format_ndjson(rows, columns).splitlines()] == [
+        {
+            "expense_id": str(expense_id),
+            "name": 'Lunch, "team"',
+            "expense_date": "2024-05-01T12:00:00+00:00",
+            "price": "12.50",
+            "status": "paid",
+        }
+    ]
@@ -0,0 +1,121 @@
+"""Expense import parsing tests."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from expenseflow.errors import InvalidImportError
+from expenseflow.expense.imports import (
+    CSV_MEDIA_TYPE,
+    MAX_LINE_LENGTH,
+    NDJSON_MEDIA_TYPE,
+    ImportRow,
+    iter_chunks,
+    iter_lines,
+    parse_import,
+)
+from expenseflow.expense.schemas import ExpenseCreate
+
+
+async def stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def parse(media_type: str, *chunks: bytes) -> list[ImportRow]:
+    return [row async for row in parse_import(stream(*chunks), media_type)]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_across_chunks():
+    # The 'é' is split between chunks too
+    chunks = stream(b"caf\xc3", b"\xa9\r\nsecond ", b"line\nlast")
+
+    assert [line async for line in iter_lines(chunks)] == [
+        "café",
+        "second line",
+        "last",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parse_csv():
+    rows = await parse(
+        CSV_MEDIA_TYPE,
+        b"name,category,expense_date,price,description\n",
+        b'Lunch,takeaway,2024-05-01T12:00:00Z,12.5,"Team\nlunch"\n',
+        b"Flight,not-a-category,2024-05-02T08:00:00Z,300,\n",
+        b"Short,row\n",
+    )
+
+    assert [row for row, _ in rows] == [2, 3, 4]
+    expense = rows[0][1]
+    assert isinstance(expense, ExpenseCreate)
+    assert expense.description == "Team\nlunch"
+    assert [(i.name, i.quantity, i.price) for i in expense.items] == [("Lunch", 1, 12.5)]
+    assert expense.splits is None
+    assert isinstance(rows[1][1], str)
+    assert rows[1][1].startswith("category:")
+    assert rows[2][1] == "Expected 5 columns, got 2"
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_missing_columns():
+    with pytest.raises(InvalidImportError):
+        await parse(CSV_MEDIA_TYPE, b"name,price\nLunch,12.5\n")
+
+
+@pytest.mark.asyncio
+async def test_parse_ndjson():
+    expense = (
+        b'{"name": "Lunch", "description": "", "category": "takeaway", '
+        b'"expense_date": "2024-05-01T12:00:00Z", '
+        b'"items": [{"name": "Pizza", "quantity": 2, "price": 9.5}]}'
+    )
+    rows = await parse(NDJSON_MEDIA_TYPE, expense + b"\n\nnot json\n{}")
+
+    assert [row for row, _ in rows] == [1, 3, 4]
+    assert isinstance(rows[0][1], ExpenseCreate)
+    assert rows[1][1] == "Invalid JSON"
+    assert isinstance(rows[2][1], str)
+
+
+def test_parse_unsupported_media_type():
+    with pytest.raises(InvalidImportError):
+        parse_import(stream(), "application/json")
+
+
+@pytest.mark.asyncio
+async def test_iter_chunks():
+    async def rows() -> AsyncIterator[ImportRow]:
+        for row in range(5):
+            yield row, "error"
+
+    chunks = [chunk async for chunk in iter_chunks(rows(), size=2)]
+    assert [[row for row, _ in chunk] for chunk in chunks] == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_byte_order_mark():
+    rows = await parse(
+        CSV_MEDIA_TYPE, b"\xef\xbb\xbfname,category,expense_date,price\n", b"Lunch,takeaway,2024-05-01,9\n"
+    )
+
+    assert [row for row, _ in rows] == [2]
+    assert isinstance(rows[0][1], ExpenseCreate)
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_too_long():
+    chunks = stream(b"short\n", *[b"x" * 1024] * 1025)
+
+    with pytest.raises(InvalidImportError):
+        _ = [line async for line in iter_lines(chunks)]
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_record_too_long():
+    lines = b'name,category,expense_date,price\n"' + b"x\n" * MAX_LINE_LENGTH
+
+    with pytest.raises(InvalidImportError):
+        await parse(CSV_MEDIA_TYPE, lines)
@@ -0,0 +1,105 @@
+"""Expense loading tests."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from expenseflow.expense.schemas import ExpenseItemSplitCreate
+from expenseflow.user.models import UserModel
+from tests.factories import (
+    ExpenseCreateFactory,
+    ExpenseItemCreateFactory,
+    UserModelFactory,
+)
+
+base_url = "/expenses"
+
+
+@contextmanager
+def capture_statements(engine: AsyncEngine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:  # noqa: ANN401
+        statements.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_get_all_statement_count(  # noqa: PLR0913
+    session: AsyncSession,
+    test_client: AsyncClient,
+    expense_create_factory: ExpenseCreateFactory,
+    expense_item_create_factory: ExpenseItemCreateFactory,
+    default_user: UserModel,
+    user_model_factory: UserModelFactory,
+):
+    other_user = user_model_factory.build()
+    session.add_all([default_user, other_user])
+    await session.commit()
+
+    async def create_expenses(count: int) -> None:
+        for _ in range(count):
+            expense = expense_create_factory.build()
+            expense.items = expense_item_create_factory.batch(3)
+            expense.splits = [
+                ExpenseItemSplitCreate(user_id=user.user_id, proportion=0.5) for user in (default_user, other_user)
+            ]
+            response = await test_client.post(base_url, json=expense.model_dump(mode="json"))
+            assert response.status_code == 200
+
+    async def get_all() -> tuple[int, int]:
+        # Nothing is already loaded, as in a new request
+        session.expunge_all()
+        assert isinstance(session.bind, AsyncEngine)
+        with capture_statements(session.bind) as statements:
+            response = await test_client.get(base_url + "/all")
+        assert response.status_code == 200
+        return len(response.json()), len(statements)
+
+    await create_expenses(1)
+    expenses, statements = await get_all()
+    assert expenses == 1
+
+    await create_expenses(9)
+    more_expenses, more_statements = await get_all()
+    assert more_expenses == 10
+
+    # The expenses, then their items, then the items' splits
+    assert statements == more_statements == 3
+
+
+@pytest.mark.asyncio
+async def test_create_statement_count(
+    session: AsyncSession,
+    test_client: AsyncClient,
+    expense_create_factory: ExpenseCreateFactory,
+    expense_item_create_factory: ExpenseItemCreateFactory,
+    default_user: UserModel,
+):
+    session.add(default_user)
+    await session.commit()
+    engine = session.bind
+    assert isinstance(engine, AsyncEngine)
+
+    async def create(items: int) -> int:
+        expense = expense_create_factory.build()
+        expense.items = expense_item_create_factory.batch(items)
+        expense.splits = [ExpenseItemSplitCreate(user_id=default_user.user_id, proportion=1)]
+        with capture_statements(engine) as statements:
+            response = await test_client.post(base_url, json=expense.model_dump(mode="json"))
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == items
+        return sum(s.startswith("INSERT INTO expense_item") for s in statements)
+
+    # The items, then their splits, however many there are
+    assert await create(1) == await create(100) == 2
@@ -1,10 +1,16 @@
 """Expense route tests."""
 
-from datetime import datetime, timedelta
+import json
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from functools import partial
 from uuid import uuid4
 
 import pytest
 from expenseflow.enums import ExpenseStatus
+from expenseflow.expense.imports import iter_chunks
+from expenseflow.expense.money import from_cents, to_cents
+from expenseflow.expense.schemas import ExpenseItemSplitCreate
 from expenseflow.user.models import UserModel
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -334,8 +340,8 @@ async def test_get_non_empty_overview(
     response = await test_client.send(request)
     assert response.status_code == 200
     response_json = response.json()
-    totalsum = item1.quantity * item1.price
-    assert response_json["total"] == round(totalsum, 2)
+    totalsum = item1.quantity * from_cents(to_cents(item1.price))
+    assert response_json["total"] == float(totalsum)
     assert response_json["categories"] != []
 
 
@@ -504,3 +510,209 @@ async def test_update_status(  # noqa: PLR0913
     assert response.status_code == 200
     assert response.json()["items"][0]["splits"][1]["status"] == "accepted"
     assert response.json()["items"][0]["splits"][1]["status"] == ExpenseStatus.accepted
+    assert response.json()["status"] == "accepted"
+
+
+@pytest.mark.asyncio
+async def test_create_split_in_thirds(  # noqa: PLR0913
+    session: AsyncSession,
+    test_client: AsyncClient,
+    expense_create_factory: ExpenseCreateFactory,
+    expense_item_create_factory: ExpenseItemCreateFactory,
+    default_user: UserModel,
+    user_model_factory: UserModelFactory,
+):
+    others = user_model_factory.batch(2)
+    session.add_all([default_user, *others])
+    await session.commit()
+
+    expense = expense_create_factory.build()
+    expense.items = [expense_item_create_factory.build(quantity=1, price=10.0)]
+    expense.splits = [
+        ExpenseItemSplitCreate(user_id=user.user_id, proportion=1 / 3)
+        for user in [default_user, *others]
+    ]
+
+    request = test_client.build_request(
+        method="post", url=base_url, json=expense.model_dump(mode="json")
+    )
+    response = await test_client.send(request)
+
+    assert response.status_code == 200
+    splits = response.json()["items"][0]["splits"]
+    assert sum(Decimal(str(split["proportion"])) for split in splits) == 1
+    assert response.json()["expense_total"] == 10.0
+    assert response.json()["status"] == "requested"
+
+    request = test_client.build_request(method="get", url=base_url + "/overview")
+    response = await test_client.send(request)
+    assert response.json()["total"] == 3.33
+
+
+@pytest.mark.asyncio
+async def test_create_price_out_of_range(
+    test_client: AsyncClient, expense_create_factory: ExpenseCreateFactory
+):
+    body = expense_create_factory.build(splits=None).model_dump(mode="json")
+    body["items"] = [{"name": "Yacht", "quantity": 1, "price": 1e30}]
+
+    response = await test_client.post(base_url, json=body)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_summaries(
+    test_client: AsyncClient,
+    expense_create_factory: ExpenseCreateFactory,
+    expense_item_create_factory: ExpenseItemCreateFactory,
+):
+    expense = expense_create_factory.build()
+    expense.splits = None
+    expense.items = [expense_item_create_factory.build(quantity=2, price=1.25)]
+
+    request = test_client.build_request(
+        method="post", url=base_url, json=expense.model_dump(mode="json")
+    )
+    created = (await test_client.send(request)).json()
+
+    for url in (base_url + "/summary", base_url + "/all/summary"):
+        response = await test_client.get(url)
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "expense_id": created["expense_id"],
+                "name": created["name"],
+                "category": created["category"],
+                "expense_date": created["expense_date"],
+                "expense_total": 2.5,
+                "status": "paid",
+            }
+        ]
+
+
+@pytest.mark.asyncio
+async def test_get_expenses_pages(
+    test_client: AsyncClient,
+    expense_create_factory: ExpenseCreateFactory,
+):
+    now = datetime.now(UTC)
+    created = []
+    for days, category in ((2, "groceries"), (1, "travel"), (0, "groceries")):
+        expense = expense_create_factory.build(
+            expense_date=now - timedelta(days=days), category=category
+        )
+        expense.splits = None
+        response = await test_client.post(
+            base_url, json=expense.model_dump(mode="json")
+        )
+        created.append(response.json()["expense_id"])
+    newest_first = created[::-1]
+
+    for url in (base_url, base_url + "/all", base_url + "/all/summary"):
+        response = await test_client.get(url)
+        assert [e["expense_id"] for e in response.json()] == newest_first
+        assert "X-Next-Cursor" not in response.headers
+
+        response = await test_client.get(url, params={"limit": 2})
+        assert [e["expense_id"] for e in response.json()] == newest_first[:2]
+        cursor = response.headers["X-Next-Cursor"]
+
+        response = await test_client.get(url, params={"limit": 2, "cursor": cursor})
+        assert [e["expense_id"] for e in response.json()] == newest_first[2:]
+        assert "X-Next-Cursor" not in response.headers
+
+        response = await test_client.get(url, params={"category": "groceries"})
+        assert [e["expense_id"] for e in response.json()] == [created[2], created[0]]
+
+        response = await test_client.get(
+            url, params={"since": (now - timedelta(days=1, hours=1)).isoformat()}
+        )
+        assert [e["expense_id"] for e in response.json()] == newest_first[:2]
+
+
+@pytest.mark.asyncio
+async def test_get_expenses_invalid_cursor(test_client: AsyncClient):
+    response = await test_client.get(base_url, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_expenses(test_client: AsyncClient):
+    body = (
+        "name,category,expense_date,price,quantity\n"
+        "Lunch,takeaway,2024-05-01T12:00:00Z,12.5,2\n"
+        "Flight,not-a-category,2024-05-02T08:00:00Z,300,1\n"
+    )
+    response = await test_client.post(
+        base_url + "/import", content=body, headers={"content-type": "text/csv"}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["created"], report["failed"]) == (1, 1)
+    assert [result["row"] for result in report["results"]] == [2, 3]
+    assert report["results"][1]["error"] is not None
+
+    response = await test_client.get(base_url)
+    assert [e["expense_id"] for e in response.json()] == [
+        report["results"][0]["expense_id"]
+    ]
+    assert response.json()[0]["expense_total"] == 25
+
+
+@pytest.mark.asyncio
+async def test_import_expenses_invalid_part_way(
+    test_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    # The valid row is committed in its own chunk before the long line is read
+    monkeypatch.setattr(
+        "expenseflow.expense.routes.iter_chunks", partial(iter_chunks, size=1)
+    )
+    monkeypatch.setattr("expenseflow.expense.imports.MAX_LINE_LENGTH", 100)
+    body = (
+        "name,category,expense_date,price\n"
+        "Lunch,takeaway,2024-05-01T12:00:00Z,12.5\n" + "x" * 101 + "\n"
+    )
+    response = await test_client.post(
+        base_url + "/import", content=body, headers={"content-type": "text/csv"}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["created"], report["failed"]) == (1, 0)
+    assert report["error"] is not None
+
+
+@pytest.mark.asyncio
+async def test_import_expenses_unsupported_media_type(test_client: AsyncClient):
+    response = await test_client.post(base_url + "/import", json=[])
+    assert response.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_export_expenses(
+    test_client: AsyncClient,
+    expense_create_factory: ExpenseCreateFactory,
+    expense_item_create_factory: ExpenseItemCreateFactory,
+):
+    expense = expense_create_factory.build()
+    expense.splits = None
+    expense.items = expense_item_create_factory.batch(2)
+    created = (
+        await test_client.post(base_url, json=expense.model_dump(mode="json"))
+    ).json()
+
+    response = await test_client.get(base_url + "/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    header, *rows = response.text.splitlines()
+    assert header.startswith("expense_id,name,")
+    # A row per split of each item
+    assert len(rows) == 2
+    assert all(row.startswith(created["expense_id"]) for row in rows)
+
+    response = await test_client.get(base_url + "/export", params={"format": "ndjson"})
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert {line["expense_item_id"] for line in lines} == {
+        item["expense_item_id"] for item in created["items"]
+    }
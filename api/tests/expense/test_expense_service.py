@@ -5,7 +5,7 @@ from enum import Enum
 import pytest
 from expenseflow.enums import ExpenseStatus
 from expenseflow.errors import InvalidStateError
-from expenseflow.expense.service import is_valid_expense_change
+from expenseflow.expense.service import get_lowest_status, is_valid_expense_change
 
 
 class _TestResult(Enum):
@@ -90,3 +90,16 @@ def test_is_valid_expense_change(
             )
     else:
         raise Exception  # noqa: TRY002
+
+
+@pytest.mark.parametrize(
+    ("statuses", "lowest"),
+    [
+        ([], p),
+        ([p, p], p),
+        ([p, a, p], a),
+        ([a, r, p], r),
+    ],
+)
+def test_get_lowest_status(statuses: list[ExpenseStatus], lowest: ExpenseStatus):
+    assert get_lowest_status(statuses) == lowest
@@ -0,0 +1,68 @@
+"""Money handling tests."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from expenseflow.expense.money import MAX_PRICE, Money, from_cents, to_cents, to_proportion
+from expenseflow.expense.schemas import ExpenseItemCreate, ExpenseItemSplitCreate
+
+
+@pytest.mark.parametrize(
+    ("amount", "cents"),
+    [
+        (0.1, 10),
+        (12.345, 1235),
+        (1.005, 101),
+        (-1.005, -101),
+        (Decimal("19.99"), 1999),
+        (1e6, 100_000_000),
+    ],
+)
+def test_to_cents(amount: float | Decimal, cents: int):
+    assert to_cents(amount) == cents
+    assert from_cents(cents) == Decimal(cents) / 100
+
+
+@pytest.mark.parametrize("amount", [float("nan"), float("inf"), Decimal("-Infinity"), 1e30])
+def test_to_cents_rejects_unstorable_amounts(amount: float | Decimal):
+    with pytest.raises(ValueError, match="can't be stored"):
+        to_cents(amount)
+
+
+def test_to_proportion():
+    thirds = [to_proportion(1 / 3)] * 3
+
+    assert thirds[0] == Decimal("0.333333")
+    assert sum(thirds) == Decimal("0.999999")
+    assert to_proportion(1.0) == 1
+
+
+@pytest.mark.parametrize("value", [float("nan"), -0.1, 10])
+def test_to_proportion_rejects_non_proportions(value: float):
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        to_proportion(value)
+
+
+def test_money_is_sent_as_a_number():
+    adapter = TypeAdapter(Money)
+
+    assert adapter.validate_python(0.1) == Decimal("0.1")
+    assert adapter.dump_json(Decimal("0.10")) == b"0.1"
+    assert adapter.dump_python(Decimal("0.10")) == Decimal("0.10")
+
+
+def test_item_price_bounds():
+    assert to_cents(ExpenseItemCreate(name="n", quantity=1, price=-MAX_PRICE).price) == -MAX_PRICE * 100
+
+    for price in ["NaN", "Infinity", 1e30]:
+        with pytest.raises(ValidationError):
+            ExpenseItemCreate.model_validate({"name": "n", "quantity": 1, "price": price})
+
+
+def test_split_proportion_bounds():
+    for proportion in ["NaN", -0.1, 10]:
+        with pytest.raises(ValidationError):
+            ExpenseItemSplitCreate.model_validate({"user_id": uuid4(), "proportion": proportion})
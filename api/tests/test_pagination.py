@@ -0,0 +1,42 @@
+"""Pagination tests."""
+
+import base64
+import datetime as dt
+from uuid import uuid4
+
+import pytest
+
+from expenseflow.errors import InvalidCursorError
+from expenseflow.pagination import decode_cursor, encode_cursor, split_page
+
+
+def test_cursor_round_trip():
+    key = (dt.datetime.now(dt.UTC), uuid4())
+
+    assert decode_cursor(encode_cursor(key)) == key
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-a-cursor", "", base64.urlsafe_b64encode(b'["now", "id"]').decode()],
+)
+def test_invalid_cursor(cursor: str):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_split_page():
+    rows = [(dt.datetime.now(dt.UTC), uuid4()) for _ in range(3)]
+
+    page, cursor = split_page(rows, 2, key=lambda r: r)
+    assert page == rows[:2]
+    assert cursor is not None
+    assert decode_cursor(cursor) == rows[1]
+
+    page, cursor = split_page(rows, 3, key=lambda r: r)
+    assert page == rows
+    assert cursor is None
+
+    page, cursor = split_page(rows, None, key=lambda r: r)
+    assert page == rows
+    assert cursor is None
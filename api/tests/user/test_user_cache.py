@@ -0,0 +1,83 @@
+"""Test user identity cache."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from expenseflow.user.cache import (
+    IdentityCache,
+    InMemoryIdentityCache,
+    RedisIdentityCache,
+)
+from expenseflow.user.schemas import UserSnapshot
+
+
+def make_snapshot(token_id: str = "token") -> UserSnapshot:  # noqa: S107
+    user_id = uuid4()
+    return UserSnapshot(
+        user_id=user_id,
+        entity_id=user_id,
+        token_id=token_id,
+        nickname=f"nick-{token_id}",
+        first_name="First",
+        last_name="Last",
+        budget=100,
+    )
+
+
+def test_create_from_url():
+    assert isinstance(IdentityCache.create("memory://", 60, 10), InMemoryIdentityCache)
+    assert isinstance(IdentityCache.create("redis://localhost:6379/0", 60, 10), RedisIdentityCache)
+
+
+@pytest.mark.asyncio
+async def test_set_get_invalidate():
+    cache = InMemoryIdentityCache(ttl=60, max_size=10)
+    snapshot = make_snapshot()
+
+    assert await cache.get(snapshot.token_id) is None
+
+    await cache.set(snapshot)
+    assert await cache.get(snapshot.token_id) == snapshot
+
+    await cache.invalidate(snapshot.token_id)
+    assert await cache.get(snapshot.token_id) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_evicted():
+    cache = InMemoryIdentityCache(ttl=0.05, max_size=10)
+    snapshot = make_snapshot()
+
+    await cache.set(snapshot)
+    await asyncio.sleep(0.1)
+
+    assert await cache.get(snapshot.token_id) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_is_evicted():
+    cache = InMemoryIdentityCache(ttl=60, max_size=2)
+    first, second, third = (make_snapshot(t) for t in ("a", "b", "c"))
+
+    await cache.set(first)
+    await cache.set(second)
+    await cache.get(first.token_id)
+    await cache.set(third)
+
+    assert await cache.get(first.token_id) == first
+    assert await cache.get(second.token_id) is None
+    assert await cache.get(third.token_id) == third
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_is_a_miss():
+    cache = RedisIdentityCache("redis://127.0.0.1:1/0", ttl=60)
+    snapshot = make_snapshot()
+
+    await cache.set(snapshot)
+    assert await cache.get(snapshot.token_id) is None
+    await cache.invalidate(snapshot.token_id)
+    await cache.close()
@@ -42,3 +42,106 @@ async def test_create_user(
     assert new_user.nickname == user_create_internal.nickname
     assert new_user.last_name == user_create_internal.last_name
     assert new_user.first_name == user_create_internal.first_name
+
+
+@pytest.mark.asyncio()
+async def test_get_cached_user_by_token_id(
+    session: AsyncSession, user_create_internal: UserCreateInternal
+):
+    from expenseflow.user.cache import identity_cache
+    from expenseflow.user.service import create_user, get_cached_user_by_token_id
+
+    created = await create_user(session, user_create_internal)
+    assert await identity_cache.get(created.token_id) is None
+
+    found = await get_cached_user_by_token_id(session, created.token_id)
+    assert found is not None
+    assert found.user_id == created.user_id
+    assert await identity_cache.get(created.token_id) is not None
+
+    cached = await get_cached_user_by_token_id(session, created.token_id)
+    assert cached is not None
+    assert cached.user_id == created.user_id
+    assert cached.nickname == created.nickname
+
+
+@pytest.mark.asyncio()
+async def test_update_user_invalidates_cache_after_commit(
+    session: AsyncSession,
+    user_create_internal: UserCreateInternal,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from expenseflow.database.core import commit
+    from expenseflow.user.cache import identity_cache
+    from expenseflow.user.schemas import UserUpdate
+    from expenseflow.user.service import (
+        create_user,
+        get_cached_user_by_token_id,
+        update_user,
+    )
+
+    committed = False
+
+    async def fake_commit() -> None:
+        nonlocal committed
+        committed = True
+
+    # Keep the test's changes out of the database
+    monkeypatch.setattr(session, "commit", fake_commit)
+
+    created = await create_user(session, user_create_internal)
+    user = await get_cached_user_by_token_id(session, created.token_id)
+    assert user is not None
+
+    await update_user(session, user, UserUpdate(budget=user.budget + 1))
+    assert await identity_cache.get(created.token_id) is not None
+
+    await commit(session)
+    assert committed
+    assert await identity_cache.get(created.token_id) is None
+
+
+@pytest.mark.asyncio()
+async def test_update_user_failed_commit_keeps_cache(
+    session: AsyncSession,
+    user_create_internal: UserCreateInternal,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from expenseflow.database.core import commit
+    from expenseflow.user.cache import identity_cache
+    from expenseflow.user.schemas import UserUpdate
+    from expenseflow.user.service import (
+        create_user,
+        get_cached_user_by_token_id,
+        update_user,
+    )
+
+    async def failed_commit() -> None:
+        raise ConnectionError
+
+    monkeypatch.setattr(session, "commit", failed_commit)
+
+    created = await create_user(session, user_create_internal)
+    user = await get_cached_user_by_token_id(session, created.token_id)
+    assert user is not None
+
+    await update_user(session, user, UserUpdate(budget=user.budget + 1))
+    with pytest.raises(ConnectionError):
+        await commit(session)
+
+    assert await identity_cache.get(created.token_id) is not None
+
+
+@pytest.mark.asyncio()
+async def test_get_users_by_ids(
+    session: AsyncSession, user_create_internal: UserCreateInternal
+):
+    from uuid import uuid4
+
+    from expenseflow.user.service import create_user, get_users_by_ids
+
+    created = await create_user(session, user_create_internal)
+    missing_id = uuid4()
+
+    found = await get_users_by_ids(session, [created.user_id, missing_id])
+    assert found == {created.user_id: created}